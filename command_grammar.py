@@ -0,0 +1,222 @@
+"""
+Command grammar module for MUDpy SS13.
+This module compiles command specifications into one matcher per leading
+word and reports patterns that overlap or can never match.
+"""
+
+import re
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from command_spec import CommandSpec, pattern_regex
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Stands in for a parameter value when comparing patterns: no literal text
+# contains it, so only another pattern's parameter can match it
+_WILDCARD = "\ue000"
+_PARAM = re.compile(r"\{\w+\}")
+
+# (spec load order, pattern index within the spec)
+Entry = Tuple[int, int]
+
+
+def _tokens(pattern: str) -> List[Optional[str]]:
+    """Split a pattern into lowercased literal characters and None per param."""
+    tokens: List[Optional[str]] = []
+    pos = 0
+    for param in _PARAM.finditer(pattern):
+        tokens.extend(pattern[pos : param.start()].lower())
+        tokens.append(None)
+        pos = param.end()
+    tokens.extend(pattern[pos:].lower())
+    return tokens
+
+
+def _intersects(first: List[Optional[str]], second: List[Optional[str]]) -> bool:
+    """
+    Return True if some input matches both token patterns.
+
+    Each pattern is an automaton whose state is (position, inside a
+    parameter); the product of the two is searched for a common accepting
+    path.  A parameter consumes one or more arbitrary characters.
+    """
+
+    def closure(tokens, state):
+        pos, inside = state
+        return [state, (pos + 1, False)] if inside else [state]
+
+    def moves(tokens, state):
+        pos, inside = state
+        if inside:
+            return [(None, state)]
+        if pos == len(tokens):
+            return []
+        if tokens[pos] is None:
+            return [(None, (pos, True))]
+        return [(tokens[pos], (pos + 1, False))]
+
+    start = ((0, False), (0, False))
+    seen = {start}
+    stack = [start]
+    while stack:
+        a, b = stack.pop()
+        for x in closure(first, a):
+            for y in closure(second, b):
+                if x == (len(first), False) and y == (len(second), False):
+                    return True
+                for ca, na in moves(first, x):
+                    for cb, nb in moves(second, y):
+                        if ca is not None and cb is not None and ca != cb:
+                            continue
+                        pair = (na, nb)
+                        if pair not in seen:
+                            seen.add(pair)
+                            stack.append(pair)
+    return False
+
+
+@dataclass
+class Conflict:
+    """Two patterns of different commands that accept the same input.
+
+    ``kind`` is ``"shadowed"`` when the earlier pattern accepts everything
+    the later one does, so the later pattern can never match, and
+    ``"ambiguous"`` when only some inputs are taken by the earlier one.
+    """
+
+    kind: str
+    command: str
+    pattern: str
+    earlier_command: str
+    earlier_pattern: str
+
+    def __str__(self) -> str:
+        return (
+            f"{self.kind}: '{self.pattern}' ({self.command}) overlaps "
+            f"'{self.earlier_pattern}' ({self.earlier_command})"
+        )
+
+
+class CommandGrammar:
+    """
+    All command patterns compiled into a few combined regexes.
+
+    Patterns are grouped by their literal first word; patterns that open
+    with a parameter join every group.  Each group becomes a single
+    alternation with one named branch per pattern, in load order, so a
+    command is matched with one dictionary lookup and one regex call and
+    still resolves to the same spec as trying every spec in turn.
+    """
+
+    def __init__(self, specs: Sequence[CommandSpec]):
+        """
+        Compile the grammar.
+
+        Args:
+            specs: Command specifications in priority order.
+        """
+        self.specs = list(specs)
+        self.conflicts: List[Conflict] = []
+
+        by_token: Dict[str, List[Entry]] = {}
+        open_start: List[Entry] = []
+        for order, spec in enumerate(self.specs):
+            for index, token in enumerate(spec.leading_tokens):
+                if token is None:
+                    open_start.append((order, index))
+                else:
+                    by_token.setdefault(token, []).append((order, index))
+
+        # Branch names are positional, so they can be decoded from lastgroup
+        self._entries: List[Entry] = []
+        self._branch: Dict[Entry, int] = {}
+        self._groups: List[List[Tuple[str, str]]] = []
+        self._matchers: Dict[str, re.Pattern] = {}
+        for token, entries in by_token.items():
+            self._matchers[token] = self._compile(sorted(entries + open_start))
+        self._fallback = self._compile(open_start)
+
+        checked = set()
+        for entries in [sorted(e + open_start) for e in by_token.values()] + [
+            open_start
+        ]:
+            self._check(entries, checked)
+
+    # ------------------------------------------------------------------
+    def _branch_id(self, entry: Entry) -> int:
+        branch = self._branch.get(entry)
+        if branch is None:
+            branch = len(self._entries)
+            order, index = entry
+            pattern = self.specs[order].patterns[index]
+            params = [p[1:-1] for p in _PARAM.findall(pattern)]
+            self._branch[entry] = branch
+            self._entries.append(entry)
+            self._groups.append([(f"_b{branch}_{p}", p) for p in params])
+        return branch
+
+    def _compile(self, entries: List[Entry]) -> Optional[re.Pattern]:
+        if not entries:
+            return None
+        branches = []
+        for entry in entries:
+            branch = self._branch_id(entry)
+            order, index = entry
+            rx = pattern_regex(self.specs[order].patterns[index], f"_b{branch}_")
+            branches.append(f"(?P<_b{branch}>{rx})")
+        return re.compile("^(?:" + "|".join(branches) + ")$", re.IGNORECASE)
+
+    def _check(self, entries: List[Entry], checked: set) -> None:
+        """Record conflicts between patterns of different specs in a group."""
+        for i, later in enumerate(entries):
+            for earlier in entries[:i]:
+                if earlier[0] == later[0] or (earlier, later) in checked:
+                    continue
+                checked.add((earlier, later))
+                kind = self._overlap(earlier, later)
+                if kind:
+                    self.conflicts.append(
+                        Conflict(
+                            kind,
+                            self.specs[later[0]].name,
+                            self.specs[later[0]].patterns[later[1]],
+                            self.specs[earlier[0]].name,
+                            self.specs[earlier[0]].patterns[earlier[1]],
+                        )
+                    )
+
+    def _overlap(self, earlier: Entry, later: Entry) -> Optional[str]:
+        first = self.specs[earlier[0]].patterns[earlier[1]]
+        second = self.specs[later[0]].patterns[later[1]]
+        regex = self.specs[earlier[0]].regexes[earlier[1]]
+        if regex.match(_PARAM.sub(_WILDCARD, second)):
+            return "shadowed"
+        if _intersects(_tokens(first), _tokens(second)):
+            return "ambiguous"
+        return None
+
+    # ------------------------------------------------------------------
+    def match(self, text: str) -> Optional[Tuple[CommandSpec, Dict[str, str]]]:
+        """
+        Match ``text`` against the whole grammar in one regex call.
+
+        Args:
+            text: Stripped command text.
+
+        Returns:
+            The matching spec and its captured parameters, or None.
+        """
+        first = text.split(maxsplit=1)[0].lower() if text else ""
+        matcher = self._matchers.get(first, self._fallback)
+        if matcher is None:
+            return None
+        found = matcher.match(text)
+        if not found:
+            return None
+        branch = int(found.lastgroup[2:])
+        order, _index = self._entries[branch]
+        params = {param: found.group(group) for group, param in self._groups[branch]}
+        return self.specs[order], params
@@ -10,6 +10,25 @@ from typing import Dict, List, Callable, Optional, Any, Match, Set
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# A {param} placeholder once the pattern has gone through re.escape
+_ESCAPED_PARAM = re.compile(r"\\\{(\w+)\\\}")
+
+
+def pattern_regex(pattern: str, group_prefix: str = "") -> str:
+    """
+    Translate a command pattern into regular expression source.
+
+    Args:
+        pattern: Pattern text with ``{param}`` placeholders.
+        group_prefix: Prepended to every capture group name.
+
+    Returns:
+        Unanchored regex source with a lazy named group per parameter.
+    """
+    return _ESCAPED_PARAM.sub(
+        lambda m: f"(?P<{group_prefix}{m.group(1)}>.+?)", re.escape(pattern)
+    )
+
 
 class CommandSpec:
     """
@@ -52,13 +71,16 @@ class CommandSpec:
         self.item_requirements = item_requirements or []
         self.func = func
         self.regexes = []
+        # Literal first word of each pattern (lowercased), or None when the
+        # pattern opens with a parameter and could start with anything
+        self.leading_tokens: List[Optional[str]] = []
 
         # Compile patterns into regular expressions
         for pattern in patterns:
+            first = pattern.split(maxsplit=1)[0].lower() if pattern.strip() else ""
+            self.leading_tokens.append(None if "{" in first else first)
             # Convert {param} to named capture groups
-            rx = re.escape(pattern)
-            # Replace \{param\} with (?P<param>.+)
-            rx = re.sub(r"\\\{(\w+)\\\}", r"(?P<\1>.+?)", rx)
+            rx = pattern_regex(pattern)
             # Compile the regex
             self.regexes.append(re.compile("^" + rx + "$", re.IGNORECASE))
 
@@ -0,0 +1,139 @@
+"""
+Command suggestion module for MUDpy SS13.
+This module indexes command words once so typos can be answered with close
+matches and partial input can be tab-completed without scanning every
+command.
+"""
+
+from bisect import bisect_left
+from typing import Dict, FrozenSet, Iterable, List, Optional
+
+
+def _bigrams(word: str) -> FrozenSet[str]:
+    """Return the character pairs of ``word`` padded with start/end marks."""
+    padded = f"^{word}$"
+    return frozenset(padded[i : i + 2] for i in range(len(padded) - 1))
+
+
+def _distance(a: str, b: str, limit: int) -> int:
+    """
+    Edit distance counting swapped neighbouring characters as one edit.
+
+    Only the band of cells within ``limit`` of the diagonal is filled, and
+    ``limit + 1`` is returned as soon as the distance must exceed ``limit``.
+    """
+    over = limit + 1
+    before = None
+    prev = [j if j <= limit else over for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        row = [over] * (len(b) + 1)
+        if i <= limit:
+            row[0] = i
+        best = row[0]
+        char = a[i - 1]
+        for j in range(max(1, i - limit), min(len(b), i + limit) + 1):
+            # explicit comparisons: min() calls dominate this inner loop
+            cost = prev[j - 1] + (char != b[j - 1])
+            if prev[j] + 1 < cost:
+                cost = prev[j] + 1
+            if row[j - 1] + 1 < cost:
+                cost = row[j - 1] + 1
+            if (
+                before is not None
+                and j > 1
+                and char == b[j - 2]
+                and a[i - 2] == b[j - 1]
+                and before[j - 2] + 1 < cost
+            ):
+                cost = before[j - 2] + 1
+            row[j] = cost
+            if cost < best:
+                best = cost
+        if best > limit:
+            return over
+        before, prev = prev, row
+    return min(prev[-1], over)
+
+
+class SuggestionIndex:
+    """
+    Bigram index over a fixed set of command words.
+
+    Each word is split into padded character pairs and listed under every
+    pair it contains.  A lookup only scores the words that share at least
+    one pair with the input and are of similar length, ranking them by
+    edit distance relative to the longer word, and prefix completion is a
+    binary search over the sorted words.
+    """
+
+    def __init__(self, words: Iterable[str]):
+        """
+        Build the index.
+
+        Args:
+            words: Command words to suggest; case and duplicates are ignored.
+        """
+        self.words: List[str] = sorted({w.lower() for w in words if w})
+        self._sizes: List[int] = []
+        self._postings: Dict[str, List[int]] = {}
+        for i, word in enumerate(self.words):
+            grams = _bigrams(word)
+            self._sizes.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(i)
+
+    def suggest(self, word: str, n: int = 3, cutoff: float = 0.6) -> List[str]:
+        """
+        Return up to ``n`` indexed words most similar to ``word``.
+
+        Args:
+            word: The unrecognized input word.
+            n: Maximum number of suggestions.
+            cutoff: Minimum similarity between 0 and 1.
+
+        Returns:
+            Matching words, most similar first.
+        """
+        word = word.lower()
+        shared: Dict[int, int] = {}
+        for gram in _bigrams(word):
+            for i in self._postings.get(gram, ()):
+                shared[i] = shared.get(i, 0) + 1
+
+        scored = []
+        for i, count in shared.items():
+            candidate = self.words[i]
+            longest = max(len(word), len(candidate))
+            limit = int(longest * (1.0 - cutoff) + 1e-9)
+            # both the length difference and the candidate's missing pairs
+            # (an edit removes at most three) bound the distance from below
+            if abs(len(word) - len(candidate)) > limit:
+                continue
+            if self._sizes[i] - count > 3 * limit:
+                continue
+            edits = _distance(word, candidate, limit)
+            score = 1.0 - edits / longest
+            if edits <= limit:
+                scored.append((-score, -count, candidate))
+        scored.sort()
+        return [w for _score, _count, w in scored[:n]]
+
+    def complete(self, prefix: str, n: Optional[int] = None) -> List[str]:
+        """
+        Return indexed words starting with ``prefix`` in alphabetical order.
+
+        Args:
+            prefix: Partial input word.
+            n: Maximum number of completions; all if None.
+
+        Returns:
+            Matching words.
+        """
+        prefix = prefix.lower()
+        start = bisect_left(self.words, prefix)
+        matches = []
+        for word in self.words[start:]:
+            if not word.startswith(prefix) or (n is not None and len(matches) >= n):
+                break
+            matches.append(word)
+        return matches
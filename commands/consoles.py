@@ -23,10 +23,14 @@ def engconsole_handler(client_id: str, action: str = "power", target: str = None
             lines.append(f"{grid.grid_id}: {grid.current_load:.0f}/{grid.capacity:.0f}% {state}")
         return "Power Grids:\n" + "\n".join(lines)
     if action == "usage":
-        grid_id = target or next(iter(ps.grids)) if ps.grids else None
+        parts = (target or "").split()
+        grid_id = parts[0] if parts else next(iter(ps.grids)) if ps.grids else None
         if not grid_id:
             return "No power grids defined."
-        graph = ps.get_usage_graph(grid_id)
+        resolution = parts[1].lower() if len(parts) > 1 else "tick"
+        if resolution not in ps.telemetry.sizes:
+            return "Usage: engconsole usage <grid> [tick|minute|round]"
+        graph = ps.get_usage_graph(grid_id, resolution=resolution)
         return f"Usage for {grid_id}:\n{graph}"
     if action in {"atmos", "atmosphere"}:
         room = target
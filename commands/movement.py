@@ -7,10 +7,13 @@ import logging
 from typing import Optional, Dict, Any
 from engine import register
 from world import get_world
+from pathfinding import get_hierarchical_pathfinder
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+DIRECTIONS = ["north", "south", "east", "west", "up", "down"]
+
 
 @register("move")
 def move_handler(client_id: str, direction: Optional[str] = None, **kwargs) -> str:
@@ -54,7 +57,7 @@ def move_handler(client_id: str, direction: Optional[str] = None, **kwargs) -> s
         direction = "down"
 
     # Check if the direction is valid
-    if direction not in ["north", "south", "east", "west", "up", "down"]:
+    if direction not in DIRECTIONS:
         return f"'{direction}' is not a valid direction."
 
     # Get current location
@@ -154,6 +157,10 @@ def sprint_handler(client_id: str, direction: str, **kwargs) -> str:
     elif direction == "d":
         direction = "down"
 
+    # Sprinting toward a named room follows the fastest route
+    if direction not in DIRECTIONS:
+        return _sprint_toward(client_id, direction, **kwargs)
+
     # Move once
     result = move_handler(client_id, direction, **kwargs)
 
@@ -180,3 +187,47 @@ def sprint_handler(client_id: str, direction: str, **kwargs) -> str:
             return f"You sprint {direction} but come to a stop.\n\n{result}"
 
     return result
+
+
+def _sprint_toward(client_id: str, target: str, **kwargs) -> str:
+    """Sprint up to two rooms along the route to ``target``."""
+    interface = kwargs["interface"]
+    world = get_world()
+    target_id = target if target in world.rooms else None
+    if target_id is None:
+        for room_id, room in world.rooms.items():
+            if room.name.lower() == target:
+                target_id = room_id
+                break
+    if target_id is None:
+        return f"'{target}' is not a valid direction."
+
+    current_location = interface.get_player_location(client_id)
+    route = get_hierarchical_pathfinder().find_path(current_location, target_id)
+    if len(route) < 2:
+        return "You can't find a way there from here."
+
+    name = world.rooms[target_id].name
+    result = ""
+    for steps, next_room in enumerate(route[1:3]):
+        location = interface.get_player_location(client_id)
+        exits = interface.get_exits_from_room(location)
+        step_direction = next(
+            (d for d, dest in exits.items() if dest == next_room), None
+        )
+        if step_direction is None:
+            break
+        moved = move_handler(client_id, step_direction, **kwargs)
+        if interface.get_player_location(client_id) == location:
+            # The step failed; report why unless the first one got through
+            if not steps:
+                return moved
+            return f"You sprint toward {name} but come to a stop.\n\n{result}"
+        # Consume extra energy for the second room
+        if steps and hasattr(interface, "modify_player_stat"):
+            interface.modify_player_stat(client_id, "energy", -5)
+        result = moved
+
+    if not result:
+        return "You can't find a way there from here."
+    return f"You sprint toward {name}!\n\n{result}"
@@ -3,14 +3,16 @@ NPC component for MUDpy SS13.
 Represents a non-player character with a role and optional dialogue.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import TYPE_CHECKING, List, Optional, Dict, Any
 import random
 from events import publish, subscribe
 
-from pathfinding import find_path
-from world import get_world
+from pathfinding import get_routing_table
 import logging
 
+if TYPE_CHECKING:
+    from pathfinding import FlowField
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,7 +34,6 @@ class NPCComponent:
         self.event_dialogue = event_dialogue or {}
         self.pending_lines: List[str] = []
         self.goal: Optional[str] = None
-        self.path: List[str] = []
 
     def on_added(self) -> None:
         """Subscribe to relevant events when added to the world."""
@@ -95,33 +96,30 @@ class NPCComponent:
         """Set a target room for the NPC."""
 
         self.goal = room_id
-        self.path.clear()
 
     # ------------------------------------------------------------------
-    def compute_path(self) -> None:
-        """Compute a path toward the current goal."""
+    def next_routine_goal(self) -> None:
+        """Pick the next routine room as the goal when the NPC is idle."""
 
-        if not self.goal or not self.owner or not self.owner.location:
-            self.path = []
-            return
-        world = get_world()
-        self.path = find_path(world, self.owner.location, self.goal)
-        if self.path and self.path[0] == self.owner.location:
-            self.path = self.path[1:]
+        if not self.goal and self.routine:
+            self.set_goal(self.routine[self._routine_index])
+            self._routine_index = (self._routine_index + 1) % len(self.routine)
 
     # ------------------------------------------------------------------
-    def step(self) -> None:
-        """Move one step along the computed path if available."""
+    def step(self, flow: Optional["FlowField"] = None) -> None:
+        """Move one step toward the current goal using the routing table.
 
-        if not self.path and self.goal:
-            self.compute_path()
-        if not self.path and not self.goal and self.routine:
-            self.set_goal(self.routine[self._routine_index])
-            self._routine_index = (self._routine_index + 1) % len(self.routine)
-            self.compute_path()
-        if self.path:
-            next_room = self.path.pop(0)
-            self.owner.move_to(next_room)
-            if not self.path:
+        ``flow`` may be a shared flow field toward the goal so that many NPCs
+        heading to the same room reuse a single distance field.
+        """
+
+        self.next_routine_goal()
+        if self.goal and self.owner and self.owner.location:
+            next_room = get_routing_table().next_hop(
+                self.owner.location, self.goal, flow
+            )
+            if next_room:
+                self.owner.move_to(next_room)
+            if self.owner.location == self.goal:
                 self.goal = None
         self.maybe_chat()
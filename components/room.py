@@ -5,6 +5,7 @@ Represents a location in the game world.
 
 from typing import Dict, List, Optional, Any
 import logging
+from events import publish
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +21,7 @@ class RoomComponent:
         atmosphere: Optional[Dict[str, float]] = None,
         hazards: Optional[List[str]] = None,
         is_airlock: bool = False,
+        zone: Optional[str] = None,
     ):
         """
         Initialize the room component.
@@ -29,6 +31,8 @@ class RoomComponent:
             atmosphere (Dict[str, float], optional): Atmospheric conditions.
             hazards (List[str], optional): List of hazards in the room.
             is_airlock (bool): Whether this room is an airlock.
+            zone (str, optional): Department or zone used to cluster rooms
+                for long-range pathfinding.
         """
         self.owner = None
         self.exits = exits or {}
@@ -40,6 +44,7 @@ class RoomComponent:
         }
         self.hazards = hazards or []
         self.is_airlock = is_airlock
+        self.zone = zone
 
     def get_exit(self, direction: str) -> Optional[str]:
         """
@@ -65,6 +70,13 @@ class RoomComponent:
         logger.debug(
             f"Added exit from {self.owner.id} to {room_id} in direction {direction}"
         )
+        publish(
+            "room_exits_changed",
+            room_id=self.owner.id,
+            direction=direction.lower(),
+            destination=room_id,
+            added=True,
+        )
 
     def remove_exit(self, direction: str) -> bool:
         """
@@ -77,8 +89,15 @@ class RoomComponent:
             bool: True if the exit was removed, False if it didn't exist.
         """
         if direction.lower() in self.exits:
-            del self.exits[direction.lower()]
+            destination = self.exits.pop(direction.lower())
             logger.debug(f"Removed exit from {self.owner.id} in direction {direction}")
+            publish(
+                "room_exits_changed",
+                room_id=self.owner.id,
+                direction=direction.lower(),
+                destination=destination,
+                added=False,
+            )
             return True
         return False
 
@@ -112,6 +131,12 @@ class RoomComponent:
         if hazard not in self.hazards:
             self.hazards.append(hazard)
             logger.debug(f"Added hazard {hazard} to {self.owner.id}")
+            publish(
+                "room_hazards_changed",
+                room_id=self.owner.id,
+                hazard=hazard,
+                added=True,
+            )
 
     def remove_hazard(self, hazard: str) -> bool:
         """
@@ -126,6 +151,12 @@ class RoomComponent:
         if hazard in self.hazards:
             self.hazards.remove(hazard)
             logger.debug(f"Removed hazard {hazard} from {self.owner.id}")
+            publish(
+                "room_hazards_changed",
+                room_id=self.owner.id,
+                hazard=hazard,
+                added=False,
+            )
             return True
         return False
 
@@ -138,7 +169,8 @@ class RoomComponent:
         """
         return {
             "exits": self.exits,
-            "atmosphere": self.atmosphere,
+            "atmosphere": dict(self.atmosphere),
             "hazards": self.hazards,
             "is_airlock": self.is_airlock,
+            "zone": self.zone,
         }
@@ -91,6 +91,8 @@ def build_map_payload():
     door_states = {}
     hazards = {}
     power = {}
+    power_load = {}
+    power_usage = {}
 
     for room_id, (x, y) in positions.items():
         room_obj = world.get_object(room_id)
@@ -107,8 +109,13 @@ def build_map_payload():
     # Power states
     ps = get_power_system()
     for grid in ps.grids.values():
+        load = ps.get_grid_load(grid.grid_id)
+        power_usage[grid.grid_id] = ps.telemetry.history(
+            grid.grid_id, "minute", 30, "load"
+        ).tolist()
         for r in grid.rooms:
             power[r] = grid.is_powered
+            power_load[r] = load
 
     return {
         "type": "map",
@@ -116,6 +123,8 @@ def build_map_payload():
         "doors": door_states,
         "hazards": hazards,
         "power": power,
+        "power_load": power_load,
+        "power_usage": power_usage,
     }
 
 
@@ -160,7 +169,10 @@ def _register_event_handlers():
             )
         )
 
-    def room_power_change(room_id: str, powered: bool, **_):
+    def room_power_change(room_id: str, powered: bool, was_powered=None, **_):
+        if was_powered == powered:
+            # only the load band moved; that travels in power_delta
+            return
         name = mud_integration.get_room_name(room_id) or room_id
         msg = (
             f"The lights flicker back on in {name}."
@@ -171,6 +183,11 @@ def _register_event_handlers():
             broadcast_to_clients({"type": "broadcast", "message": msg})
         )
 
+    def power_delta(grids: dict, rooms: dict, **_):
+        asyncio.create_task(
+            broadcast_to_clients({"type": "power_delta", "grids": grids, "rooms": rooms})
+        )
+
     def hazard_added(room_id: str, hazard: str, **_):
         name = mud_integration.get_room_name(room_id) or room_id
         h = hazard.replace("_", " ")
@@ -201,6 +218,7 @@ def _register_event_handlers():
     subscribe("atmos_updated", atmos_update)
     subscribe("power_status_update", power_update)
     subscribe("room_power_changed", room_power_change)
+    subscribe("power_delta", power_delta)
     subscribe("room_hazard_added", hazard_added)
     subscribe("room_hazard_removed", hazard_removed)
     subscribe("hazard_warning", hazard_warning)
@@ -311,6 +329,15 @@ async def handle_client(websocket):
                                 json.dumps({"type": "inventory", "inventory": inv})
                             )
                             continue
+                        if data.get("type") == "complete_request":
+                            prefix = data.get("prefix", "")
+                            matches = engine.command_parser.complete(prefix, 20)
+                            await websocket.send_str(
+                                json.dumps(
+                                    {"type": "completions", "prefix": prefix, "matches": matches}
+                                )
+                            )
+                            continue
                         if data.get("type") == "object_request":
                             obj = mud_integration.get_object_data(data.get("object_id", ""))
                             await websocket.send_str(
@@ -6,10 +6,11 @@ This module loads command specifications and handles command dispatching.
 import os
 import yaml
 import logging
-import difflib
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple
 
+from command_grammar import CommandGrammar
 from command_spec import CommandSpec
+from command_suggestions import SuggestionIndex
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -33,6 +34,10 @@ class CommandParser:
         self.commands_file = commands_file
         self.command_specs = []
         self.command_handlers = {}
+        self.grammar = CommandGrammar([])
+        self.name_index = SuggestionIndex([])
+        self.word_index = SuggestionIndex([])
+        self._indexed: Tuple[int, int] = (id(self.command_specs), 0)
 
         logger.info(f"Initializing command parser with {commands_file}")
 
@@ -81,10 +86,48 @@ class CommandParser:
                 )
                 self.command_specs.append(spec)
 
+            self.build_index()
             logger.info(f"Loaded {len(self.command_specs)} command specifications")
         except Exception as e:
             logger.error(f"Error loading commands: {e}")
 
+    def build_index(self) -> None:
+        """Compile ``command_specs`` into a grammar and suggestion indexes."""
+        self.grammar = CommandGrammar(self.command_specs)
+        names = [spec.name for spec in self.command_specs]
+        self.name_index = SuggestionIndex(names)
+        # Names plus the literal words patterns open with, e.g. "examine"
+        words = [t for spec in self.command_specs for t in spec.leading_tokens if t]
+        self.word_index = SuggestionIndex(names + words)
+        self._indexed = (id(self.command_specs), len(self.command_specs))
+        for conflict in self.grammar.conflicts:
+            if conflict.kind == "shadowed":
+                logger.warning(f"Command pattern {conflict}")
+            else:
+                logger.debug(f"Command pattern {conflict}")
+
+    def _ensure_index(self) -> None:
+        if self._indexed != (id(self.command_specs), len(self.command_specs)):
+            self.build_index()
+
+    def _current_grammar(self) -> CommandGrammar:
+        self._ensure_index()
+        return self.grammar
+
+    def complete(self, prefix: str, n: Optional[int] = None) -> List[str]:
+        """
+        Return command words starting with ``prefix``, for tab completion.
+
+        Args:
+            prefix: Partial first word of a command.
+            n: Maximum number of completions; all if None.
+
+        Returns:
+            Matching command words in alphabetical order.
+        """
+        self._ensure_index()
+        return self.word_index.complete(prefix.strip(), n)
+
     def get_command_names(self) -> List[str]:
         """
         Get a list of all command names.
@@ -166,9 +209,8 @@ class CommandParser:
                     return help_text
 
             # Try to find close matches if exact match not found
-            close_matches = difflib.get_close_matches(
-                command_name, self.get_command_names(), n=3
-            )
+            self._ensure_index()
+            close_matches = self.name_index.suggest(command_name, n=3)
             if close_matches:
                 return f"Unknown command '{command_name}'. Did you mean: {', '.join(close_matches)}?"
             else:
@@ -226,27 +268,24 @@ class CommandParser:
             command_name = text[5:].strip()
             return self.get_help(command_name)
 
-        # Try to match the command against all specs
-        for spec in self.command_specs:
-            params = spec.match(text)
-            if params is not None:
-                # Command matched
-                logger.debug(f"Command '{text}' matched to '{spec.name}'")
+        # Match the command against the compiled grammar
+        matched = self._current_grammar().match(text)
+        if matched is not None:
+            spec, params = matched
+            logger.debug(f"Command '{text}' matched to '{spec.name}'")
 
-                # Add context to params
-                params.update(context)
+            # Add context to params
+            params.update(context)
 
-                # Execute the command
-                if spec.func:
-                    return spec.execute(**params)
-                else:
-                    return f"Command '{spec.name}' is not implemented yet."
+            # Execute the command
+            if spec.func:
+                return spec.execute(**params)
+            else:
+                return f"Command '{spec.name}' is not implemented yet."
 
         # No match found, try to suggest similar commands
         first_word = text.split()[0].lower()
-        close_matches = difflib.get_close_matches(
-            first_word, self.get_command_names(), n=3
-        )
+        close_matches = self.word_index.suggest(first_word, n=3)
 
         if close_matches:
             return f"Unknown command '{first_word}'. Did you mean: {', '.join(close_matches)}?"
@@ -2,10 +2,41 @@ from __future__ import annotations
 
 """Simple pathfinding helpers."""
 
+import logging
+import heapq
 from collections import deque
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
-from world import World
+from events import subscribe
+from world import World, get_world
+
+logger = logging.getLogger(__name__)
+
+# Events that change whether a door lets NPCs through
+DOOR_EVENTS = (
+    "door_opened",
+    "door_closed",
+    "door_locked",
+    "door_unlocked",
+    "door_hacked",
+    "door_emergency_lockdown",
+)
+
+
+def edge_is_open(world: World, src: str, dest: str) -> bool:
+    """Return ``True`` if movement from ``src`` to ``dest`` is not blocked.
+
+    A door component on ``src`` whose destination is ``dest`` blocks the
+    exit while it is locked or closed.
+    """
+    room = world.get_object(src)
+    if not room:
+        return False
+    door = room.get_component("door")
+    if door and door.destination == dest and (door.is_locked or not door.is_open):
+        return False
+    return True
 
 
 def find_path(world: World, start: str, goal: str) -> List[str]:
@@ -33,14 +64,502 @@ def find_path(world: World, start: str, goal: str) -> List[str]:
             continue
         for _dir, dest in room_comp.exits.items():
             # check for a door blocking this exit
-            door = room.get_component("door")
-            if (
-                door
-                and door.destination == dest
-                and (door.is_locked or not door.is_open)
-            ):
+            if not edge_is_open(world, current, dest):
                 continue
             if dest not in visited:
                 visited.add(dest)
                 queue.append(path + [dest])
     return []
+
+
+@dataclass
+class FlowField:
+    """Distance field toward a single goal room.
+
+    ``next_hop`` maps every room that can reach ``goal`` to the neighbour one
+    step closer, so any number of agents heading to the same room share one
+    field.  ``valid`` is cleared once the routing table drops the field.
+    """
+
+    goal: str
+    next_hop: Dict[str, str] = field(default_factory=dict)
+    dist: Dict[str, int] = field(default_factory=dict)
+    valid: bool = True
+
+    def next_step(self, room_id: str) -> Optional[str]:
+        """Return the neighbour of ``room_id`` one step closer to the goal."""
+
+        return self.next_hop.get(room_id)
+
+    def distance(self, room_id: str) -> Optional[int]:
+        """Return the hop count from ``room_id`` to the goal if reachable."""
+
+        return self.dist.get(room_id)
+
+
+class RoutingTable:
+    """Cache of per-destination flow fields over the room exit graph.
+
+    Fields are built lazily with a reverse BFS the first time a destination
+    is requested.  Each field stores the next hop and hop distance for every
+    room that can reach the destination, so an NPC step is a dict lookup.
+    Door and exit events only discard the fields whose routes they affect.
+    """
+
+    def __init__(self, world: Optional[World] = None) -> None:
+        self._world = world
+        self._bound_world: Optional[World] = None
+        self._reverse: Optional[Dict[str, List[str]]] = None
+        self._fields: Dict[str, FlowField] = {}
+        self.version = 0
+
+        for evt in DOOR_EVENTS:
+            subscribe(evt, self._on_door_event)
+        subscribe("room_exits_changed", self._on_exits_changed)
+        subscribe("object_created", self._on_object_changed)
+        subscribe("object_destroyed", self._on_object_changed)
+
+    # ------------------------------------------------------------------
+    def _get_world(self) -> World:
+        world = self._world or get_world()
+        if world is not self._bound_world:
+            # the global world was swapped out (e.g. between tests)
+            self._bound_world = world
+            self.clear()
+        return world
+
+    # ------------------------------------------------------------------
+    def clear(self) -> None:
+        """Drop every cached field and the reverse exit graph."""
+
+        self._reverse = None
+        for flow in self._fields.values():
+            flow.valid = False
+        self._fields.clear()
+        self.version += 1
+
+    # ------------------------------------------------------------------
+    def _reverse_graph(self) -> Dict[str, List[str]]:
+        if self._reverse is None:
+            reverse: Dict[str, List[str]] = {}
+            for room_id, room in self._get_world().rooms.items():
+                room_comp = room.get_component("room")
+                if not room_comp:
+                    continue
+                for dest in room_comp.exits.values():
+                    reverse.setdefault(dest, []).append(room_id)
+            self._reverse = reverse
+        return self._reverse
+
+    # ------------------------------------------------------------------
+    def _build(self, goal: str) -> FlowField:
+        world = self._get_world()
+        reverse = self._reverse_graph()
+        flow = FlowField(goal=goal, dist={goal: 0})
+        dist = flow.dist
+        queue: deque[str] = deque([goal])
+        while queue:
+            current = queue.popleft()
+            for src in reverse.get(current, ()):
+                if src in dist or not edge_is_open(world, src, current):
+                    continue
+                dist[src] = dist[current] + 1
+                flow.next_hop[src] = current
+                queue.append(src)
+        self._fields[goal] = flow
+        return flow
+
+    # ------------------------------------------------------------------
+    def flow_field(self, goal: str) -> FlowField:
+        """Return the cached flow field toward ``goal``, building it if needed."""
+
+        self._get_world()
+        flow = self._fields.get(goal)
+        if flow is None:
+            flow = self._build(goal)
+        return flow
+
+    # ------------------------------------------------------------------
+    def next_hop(
+        self, start: str, goal: str, flow: Optional[FlowField] = None
+    ) -> Optional[str]:
+        """Return the room to move to from ``start`` toward ``goal``.
+
+        ``None`` is returned when ``start`` is the goal or no route exists.
+        Callers stepping many agents may pass a ``flow`` field they already
+        hold; it is replaced if it has gone stale.  A cached hop whose door
+        has since been shut is detected here and the affected fields are
+        rebuilt.
+        """
+        if start == goal:
+            return None
+        if flow is None or not flow.valid or flow.goal != goal:
+            flow = self.flow_field(goal)
+        hop = flow.next_step(start)
+        if hop is not None and not edge_is_open(self._get_world(), start, hop):
+            self.invalidate_edge(start, hop)
+            hop = self.flow_field(goal).next_step(start)
+        return hop
+
+    # ------------------------------------------------------------------
+    def path(self, start: str, goal: str) -> List[str]:
+        """Return the full route as a list of room IDs like :func:`find_path`."""
+
+        if start == goal:
+            return [start]
+        route = [start]
+        current = start
+        while current != goal:
+            current = self.next_hop(current, goal)
+            if current is None:
+                return []
+            route.append(current)
+        return route
+
+    # ------------------------------------------------------------------
+    def distance(self, start: str, goal: str) -> Optional[int]:
+        """Return the number of hops from ``start`` to ``goal`` if reachable."""
+
+        return self.flow_field(goal).distance(start)
+
+    # ------------------------------------------------------------------
+    def invalidate_edge(
+        self, src: str, dest: str, is_open: Optional[bool] = None
+    ) -> int:
+        """Discard cached fields whose routes depend on the ``src -> dest`` exit.
+
+        A blocked edge only matters to fields that route through it.  A newly
+        opened edge only matters to fields where it offers a shorter route.
+        ``is_open`` defaults to the current door state of the exit.  Returns
+        the number of fields dropped.
+        """
+        if is_open is None:
+            is_open = edge_is_open(self._get_world(), src, dest)
+        stale = []
+        for goal, flow in self._fields.items():
+            if is_open:
+                dist = flow.dist
+                if dest in dist and dist[dest] + 1 < dist.get(src, float("inf")):
+                    stale.append(goal)
+            elif flow.next_hop.get(src) == dest:
+                stale.append(goal)
+        for goal in stale:
+            self._fields.pop(goal).valid = False
+        if stale:
+            self.version += 1
+        return len(stale)
+
+    # ------------------------------------------------------------------
+    def _on_door_event(self, door_id: str, **_: object) -> None:
+        obj = self._get_world().get_object(door_id)
+        door = obj.get_component("door") if obj else None
+        if door and door.destination:
+            self.invalidate_edge(door_id, door.destination)
+
+    def _on_exits_changed(
+        self, room_id: str, destination: str, added: bool, **_: object
+    ) -> None:
+        self._reverse = None
+        is_open = added and edge_is_open(self._get_world(), room_id, destination)
+        self.invalidate_edge(room_id, destination, is_open=is_open)
+
+    def _on_object_changed(self, object_id: str, **_: object) -> None:
+        world = self._get_world()
+        obj = world.get_object(object_id)
+        if obj is not None and not obj.get_component("room"):
+            return
+        if obj is None and self._reverse is not None:
+            known = object_id in self._reverse or any(
+                object_id in flow.dist for flow in self._fields.values()
+            )
+            if not known:
+                return
+        self.clear()
+
+
+class HierarchicalPathfinder:
+    """Two-level pathfinder that plans across zones before refining rooms.
+
+    Rooms are grouped by ``RoomComponent.zone``; rooms without a zone are
+    clustered automatically into groups of up to ``cluster_size``.  Rooms
+    with exits crossing a zone boundary become portals.  Portal-to-portal
+    legs inside each zone are precomputed, so a cross-station route is a
+    small search over portals plus two local searches at the ends.  Door
+    events only rebuild the zone that owns the door.
+    """
+
+    def __init__(self, world: Optional[World] = None, cluster_size: int = 16) -> None:
+        self._world = world
+        self._bound_world: Optional[World] = None
+        self.cluster_size = cluster_size
+        self.zone_of: Dict[str, str] = {}
+        self.zones: Dict[str, Set[str]] = {}
+        self._reverse: Dict[str, List[str]] = {}
+        self._portals: Dict[str, Set[str]] = {}
+        self._links: Dict[str, Dict[str, int]] = {}
+        self._parents: Dict[str, Dict[str, str]] = {}
+        self._dirty: Set[str] = set()
+        self._built = False
+        self.rebuilds = 0
+
+        for evt in DOOR_EVENTS:
+            subscribe(evt, self._on_door_event)
+        subscribe("room_exits_changed", self._on_exits_changed)
+        subscribe("object_created", self._on_object_changed)
+        subscribe("object_destroyed", self._on_object_changed)
+
+    # ------------------------------------------------------------------
+    def _get_world(self) -> World:
+        world = self._world or get_world()
+        if world is not self._bound_world:
+            self._bound_world = world
+            self._built = False
+        return world
+
+    # ------------------------------------------------------------------
+    def _exits(self, room_id: str) -> Iterable[str]:
+        room = self._get_world().rooms.get(room_id)
+        room_comp = room.get_component("room") if room else None
+        return room_comp.exits.values() if room_comp else ()
+
+    # ------------------------------------------------------------------
+    def _assign_zones(self) -> None:
+        world = self._get_world()
+        self.zone_of.clear()
+        self.zones.clear()
+        self._reverse.clear()
+        for room_id, room in world.rooms.items():
+            room_comp = room.get_component("room")
+            if not room_comp:
+                continue
+            for dest in room_comp.exits.values():
+                self._reverse.setdefault(dest, []).append(room_id)
+            if room_comp.zone:
+                self.zone_of[room_id] = room_comp.zone
+
+        # cluster rooms without an explicit zone by breadth-first growth
+        count = 0
+        for room_id in world.rooms:
+            if room_id in self.zone_of:
+                continue
+            zone = f"cluster_{count}"
+            count += 1
+            queue: deque[str] = deque([room_id])
+            members = 0
+            while queue and members < self.cluster_size:
+                current = queue.popleft()
+                if current in self.zone_of or current not in world.rooms:
+                    continue
+                self.zone_of[current] = zone
+                members += 1
+                queue.extend(self._exits(current))
+                queue.extend(self._reverse.get(current, ()))
+
+        for room_id, zone in self.zone_of.items():
+            self.zones.setdefault(zone, set()).add(room_id)
+
+    # ------------------------------------------------------------------
+    def _local_bfs(
+        self, origin: str, zone: str, reverse: bool = False
+    ) -> Tuple[Dict[str, int], Dict[str, str]]:
+        """Breadth-first search from ``origin`` that never leaves ``zone``.
+
+        With ``reverse`` the search follows exits backwards, giving the
+        distance from every room to ``origin``.
+        """
+        world = self._get_world()
+        members = self.zones.get(zone, set())
+        dist = {origin: 0}
+        parent: Dict[str, str] = {}
+        queue: deque[str] = deque([origin])
+        while queue:
+            current = queue.popleft()
+            if reverse:
+                steps = [(src, src, current) for src in self._reverse.get(current, ())]
+            else:
+                steps = [(dest, current, dest) for dest in self._exits(current)]
+            for nxt, src, dest in steps:
+                if nxt in dist or nxt not in members:
+                    continue
+                if not edge_is_open(world, src, dest):
+                    continue
+                dist[nxt] = dist[current] + 1
+                parent[nxt] = current
+                queue.append(nxt)
+        return dist, parent
+
+    # ------------------------------------------------------------------
+    def _build_zone(self, zone: str) -> None:
+        world = self._get_world()
+        members = self.zones.get(zone, set())
+        for portal in self._portals.get(zone, ()):
+            self._links.pop(portal, None)
+            self._parents.pop(portal, None)
+
+        portals: Set[str] = set()
+        for room_id in members:
+            if any(
+                self.zone_of.get(d) not in (zone, None) for d in self._exits(room_id)
+            ):
+                portals.add(room_id)
+            elif any(
+                self.zone_of.get(s) not in (zone, None)
+                for s in self._reverse.get(room_id, ())
+            ):
+                portals.add(room_id)
+        self._portals[zone] = portals
+
+        for portal in portals:
+            dist, parent = self._local_bfs(portal, zone)
+            links = {q: dist[q] for q in portals if q != portal and q in dist}
+            for dest in self._exits(portal):
+                other = self.zone_of.get(dest)
+                if other not in (zone, None) and edge_is_open(world, portal, dest):
+                    links[dest] = 1
+            self._links[portal] = links
+            self._parents[portal] = parent
+        self.rebuilds += 1
+
+    # ------------------------------------------------------------------
+    def _ensure(self) -> None:
+        self._get_world()
+        if not self._built:
+            self._assign_zones()
+            self._portals.clear()
+            self._links.clear()
+            self._parents.clear()
+            self._dirty = set(self.zones)
+            self._built = True
+        for zone in list(self._dirty):
+            self._build_zone(zone)
+        self._dirty.clear()
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _unwind(parent: Dict[str, str], origin: str, end: str) -> List[str]:
+        leg = [end]
+        while leg[-1] != origin:
+            leg.append(parent[leg[-1]])
+        leg.reverse()
+        return leg
+
+    # ------------------------------------------------------------------
+    def find_path(self, start: str, goal: str) -> List[str]:
+        """Return a list of room IDs from ``start`` to ``goal``.
+
+        Behaves like :func:`find_path`, returning an empty list when the goal
+        cannot be reached.
+        """
+        self._ensure()
+        if start == goal:
+            return [start]
+        start_zone = self.zone_of.get(start)
+        goal_zone = self.zone_of.get(goal)
+        if start_zone is None or goal_zone is None:
+            return []
+
+        out_dist, out_parent = self._local_bfs(start, start_zone)
+        if start_zone == goal_zone and goal in out_dist:
+            return self._unwind(out_parent, start, goal)
+        in_dist, in_parent = self._local_bfs(goal, goal_zone, reverse=True)
+
+        # Dijkstra over portals, with the goal as a virtual final node
+        best: Dict[str, int] = {}
+        prev: Dict[str, Optional[str]] = {}
+        heap: List[Tuple[int, int, str, Optional[str]]] = []
+        seq = 0
+        for portal in self._portals.get(start_zone, ()):
+            if portal in out_dist:
+                heap.append((out_dist[portal], seq, portal, None))
+                seq += 1
+        heapq.heapify(heap)
+        target = "\0goal"
+        goal_prev: Optional[str] = None
+        while heap:
+            cost, _, node, came_from = heapq.heappop(heap)
+            if node in best:
+                continue
+            best[node] = cost
+            prev[node] = came_from
+            if node == target:
+                goal_prev = came_from
+                break
+            if self.zone_of.get(node) == goal_zone and node in in_dist:
+                heapq.heappush(heap, (cost + in_dist[node], seq, target, node))
+                seq += 1
+            for nxt, weight in self._links.get(node, {}).items():
+                if nxt not in best:
+                    heapq.heappush(heap, (cost + weight, seq, nxt, node))
+                    seq += 1
+        if target not in best:
+            return []
+
+        portals: List[str] = []
+        node = goal_prev
+        while node is not None:
+            portals.append(node)
+            node = prev[node]
+        portals.reverse()
+
+        route = self._unwind(out_parent, start, portals[0])
+        for a, b in zip(portals, portals[1:]):
+            if self.zone_of[a] == self.zone_of[b]:
+                route.extend(self._unwind(self._parents[a], a, b)[1:])
+            else:
+                route.append(b)
+        node = portals[-1]
+        while node != goal:
+            node = in_parent[node]
+            route.append(node)
+        return route
+
+    # ------------------------------------------------------------------
+    def _on_door_event(self, door_id: str, **_: object) -> None:
+        zone = self.zone_of.get(door_id)
+        if zone is not None:
+            self._dirty.add(zone)
+
+    def _on_exits_changed(
+        self, room_id: str, destination: str, added: bool, **_: object
+    ) -> None:
+        if destination not in self.zone_of or room_id not in self.zone_of:
+            self._built = False
+            return
+        sources = self._reverse.setdefault(destination, [])
+        if added:
+            sources.append(room_id)
+        elif room_id in sources:
+            sources.remove(room_id)
+        self._dirty.add(self.zone_of[room_id])
+        self._dirty.add(self.zone_of[destination])
+
+    def _on_object_changed(self, object_id: str, **_: object) -> None:
+        obj = self._get_world().get_object(object_id)
+        if obj is not None and obj.get_component("room"):
+            self._built = False
+        elif obj is None and object_id in self.zone_of:
+            self._built = False
+
+
+_ROUTING_TABLE: Optional[RoutingTable] = None
+
+
+def get_routing_table() -> RoutingTable:
+    """Return the shared routing table, creating it on first use."""
+
+    global _ROUTING_TABLE
+    if _ROUTING_TABLE is None:
+        _ROUTING_TABLE = RoutingTable()
+    return _ROUTING_TABLE
+
+
+_HIERARCHICAL_PATHFINDER: Optional[HierarchicalPathfinder] = None
+
+
+def get_hierarchical_pathfinder() -> HierarchicalPathfinder:
+    """Return the shared hierarchical pathfinder, creating it on first use."""
+
+    global _HIERARCHICAL_PATHFINDER
+    if _HIERARCHICAL_PATHFINDER is None:
+        _HIERARCHICAL_PATHFINDER = HierarchicalPathfinder()
+    return _HIERARCHICAL_PATHFINDER
@@ -51,6 +51,7 @@ def load_rooms(path: str, world) -> int:
                         atmosphere=rc.get("atmosphere", {}),
                         hazards=rc.get("hazards", []),
                         is_airlock=rc.get("is_airlock", False),
+                        zone=rc.get("zone"),
                     )
                     room_obj.add_component("room", room_comp)
                 if "door" in comps:
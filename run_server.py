@@ -22,6 +22,7 @@ from systems import (
     get_security_system,
     get_genetics_system,
     get_disease_system,
+    get_physics_system,
     get_round_manager,
 )
 from system_loops import run_update_loop, run_forever_loop
@@ -101,6 +102,7 @@ async def main():
     security_task = asyncio.create_task(run_update_loop(get_security_system))
     genetics_task = asyncio.create_task(run_update_loop(get_genetics_system))
     disease_task = asyncio.create_task(run_update_loop(get_disease_system))
+    physics_task = asyncio.create_task(run_update_loop(get_physics_system))
 
     TASKS.extend(
         [
@@ -112,6 +114,7 @@ async def main():
             security_task,
             genetics_task,
             disease_task,
+            physics_task,
         ]
     )
 
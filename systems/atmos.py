@@ -1,13 +1,22 @@
 """
 Atmospheric system for MUDpy SS13.
 Handles gas mixtures, pressure, temperature, and related hazards.
+
+Room readings live in a single rooms x gases NumPy matrix so vents, leaks
+and hazard checks run as array operations once per tick.
 """
 
 import logging
-from typing import Dict, List, Any, Optional
+import operator
+from collections.abc import MutableMapping
+from typing import Callable, Dict, Iterator, List, Any, Optional, Tuple
 import random
 import time
+
+import numpy as np
+
 from events import subscribe, publish
+from pathfinding import DOOR_EVENTS, edge_is_open
 import world
 
 logger = logging.getLogger(__name__)
@@ -23,6 +32,84 @@ LOW_OXYGEN_THRESHOLD = 10.0  # percent
 HIGH_CO2_THRESHOLD = 5.0  # percent
 LOW_PRESSURE_THRESHOLD = 80.0  # kPa
 HIGH_PRESSURE_THRESHOLD = 120.0  # kPa
+SMOKE_THRESHOLD = 5.0  # percent
+HEAT_THRESHOLD = 60.0  # Celsius
+
+# Hazard rules: (hazard, atmosphere key, default value, comparison, threshold)
+HAZARD_RULES: List[Tuple[str, str, float, Callable[[float, float], bool], float]] = [
+    ("low_oxygen", "oxygen", NORMAL_OXYGEN, operator.lt, LOW_OXYGEN_THRESHOLD),
+    ("high_co2", "co2", NORMAL_CO2, operator.gt, HIGH_CO2_THRESHOLD),
+    ("low_pressure", "pressure", NORMAL_PRESSURE, operator.lt, LOW_PRESSURE_THRESHOLD),
+    (
+        "high_pressure",
+        "pressure",
+        NORMAL_PRESSURE,
+        operator.gt,
+        HIGH_PRESSURE_THRESHOLD,
+    ),
+    ("smoke", "smoke", 0.0, operator.gt, SMOKE_THRESHOLD),
+    ("extreme_heat", "temperature", 20.0, operator.gt, HEAT_THRESHOLD),
+]
+
+# Standard conditions that active vents pull a room toward
+VENT_TARGETS: Dict[str, float] = {
+    "oxygen": NORMAL_OXYGEN,
+    "nitrogen": NORMAL_NITROGEN,
+    "co2": NORMAL_CO2,
+    "pressure": NORMAL_PRESSURE,
+}
+
+# Amount of each reading lost per unit of leak rate per tick
+LEAK_DRAIN: Dict[str, float] = {"oxygen": 0.5, "pressure": 2.0}
+
+# Fraction of the reading difference exchanged across each open connection
+# per tick, before scaling by the busier endpoint's number of connections
+DIFFUSION_RATE = 0.25
+
+# Readings must move by more than this before ``atmos_updated`` is republished
+PUBLISH_TOLERANCE = 0.01
+
+
+class RoomAtmosphere(MutableMapping):
+    """
+    Dict-like view of one room's row in the atmospheric matrix.
+
+    Installed as ``RoomComponent.atmosphere`` so readers always see the
+    latest simulated values without a write-back pass.
+    """
+
+    __slots__ = ("_system", "_row")
+
+    def __init__(self, system: "AtmosphericSystem", row: int):
+        self._system = system
+        self._row = row
+
+    def __getitem__(self, gas: str) -> float:
+        col = self._system.gas_index.get(gas)
+        if col is None or not self._system.present[self._row, col]:
+            raise KeyError(gas)
+        return float(self._system.values[self._row, col])
+
+    def __setitem__(self, gas: str, value: float) -> None:
+        col = self._system._column(gas)
+        self._system.values[self._row, col] = value
+        self._system.present[self._row, col] = True
+
+    def __delitem__(self, gas: str) -> None:
+        col = self._system.gas_index.get(gas)
+        if col is None or not self._system.present[self._row, col]:
+            raise KeyError(gas)
+        self._system.present[self._row, col] = False
+
+    def __iter__(self) -> Iterator[str]:
+        present = self._system.present[self._row]
+        return (gas for col, gas in enumerate(self._system.gases) if present[col])
+
+    def __len__(self) -> int:
+        return int(self._system.present[self._row].sum())
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
 
 
 class AtmosphericSystem:
@@ -41,17 +128,56 @@ class AtmosphericSystem:
         self.last_tick_time = 0
         self.enabled = False
         self.vents: Dict[str, Dict[str, Any]] = {}  # room_id -> vent data
-        self.leaks: List[Dict[str, Any]] = []  # List of active leaks
+        self.leaks_by_room: Dict[str, List[Dict[str, Any]]] = {}
         self.room_hazards: Dict[str, set] = {}
 
+        # rooms x gases matrix; ``present`` marks which readings a room has
+        self.gases: List[str] = list(VENT_TARGETS)
+        self.gas_index: Dict[str, int] = {g: i for i, g in enumerate(self.gases)}
+        self.values = np.zeros((0, len(self.gases)))
+        self.present = np.zeros((0, len(self.gases)), dtype=bool)
+        self._room_objs: List[Any] = []
+        self._room_ids: List[str] = []
+        self._row_of: Dict[str, int] = {}
+        self._comps: List[Any] = []
+        self._needs_sync = True
+        self._dirty_rooms: set = set()
+        self._hazard_state = np.zeros((0, len(HAZARD_RULES)), dtype=bool)
+        # Readings and hazards as last sent with ``atmos_updated``
+        self._pub_values = self.values.copy()
+        self._pub_present = self.present.copy()
+        self._pub_hazards: List[Optional[Tuple[str, ...]]] = []
+        # Open room connections as COO edges (rebuilt when doors change)
+        self._links_dirty = True
+        self._link_src = np.zeros(0, dtype=np.intp)
+        self._link_dst = np.zeros(0, dtype=np.intp)
+        self._link_weight = np.zeros(0)
+
         # Register event handlers
         subscribe("power_loss", self.on_power_loss)
         subscribe("power_restored", self.on_power_restored)
         subscribe("breach", self.on_breach)
         subscribe("vent_toggle", self.on_vent_toggle)
+        subscribe("room_hazards_changed", self.on_room_hazards_changed)
+        for evt in DOOR_EVENTS:
+            subscribe(evt, self.on_connectivity_changed)
+        subscribe("room_exits_changed", self.on_connectivity_changed)
+        subscribe("object_created", self.on_object_changed)
+        subscribe("object_destroyed", self.on_object_changed)
 
         logger.info("Atmospheric system initialized")
 
+    @property
+    def leaks(self) -> List[Dict[str, Any]]:
+        """All active leaks across every room."""
+        return [leak for leaks in self.leaks_by_room.values() for leak in leaks]
+
+    @leaks.setter
+    def leaks(self, leaks: List[Dict[str, Any]]) -> None:
+        self.leaks_by_room = {}
+        for leak in leaks:
+            self.leaks_by_room.setdefault(leak["room_id"], []).append(leak)
+
     def register_vent(
         self, room_id: str, output_rate: float = 1.0, is_active: bool = True
     ) -> None:
@@ -96,178 +222,267 @@ class AtmosphericSystem:
         self.last_tick_time = current_time
         logger.debug("Processing atmospheric update cycle")
 
-        # Get the world instance
-        world_instance = world.get_world()
+        self._sync_rooms(world.get_world())
+        if not self._room_ids:
+            return
+
+        self._apply_vents()
+        self._apply_leaks()
+        self._diffuse(world.get_world())
+        dirty = self._update_hazards()
+        self._publish_changes(dirty)
+
+    # ------------------------------------------------------------------
+    # Room matrix
+    # ------------------------------------------------------------------
+    def _column(self, gas: str) -> int:
+        """Return the matrix column for ``gas``, adding one if needed."""
+        col = self.gas_index.get(gas)
+        if col is not None:
+            return col
+        col = len(self.gases)
+        self.gases.append(gas)
+        self.gas_index[gas] = col
+        rows = len(self._room_ids)
+        self.values = np.hstack([self.values, np.zeros((rows, 1))])
+        self.present = np.hstack([self.present, np.zeros((rows, 1), dtype=bool)])
+        self._pub_values = np.hstack([self._pub_values, np.zeros((rows, 1))])
+        self._pub_present = np.hstack(
+            [self._pub_present, np.zeros((rows, 1), dtype=bool)]
+        )
+        return col
+
+    def _sync_rooms(self, world_instance: Any) -> None:
+        """Rebuild the room matrix if the world's rooms have changed."""
+        objs = list(world_instance.rooms.values())
+        if not self._needs_sync and objs == self._room_objs:
+            return
+        self._needs_sync = False
+        self._links_dirty = True
+        self._room_objs = objs
+
+        comps = []
+        for obj in objs:
+            room_comp = obj.get_component("room")
+            if room_comp is not None:
+                comps.append(room_comp)
+        # Snapshot through any existing views before the matrix is replaced
+        snapshots = [dict(room_comp.atmosphere) for room_comp in comps]
+        for snapshot in snapshots:
+            for gas in snapshot:
+                if gas not in self.gas_index:
+                    self.gas_index[gas] = len(self.gases)
+                    self.gases.append(gas)
+
+        old_rows = self._row_of
+        old_pub = (self._pub_values, self._pub_present, self._pub_hazards)
+        shape = (len(comps), len(self.gases))
+        self.values = np.zeros(shape)
+        self.present = np.zeros(shape, dtype=bool)
+        self._pub_values = np.zeros(shape)
+        self._pub_present = np.zeros(shape, dtype=bool)
+        self._pub_hazards = [None] * len(comps)
+        self._hazard_state = np.zeros((len(comps), len(HAZARD_RULES)), dtype=bool)
+        self._room_ids = [room_comp.owner.id for room_comp in comps]
+        self._row_of = {room_id: row for row, room_id in enumerate(self._room_ids)}
+        self._comps = comps
+
+        for row, (room_comp, snapshot) in enumerate(zip(comps, snapshots)):
+            for gas, value in snapshot.items():
+                self.values[row, self.gas_index[gas]] = value
+                self.present[row, self.gas_index[gas]] = True
+            self._hazard_state[row] = [
+                rule[0] in room_comp.hazards for rule in HAZARD_RULES
+            ]
+            old = old_rows.get(self._room_ids[row])
+            if old is None:
+                self._dirty_rooms.add(self._room_ids[row])
+            else:
+                width = old_pub[0].shape[1]
+                self._pub_values[row, :width] = old_pub[0][old]
+                self._pub_present[row, :width] = old_pub[1][old]
+                self._pub_hazards[row] = old_pub[2][old]
+
+            view = room_comp.atmosphere
+            if isinstance(view, RoomAtmosphere) and view._system is self:
+                view._row = row
+                continue
+            if isinstance(view, RoomAtmosphere):
+                view._system._needs_sync = True
+            room_comp.atmosphere = RoomAtmosphere(self, row)
+
+    def _apply_vents(self) -> None:
+        """Move every vented room toward standard conditions."""
+        rows = []
+        rates = []
+        for room_id, vent in self.vents.items():
+            row = self._row_of.get(room_id)
+            if row is not None and vent["is_active"]:
+                rows.append(row)
+                rates.append(vent["output_rate"])
+        if not rows:
+            return
+
+        cols = [self._column(gas) for gas in VENT_TARGETS]
+        targets = np.array(list(VENT_TARGETS.values()))
+        block = np.ix_(rows, cols)
+        current = self.values[block]
+        step = np.array(rates)[:, None] * 0.1
+        self.values[block] = np.where(
+            self.present[block], current + (targets - current) * step, targets
+        )
+        self.present[block] = True
+
+    def _apply_leaks(self) -> None:
+        """Drain oxygen and pressure from every leaking room."""
+        drain = np.zeros(len(self._room_ids))
+        for room_id, leaks in self.leaks_by_room.items():
+            row = self._row_of.get(room_id)
+            if row is not None:
+                drain[row] += sum(leak["rate"] for leak in leaks)
+        if not drain.any():
+            return
 
-        # Update atmosphere for each room
-        for room_id, room_obj in world_instance.rooms.items():
-            room_comp = room_obj.get_component("room")
-            if not room_comp:
+        for gas, factor in LEAK_DRAIN.items():
+            col = self.gas_index.get(gas)
+            if col is None:
                 continue
+            drained = np.maximum(0.0, self.values[:, col] - drain * factor)
+            self.values[:, col] = np.where(
+                self.present[:, col], drained, self.values[:, col]
+            )
 
-            # Apply vent normalization if active
-            if room_id in self.vents and self.vents[room_id]["is_active"]:
-                self._normalize_atmosphere(
-                    room_comp, self.vents[room_id]["output_rate"]
-                )
+    def _rebuild_links(self, world_instance: Any) -> None:
+        """Collect every open connection between rooms as an edge list."""
+        pairs = set()
+        for row, room_comp in enumerate(self._comps):
+            src = self._room_ids[row]
+            for dest in room_comp.exits.values():
+                other = self._row_of.get(dest)
+                if other is None or other == row:
+                    continue
+                if edge_is_open(world_instance, src, dest) and edge_is_open(
+                    world_instance, dest, src
+                ):
+                    pairs.add((min(row, other), max(row, other)))
+
+        edges = np.array(sorted(pairs), dtype=np.intp).reshape(-1, 2)
+        self._link_src = edges[:, 0]
+        self._link_dst = edges[:, 1]
+        degree = np.bincount(edges.ravel(), minlength=len(self._room_ids))
+        # Scaling by the busier endpoint keeps each room's total exchange
+        # below DIFFUSION_RATE, so a step never overshoots its neighbours.
+        self._link_weight = DIFFUSION_RATE / np.maximum(
+            np.maximum(degree[self._link_src], degree[self._link_dst]), 1
+        )
+        self._links_dirty = False
+
+    def _diffuse(self, world_instance: Any) -> None:
+        """Exchange readings between connected rooms with one Laplacian step."""
+        if self._links_dirty:
+            self._rebuild_links(world_instance)
+        if not len(self._link_src):
+            return
 
-            # Apply effects of any leaks affecting this room
-            for leak in self.leaks:
-                if leak["room_id"] == room_id:
-                    self._apply_leak_effects(room_comp, leak)
+        src, dst = self._link_src, self._link_dst
+        shared = self.present[src] & self.present[dst]
+        flux = (self.values[dst] - self.values[src]) * shared
+        flux *= self._link_weight[:, None]
+        rows = len(self._room_ids)
+        for col in range(len(self.gases)):
+            self.values[:, col] += np.bincount(
+                src, flux[:, col], minlength=rows
+            ) - np.bincount(dst, flux[:, col], minlength=rows)
+
+    def _update_hazards(self) -> List[int]:
+        """
+        Evaluate every hazard rule for all rooms at once.
 
-            # Update hazards based on current atmospheric conditions
-            self._update_hazards(room_comp)
+        Returns:
+            List[int]: Rows whose hazard lists were reconciled this tick.
+        """
+        rows = len(self._room_ids)
+        state = np.zeros((rows, len(HAZARD_RULES)), dtype=bool)
+        for i, (_hazard, key, default, compare, threshold) in enumerate(HAZARD_RULES):
+            col = self.gas_index.get(key)
+            if col is None:
+                readings = np.full(rows, default)
+            else:
+                readings = np.where(self.present[:, col], self.values[:, col], default)
+            state[:, i] = compare(readings, threshold)
+
+        changed = np.flatnonzero((state != self._hazard_state).any(axis=1))
+        self._hazard_state = state
+        dirty = set(changed.tolist())
+        for room_id in self._dirty_rooms:
+            row = self._row_of.get(room_id)
+            if row is not None:
+                dirty.add(row)
+        self._dirty_rooms = set()
+
+        for row in sorted(dirty):
+            room_comp = self._comps[row]
+            room_id = self._room_ids[row]
+            for i, (hazard, *_rule) in enumerate(HAZARD_RULES):
+                if state[row, i]:
+                    if hazard not in room_comp.hazards:
+                        room_comp.hazards.append(hazard)
+                        logger.debug(f"{hazard} hazard added to room {room_id}")
+                        publish("hazard_warning", room_id=room_id, hazard=hazard)
+                elif hazard in room_comp.hazards:
+                    room_comp.hazards.remove(hazard)
 
             prev = self.room_hazards.get(room_id, set())
             current = set(room_comp.hazards)
-            added = current - prev
-            removed = prev - current
-            for hz in added:
+            for hz in current - prev:
                 publish("room_hazard_added", room_id=room_id, hazard=hz)
-            for hz in removed:
+            for hz in prev - current:
                 publish("room_hazard_removed", room_id=room_id, hazard=hz)
             self.room_hazards[room_id] = current
+        return sorted(dirty)
+
+    def _publish_changes(self, dirty: List[int]) -> None:
+        """Publish ``atmos_updated`` for rooms whose readings changed."""
+        moved = np.abs(self.values - self._pub_values) > PUBLISH_TOLERANCE
+        changed = ((moved & self.present) | (self.present != self._pub_present)).any(
+            axis=1
+        )
+        rows = set(np.flatnonzero(changed).tolist())
+        for row in dirty:
+            if self._pub_hazards[row] != tuple(self._comps[row].hazards):
+                rows.add(row)
+        if not rows:
+            return
 
-            # Publish atmospheric update event for this room
+        order = sorted(rows)
+        self._pub_values[order] = self.values[order]
+        self._pub_present[order] = self.present[order]
+        for row in order:
+            room_comp = self._comps[row]
+            self._pub_hazards[row] = tuple(room_comp.hazards)
             publish(
                 "atmos_updated",
-                room_id=room_id,
-                atmosphere=room_comp.atmosphere,
+                room_id=self._room_ids[row],
+                atmosphere=dict(room_comp.atmosphere),
                 hazards=room_comp.hazards,
             )
 
-    def _normalize_atmosphere(self, room_comp: Any, rate: float) -> None:
-        """
-        Normalize the atmosphere in a room toward standard conditions.
-
-        Args:
-            room_comp: The room component.
-            rate (float): The rate of normalization.
-        """
-        # Adjust each gas toward normal values
-        if "atmosphere" in room_comp.__dict__:
-            atmos = room_comp.atmosphere
-
-            # Adjust oxygen
-            if "oxygen" in atmos:
-                diff = NORMAL_OXYGEN - atmos["oxygen"]
-                atmos["oxygen"] += diff * rate * 0.1
-            else:
-                atmos["oxygen"] = NORMAL_OXYGEN
-
-            # Adjust nitrogen
-            if "nitrogen" in atmos:
-                diff = NORMAL_NITROGEN - atmos["nitrogen"]
-                atmos["nitrogen"] += diff * rate * 0.1
-            else:
-                atmos["nitrogen"] = NORMAL_NITROGEN
-
-            # Adjust CO2
-            if "co2" in atmos:
-                diff = NORMAL_CO2 - atmos["co2"]
-                atmos["co2"] += diff * rate * 0.1
-            else:
-                atmos["co2"] = NORMAL_CO2
-
-            # Adjust pressure
-            if "pressure" in atmos:
-                diff = NORMAL_PRESSURE - atmos["pressure"]
-                atmos["pressure"] += diff * rate * 0.1
-            else:
-                atmos["pressure"] = NORMAL_PRESSURE
-
-    def _apply_leak_effects(self, room_comp: Any, leak: Dict[str, Any]) -> None:
-        """
-        Apply the effects of a leak to a room's atmosphere.
-
-        Args:
-            room_comp: The room component.
-            leak (Dict[str, Any]): Data about the leak.
-        """
-        if "atmosphere" in room_comp.__dict__:
-            atmos = room_comp.atmosphere
-
-            # Reduce oxygen
-            if "oxygen" in atmos:
-                atmos["oxygen"] -= leak["rate"] * 0.5
-                atmos["oxygen"] = max(0, atmos["oxygen"])
+    def on_connectivity_changed(self, **_: Any) -> None:
+        """Rebuild the room connection graph before the next diffusion step."""
+        self._links_dirty = True
 
-            # Reduce pressure
-            if "pressure" in atmos:
-                atmos["pressure"] -= leak["rate"] * 2.0
-                atmos["pressure"] = max(0, atmos["pressure"])
+    def on_object_changed(self, object_id: str, **_: Any) -> None:
+        """Rebuild the connection graph when a room or door comes or goes."""
+        obj = world.get_world().get_object(object_id)
+        if obj is None:
+            if object_id in self._row_of:
+                self._links_dirty = True
+        elif obj.get_component("room") or obj.get_component("door"):
+            self._links_dirty = True
 
-    def _update_hazards(self, room_comp: Any) -> None:
-        """
-        Update the hazards in a room based on atmospheric conditions.
-
-        Args:
-            room_comp: The room component.
-        """
-        if not hasattr(room_comp, "atmosphere") or not hasattr(room_comp, "hazards"):
-            return
-
-        atmos = room_comp.atmosphere
-
-        # Check for low oxygen
-        if atmos.get("oxygen", NORMAL_OXYGEN) < LOW_OXYGEN_THRESHOLD:
-            if "low_oxygen" not in room_comp.hazards:
-                room_comp.hazards.append("low_oxygen")
-                logger.debug(f"Low oxygen hazard added to room {room_comp.owner.id}")
-                publish(
-                    "hazard_warning", room_id=room_comp.owner.id, hazard="low_oxygen"
-                )
-        elif "low_oxygen" in room_comp.hazards:
-            room_comp.hazards.remove("low_oxygen")
-
-        # Check for high CO2
-        if atmos.get("co2", NORMAL_CO2) > HIGH_CO2_THRESHOLD:
-            if "high_co2" not in room_comp.hazards:
-                room_comp.hazards.append("high_co2")
-                logger.debug(f"High CO2 hazard added to room {room_comp.owner.id}")
-                publish("hazard_warning", room_id=room_comp.owner.id, hazard="high_co2")
-        elif "high_co2" in room_comp.hazards:
-            room_comp.hazards.remove("high_co2")
-
-        # Check for low pressure
-        if atmos.get("pressure", NORMAL_PRESSURE) < LOW_PRESSURE_THRESHOLD:
-            if "low_pressure" not in room_comp.hazards:
-                room_comp.hazards.append("low_pressure")
-                logger.debug(f"Low pressure hazard added to room {room_comp.owner.id}")
-                publish(
-                    "hazard_warning", room_id=room_comp.owner.id, hazard="low_pressure"
-                )
-        elif "low_pressure" in room_comp.hazards:
-            room_comp.hazards.remove("low_pressure")
-
-        # Check for high pressure
-        if atmos.get("pressure", NORMAL_PRESSURE) > HIGH_PRESSURE_THRESHOLD:
-            if "high_pressure" not in room_comp.hazards:
-                room_comp.hazards.append("high_pressure")
-                logger.debug(f"High pressure hazard added to room {room_comp.owner.id}")
-                publish(
-                    "hazard_warning", room_id=room_comp.owner.id, hazard="high_pressure"
-                )
-        elif "high_pressure" in room_comp.hazards:
-            room_comp.hazards.remove("high_pressure")
-
-        if atmos.get("smoke", 0.0) > 5.0:
-            if "smoke" not in room_comp.hazards:
-                room_comp.hazards.append("smoke")
-                logger.debug(f"Smoke hazard added to room {room_comp.owner.id}")
-                publish("hazard_warning", room_id=room_comp.owner.id, hazard="smoke")
-        elif "smoke" in room_comp.hazards:
-            room_comp.hazards.remove("smoke")
-
-        if atmos.get("temperature", 20.0) > 60.0:
-            if "extreme_heat" not in room_comp.hazards:
-                room_comp.hazards.append("extreme_heat")
-                publish(
-                    "hazard_warning", room_id=room_comp.owner.id, hazard="extreme_heat"
-                )
-        elif "extreme_heat" in room_comp.hazards:
-            room_comp.hazards.remove("extreme_heat")
+    def on_room_hazards_changed(self, room_id: str, **_: Any) -> None:
+        """Reconcile a room's hazard list on the next tick."""
+        self._dirty_rooms.add(room_id)
 
     def create_leak(
         self, room_id: str, rate: float = 1.0, duration: Optional[float] = None
@@ -288,7 +503,7 @@ class AtmosphericSystem:
             "duration": duration,
         }
 
-        self.leaks.append(leak)
+        self.leaks_by_room.setdefault(room_id, []).append(leak)
         logger.info(f"Created leak in room {room_id} with rate {rate}")
         publish("leak_started", room_id=room_id, rate=rate)
 
@@ -302,20 +517,13 @@ class AtmosphericSystem:
         Returns:
             bool: True if any leaks were fixed, False otherwise.
         """
-        fixed = False
-        leaks_to_remove = []
-
-        for leak in self.leaks:
-            if leak["room_id"] == room_id:
-                leaks_to_remove.append(leak)
-                fixed = True
+        leaks_to_remove = self.leaks_by_room.pop(room_id, [])
 
-        for leak in leaks_to_remove:
-            self.leaks.remove(leak)
+        for _leak in leaks_to_remove:
             logger.info(f"Fixed leak in room {room_id}")
             publish("leak_fixed", room_id=room_id)
 
-        return fixed
+        return bool(leaks_to_remove)
 
     def get_room_hazards(self, room_id: str) -> List[str]:
         return list(self.room_hazards.get(room_id, set()))
@@ -1,8 +1,20 @@
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List, Tuple
+
+import numpy as np
+
 from events import publish
 from .gas_sim import AtmosGrid, AtmosTile
 
+# Fires hotter than this with more fuel than SPREAD_FUEL ignite neighbours
+SPREAD_TEMPERATURE = 150.0
+SPREAD_FUEL = 1.0
+# Oxygen a neighbour needs to catch fire, and a fire needs to keep burning
+IGNITION_OXYGEN = 5.0
+SUSTAIN_OXYGEN = 1.0
+
+_OFFSETS = ((0, 1), (1, 0), (-1, 0), (0, -1))
+
 
 @dataclass
 class FireSource:
@@ -12,48 +24,134 @@ class FireSource:
 
 
 class FireSystem:
+    """Fires burning on the tiles of an :class:`AtmosGrid`.
+
+    Burning tiles are an indexed set: parallel arrays of coordinates, fuel
+    and fire temperature, plus a grid-sized map from tile to slot.  Each
+    step burns every fire at once on those arrays, spreads from the hot
+    frontier, and publishes one ``fire_spread`` and one
+    ``fire_extinguished`` event listing the tiles affected that tick.
+    """
+
     def __init__(self, grid: AtmosGrid):
         self.grid = grid
-        self.fires: List[FireSource] = []
+        self._xs = np.zeros(0, dtype=np.intp)
+        self._ys = np.zeros(0, dtype=np.intp)
+        self._fuel = np.zeros(0)
+        self._heat = np.zeros(0)
+        self._slot = np.full((grid.width, grid.height), -1, dtype=np.intp)
+
+    def __len__(self) -> int:
+        return len(self._xs)
+
+    @property
+    def fires(self) -> Dict[Tuple[int, int], FireSource]:
+        """Snapshot of the burning tiles keyed by coordinate."""
+        return {
+            (int(x), int(y)): FireSource(self.grid.get_tile(int(x), int(y)), f, t)
+            for x, y, f, t in zip(self._xs, self._ys, self._fuel, self._heat)
+        }
+
+    def is_burning(self, x: int, y: int) -> bool:
+        if not (0 <= x < self.grid.width and 0 <= y < self.grid.height):
+            return False
+        return bool(self._slot[x, y] >= 0)
 
     def ignite(
         self, x: int, y: int, fuel: float = 10.0, temperature: float = 300.0
     ) -> None:
         tile = self.grid.get_tile(x, y)
-        if tile:
-            tile.gas.temperature = max(tile.gas.temperature, temperature)
-            self.fires.append(FireSource(tile, fuel, temperature))
-            publish("fire_started", x=x, y=y)
+        if not tile:
+            return
+        tile.gas.temperature = max(tile.gas.temperature, temperature)
+        slot = self._slot[x, y]
+        if slot >= 0:
+            # feeding an existing fire
+            self._fuel[slot] += fuel
+            self._heat[slot] = max(self._heat[slot], temperature)
+        else:
+            self._add(np.array([x]), np.array([y]), [fuel], [temperature])
+        publish("fire_started", x=x, y=y)
+
+    def _add(self, xs: np.ndarray, ys: np.ndarray, fuel, heat) -> None:
+        start = len(self._xs)
+        self._xs = np.concatenate([self._xs, xs])
+        self._ys = np.concatenate([self._ys, ys])
+        self._fuel = np.concatenate([self._fuel, fuel])
+        self._heat = np.concatenate([self._heat, heat])
+        self._slot[xs, ys] = np.arange(start, len(self._xs))
+
+    def _keep(self, mask: np.ndarray) -> None:
+        self._slot[self._xs[~mask], self._ys[~mask]] = -1
+        self._xs = self._xs[mask]
+        self._ys = self._ys[mask]
+        self._fuel = self._fuel[mask]
+        self._heat = self._heat[mask]
+        self._slot[self._xs, self._ys] = np.arange(len(self._xs))
 
     def step(self) -> None:
-        remaining: List[FireSource] = []
-        new_fires: List[FireSource] = []
-        active_tiles = {(f.tile.x, f.tile.y) for f in self.fires}
-        added_tiles = set()
-        for fire in self.fires:
-            gas = fire.tile.gas
-            burn = min(fire.fuel, gas.composition.get("oxygen", 0) / 5)
-            if burn <= 0:
-                continue
-            gas.remove_gas("oxygen", burn * 5)
-            gas.add_gas("co2", burn * 3)
-            gas.add_gas("smoke", burn * 2)
-            fire.temperature += burn * 2
-            gas.temperature = max(gas.temperature, fire.temperature)
-            fire.fuel -= burn
-            if fire.temperature > 150 and fire.fuel > 1:
-                for nbr in self.grid.neighbours(fire.tile):
-                    coord = (nbr.x, nbr.y)
-                    if coord not in active_tiles and coord not in added_tiles:
-                        if nbr.gas.composition.get("oxygen", 0) > 5:
-                            new_fires.append(
-                                FireSource(nbr, fuel=fire.fuel / 2, temperature=fire.temperature)
-                            )
-                            added_tiles.add(coord)
-                            publish("fire_started", x=nbr.x, y=nbr.y)
-
-            if fire.fuel > 0 and gas.composition.get("oxygen", 0) > 1:
-                remaining.append(fire)
-            else:
-                publish("fire_extinguished", x=fire.tile.x, y=fire.tile.y)
-        self.fires = remaining + new_fires
+        if not len(self._xs):
+            return
+        grid = self.grid
+        xs, ys = self._xs, self._ys
+        oxygen_idx = grid.ensure_gas("oxygen")
+        co2_idx = grid.ensure_gas("co2")
+        smoke_idx = grid.ensure_gas("smoke")
+
+        # combustion on every burning tile at once
+        oxygen = grid.composition[oxygen_idx, xs, ys]
+        burn = np.minimum(self._fuel, oxygen / 5)
+        burning = burn > 0
+        burn = np.where(burning, burn, 0.0)
+        grid.composition[oxygen_idx, xs, ys] = np.maximum(oxygen - burn * 5, 0.0)
+        grid.composition[co2_idx, xs, ys] += burn * 3
+        grid.composition[smoke_idx, xs, ys] += burn * 2
+        self._heat = self._heat + burn * 2
+        self._fuel = self._fuel - burn
+        grid.temperature[xs, ys] = np.where(
+            burning,
+            np.maximum(grid.temperature[xs, ys], self._heat),
+            grid.temperature[xs, ys],
+        )
+        if burning.any():
+            grid.wake_tiles(xs[burning], ys[burning])
+
+        # the hot frontier ignites neighbours that are not burning yet
+        spread = (
+            burning & (self._heat > SPREAD_TEMPERATURE) & (self._fuel > SPREAD_FUEL)
+        )
+        new_tiles: List[Tuple[int, int]] = []
+        if spread.any():
+            parents = np.flatnonzero(spread)
+            cand_x = np.concatenate([xs[parents] + dx for dx, _ in _OFFSETS])
+            cand_y = np.concatenate([ys[parents] + dy for _, dy in _OFFSETS])
+            source = np.tile(parents, len(_OFFSETS))
+            inside = (
+                (cand_x >= 0)
+                & (cand_x < grid.width)
+                & (cand_y >= 0)
+                & (cand_y < grid.height)
+            )
+            cand_x, cand_y, source = cand_x[inside], cand_y[inside], source[inside]
+            fresh = (self._slot[cand_x, cand_y] < 0) & (
+                grid.composition[oxygen_idx, cand_x, cand_y] > IGNITION_OXYGEN
+            )
+            cand_x, cand_y, source = cand_x[fresh], cand_y[fresh], source[fresh]
+            # a tile reached from several fires catches from the first one
+            _, first = np.unique(cand_x * grid.height + cand_y, return_index=True)
+            first.sort()
+            cand_x, cand_y, source = cand_x[first], cand_y[first], source[first]
+            new_tiles = list(zip(cand_x.tolist(), cand_y.tolist()))
+
+        oxygen = grid.composition[oxygen_idx, xs, ys]
+        alive = burning & (self._fuel > 0) & (oxygen > SUSTAIN_OXYGEN)
+        out_tiles = list(zip(xs[~alive].tolist(), ys[~alive].tolist()))
+        if new_tiles:
+            fuel = self._fuel[source] / 2
+            heat = self._heat[source]
+        self._keep(alive)
+        if new_tiles:
+            self._add(cand_x, cand_y, fuel, heat)
+            publish("fire_spread", tiles=new_tiles)
+        if out_tiles:
+            publish("fire_extinguished", tiles=out_tiles)
@@ -1,12 +1,59 @@
-from typing import Dict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
 from components.player import PlayerComponent
+from events import publish, subscribe
+from pathfinding import DOOR_EVENTS, edge_is_open
+import world
+from .plumbing import get_plumbing_system
+
+# Share of the level difference that crosses open exits per tick.  Each exit
+# gets this divided by the busier room's exit count, so a room never sends
+# out more than half its surplus and levels cannot oscillate.
+FLOW_RATE = 0.5
+# Rooms below this level count as dry and drop out of the simulation
+DRY_LEVEL = 1e-3
+# Fluid volume of a completely flooded room, for plumbing transfers
+ROOM_VOLUME = 100.0
+
+
+@dataclass
+class Drain:
+    """Removes up to ``rate`` level per tick, into ``device_id`` if set."""
+
+    rate: float = 0.05
+    device_id: Optional[str] = None
 
 
 class FloodSystem:
-    """Manage water levels in rooms and slow player movement when flooded."""
+    """Water levels in rooms, flowing between rooms over open exits.
 
-    def __init__(self) -> None:
+    ``levels`` only holds wet rooms.  The room graph is compiled into CSR
+    arrays when exits, doors or rooms change, and each :meth:`step` flows
+    water along the exits leaving wet rooms only, so a dry station costs
+    nothing and a flood costs in proportion to its frontier.
+    """
+
+    def __init__(self, world_instance: Optional[Any] = None) -> None:
         self.levels: Dict[str, float] = {}
+        self.sources: Dict[str, float] = {}
+        self.drains: Dict[str, Drain] = {}
+        self._world = world_instance
+        self._bound_world = None
+        self._graph_dirty = True
+        self._room_ids: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._indptr = np.zeros(1, dtype=np.intp)
+        self._neighbours = np.zeros(0, dtype=np.intp)
+        self._degree = np.zeros(0, dtype=np.intp)
+
+        for evt in DOOR_EVENTS:
+            subscribe(evt, self.on_connectivity_changed)
+        subscribe("room_exits_changed", self.on_connectivity_changed)
+        subscribe("object_created", self.on_connectivity_changed)
+        subscribe("object_destroyed", self.on_connectivity_changed)
 
     def add_water(self, room_id: str, amount: float = 0.1) -> None:
         level = self.levels.get(room_id, 0.0) + amount
@@ -25,3 +72,146 @@ class FloodSystem:
     def affect_player(self, player: PlayerComponent, room_id: str) -> None:
         level = self.levels.get(room_id, 0.0)
         player.move_speed = 2.0 if level > 0.5 else 1.0
+
+    # ------------------------------------------------------------------
+    # Plumbing
+    # ------------------------------------------------------------------
+    def burst_pipe(self, room_id: str, rate: float = 0.1) -> None:
+        """Start water pouring into ``room_id`` every tick."""
+        self.sources[room_id] = self.sources.get(room_id, 0.0) + rate
+        publish("pipe_burst", room_id=room_id, rate=rate)
+
+    def repair_pipe(self, room_id: str) -> bool:
+        """Stop a burst pipe in ``room_id``; return ``False`` if none."""
+        return self.sources.pop(room_id, None) is not None
+
+    def add_drain(
+        self, room_id: str, rate: float = 0.05, device_id: Optional[str] = None
+    ) -> None:
+        """Drain ``room_id``, optionally into a plumbing container."""
+        self.drains[room_id] = Drain(rate, device_id)
+
+    def remove_drain(self, room_id: str) -> bool:
+        return self.drains.pop(room_id, None) is not None
+
+    # ------------------------------------------------------------------
+    # Room graph
+    # ------------------------------------------------------------------
+    def on_connectivity_changed(self, **_: Any) -> None:
+        self._graph_dirty = True
+
+    def _get_world(self) -> Any:
+        world_instance = self._world or world.get_world()
+        if world_instance is not self._bound_world:
+            self._bound_world = world_instance
+            self._graph_dirty = True
+        return world_instance
+
+    def _rebuild_graph(self, world_instance: Any) -> None:
+        """Compile open exits between rooms into CSR adjacency arrays."""
+        self._room_ids = list(world_instance.rooms)
+        self._index = {room_id: i for i, room_id in enumerate(self._room_ids)}
+        pairs = set()
+        for src, obj in world_instance.rooms.items():
+            room_comp = obj.get_component("room")
+            if room_comp is None:
+                continue
+            for dest in room_comp.exits.values():
+                if dest == src or dest not in self._index:
+                    continue
+                if edge_is_open(world_instance, src, dest) and edge_is_open(
+                    world_instance, dest, src
+                ):
+                    a, b = self._index[src], self._index[dest]
+                    pairs.add((a, b))
+                    pairs.add((b, a))
+
+        edges = np.array(sorted(pairs), dtype=np.intp).reshape(-1, 2)
+        self._degree = np.bincount(edges[:, 0], minlength=len(self._room_ids))
+        self._indptr = np.concatenate([[0], np.cumsum(self._degree)]).astype(np.intp)
+        self._neighbours = edges[:, 1]
+        self._graph_dirty = False
+
+    # ------------------------------------------------------------------
+    def step(self) -> None:
+        """Pour sources, flow water downhill along open exits, then drain."""
+        world_instance = self._get_world()
+        if self._graph_dirty:
+            self._rebuild_graph(world_instance)
+
+        for room_id, rate in self.sources.items():
+            self.add_water(room_id, rate)
+        if not self.levels:
+            return
+        wet_before = set(self.levels)
+        self._flow()
+        self._drain()
+
+        spread = sorted(set(self.levels) - wet_before)
+        dried = sorted(wet_before - set(self.levels))
+        if spread:
+            publish("flood_spread", rooms=spread)
+        if dried:
+            publish("flood_drained", rooms=dried)
+
+    def _flow(self) -> None:
+        """Move water along every exit leaving a wet room at once."""
+        wet = np.array(
+            [self._index[r] for r in self.levels if r in self._index], dtype=np.intp
+        )
+        if not len(wet):
+            return
+        starts = self._indptr[wet]
+        counts = self._indptr[wet + 1] - starts
+        total = int(counts.sum())
+        if not total:
+            return
+        # gather the CSR slices of the wet rooms without a Python loop
+        offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        src = np.repeat(wet, counts)
+        dst = self._neighbours[offsets + np.arange(total)]
+
+        nodes, local = np.unique(np.concatenate([src, dst]), return_inverse=True)
+        local_src, local_dst = local[: len(src)], local[len(src) :]
+        level = np.array([self.levels.get(self._room_ids[n], 0.0) for n in nodes])
+
+        # exits between two wet rooms appear in both directions; only the
+        # downhill one carries water
+        drop = level[local_src] - level[local_dst]
+        downhill = drop > 0
+        weight = FLOW_RATE / np.maximum(self._degree[src], self._degree[dst])
+        flux = np.where(downhill, drop * weight, 0.0)
+        level += np.bincount(local_dst, flux, minlength=len(nodes))
+        level -= np.bincount(local_src, flux, minlength=len(nodes))
+
+        for n, value in zip(nodes.tolist(), level.tolist()):
+            room_id = self._room_ids[n]
+            if value > DRY_LEVEL:
+                self.levels[room_id] = value
+            else:
+                self.levels.pop(room_id, None)
+
+    def _drain(self) -> None:
+        if not self.drains:
+            return
+        devices = get_plumbing_system().devices
+        for room_id, drain in self.drains.items():
+            level = self.levels.get(room_id, 0.0)
+            amount = min(level, drain.rate)
+            if amount <= 0:
+                continue
+            if drain.device_id is not None:
+                container = devices.get(drain.device_id)
+                if container is None:
+                    continue
+                # a full tank backs the drain up
+                free = container.capacity - container.current_volume()
+                amount = min(amount, free / ROOM_VOLUME)
+                if amount <= 0:
+                    continue
+                if not container.add_fluid("water", amount * ROOM_VOLUME):
+                    continue
+            if level - amount > DRY_LEVEL:
+                self.levels[room_id] = level - amount
+            else:
+                self.levels.pop(room_id, None)
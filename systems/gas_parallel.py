@@ -0,0 +1,277 @@
+"""Multi-process backend for :class:`systems.gas_sim.AtmosGrid`.
+
+:class:`TiledAtmosGrid` keeps the grid arrays in shared memory and splits
+the grid into rectangular tiles, each stepped by its own worker process.
+Every exchange sub-step runs in two phases: workers first compute their
+tile from the shared arrays, reading a halo of neighbouring cells, and only
+once all of them are done write their results back.  The exchange is made
+of elementwise operations, so the tiled result is bit-for-bit identical to
+the single-process grid.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import weakref
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .gas_sim import GAS_SPECIES, AtmosGrid, exchange
+
+# Cells read beyond a tile's edge each sub-step.  A cell's new value depends
+# on the outflow limits of its neighbours, which in turn look one cell
+# further, so the halo is two cells wide.
+HALO = 2
+
+_ARRAYS = ("pressure", "temperature", "composition", "blocked")
+
+ArraySpec = Tuple[str, Tuple[int, ...], str]
+
+
+def _attach(
+    specs: Dict[str, ArraySpec],
+) -> Tuple[Dict[str, np.ndarray], List[shared_memory.SharedMemory]]:
+    arrays = {}
+    handles = []
+    for name, (shm_name, shape, dtype) in specs.items():
+        shm = shared_memory.SharedMemory(name=shm_name)
+        handles.append(shm)
+        arrays[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+    return arrays, handles
+
+
+def _release(
+    arrays: Dict[str, np.ndarray], handles: List[shared_memory.SharedMemory]
+) -> None:
+    arrays.clear()
+    for shm in handles:
+        shm.close()
+
+
+def _clip(inner: slice, outer: slice, margin: int = 0) -> slice:
+    return slice(
+        max(inner.start - margin, outer.start), min(inner.stop + margin, outer.stop)
+    )
+
+
+def _compute(
+    arrays: Dict[str, np.ndarray],
+    tile: Tuple[slice, slice],
+    xs: slice,
+    ys: slice,
+    rate: float,
+    skip: Optional[Tuple[slice, slice]],
+) -> Optional[Tuple[slice, slice, np.ndarray, np.ndarray, np.ndarray]]:
+    """Step the part of ``tile`` inside ``[xs, ys]`` without writing it."""
+    own_x = _clip(tile[0], xs)
+    own_y = _clip(tile[1], ys)
+    if own_x.start >= own_x.stop or own_y.start >= own_y.stop:
+        return None
+    win_x = _clip(own_x, xs, HALO)
+    win_y = _clip(own_y, ys, HALO)
+    pressure, temperature, composition = exchange(
+        arrays["pressure"],
+        arrays["temperature"],
+        arrays["composition"],
+        arrays["blocked"],
+        win_x,
+        win_y,
+        rate,
+        skip,
+    )
+    lx = slice(own_x.start - win_x.start, own_x.stop - win_x.start)
+    ly = slice(own_y.start - win_y.start, own_y.stop - win_y.start)
+    return (
+        own_x,
+        own_y,
+        pressure[lx, ly],
+        temperature[lx, ly],
+        composition[:, lx, ly],
+    )
+
+
+def _worker(conn: Any, tile: Tuple[slice, slice], specs: Dict[str, ArraySpec]) -> None:
+    """Worker process loop: step one tile on request."""
+    arrays, handles = _attach(specs)
+    pending = None
+    try:
+        while True:
+            msg = conn.recv()
+            cmd = msg[0]
+            try:
+                if cmd == "step":
+                    pending = _compute(arrays, tile, *msg[1:])
+                elif cmd == "commit":
+                    if pending is not None:
+                        xs, ys, pressure, temperature, composition = pending
+                        arrays["pressure"][xs, ys] = pressure
+                        arrays["temperature"][xs, ys] = temperature
+                        arrays["composition"][:, xs, ys] = composition
+                    pending = None
+                elif cmd == "attach":
+                    _release(arrays, handles)
+                    arrays, handles = _attach(msg[1])
+                elif cmd == "close":
+                    break
+            except Exception as exc:  # pragma: no cover - reported to parent
+                conn.send(("error", repr(exc)))
+                continue
+            conn.send(("ok", None))
+    finally:
+        _release(arrays, handles)
+        conn.close()
+
+
+def _free(shm: shared_memory.SharedMemory) -> None:
+    try:
+        shm.close()
+    except BufferError:
+        # arrays handed out earlier still map the block; the mapping is
+        # released with them
+        pass
+    shm.unlink()
+
+
+def _shutdown(
+    conns: List[Any],
+    procs: List[multiprocessing.Process],
+    shms: Dict[str, shared_memory.SharedMemory],
+) -> None:
+    for conn in conns:
+        try:
+            conn.send(("close",))
+        except (BrokenPipeError, OSError):
+            pass
+    for proc in procs:
+        proc.join(timeout=5)
+        if proc.is_alive():
+            proc.terminate()
+    for conn in conns:
+        conn.close()
+    for shm in shms.values():
+        _free(shm)
+    shms.clear()
+
+
+class TiledAtmosGrid(AtmosGrid):
+    """:class:`AtmosGrid` whose exchange step runs on worker processes.
+
+    The grid is cut into ``tiles`` (columns along x, rows along y)
+    rectangles, defaulting to ``workers`` strips along x.  Call
+    :meth:`close` (or use the grid as a context manager) to stop the
+    workers and free the shared memory.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        workers: int = 2,
+        tiles: Optional[Tuple[int, int]] = None,
+        epsilon: float = 1e-3,
+        stability_limit: float = 20.0,
+    ) -> None:
+        super().__init__(width, height, epsilon, stability_limit)
+        nx, ny = tiles or (workers, 1)
+        xs = np.array_split(np.arange(width), nx)
+        ys = np.array_split(np.arange(height), ny)
+        self.tile_bounds = [
+            (slice(int(x[0]), int(x[-1]) + 1), slice(int(y[0]), int(y[-1]) + 1))
+            for x in xs
+            if len(x)
+            for y in ys
+            if len(y)
+        ]
+
+        self._shms: Dict[str, shared_memory.SharedMemory] = {}
+        for name in _ARRAYS:
+            setattr(self, name, self._share(name, getattr(self, name)))
+
+        ctx = multiprocessing.get_context()
+        self._conns: List[Any] = []
+        self._procs: List[multiprocessing.Process] = []
+        specs = self._specs()
+        for bounds in self.tile_bounds:
+            parent, child = ctx.Pipe()
+            proc = ctx.Process(target=_worker, args=(child, bounds, specs), daemon=True)
+            proc.start()
+            child.close()
+            self._conns.append(parent)
+            self._procs.append(proc)
+        self._finalizer = weakref.finalize(
+            self, _shutdown, self._conns, self._procs, self._shms
+        )
+
+    def _share(self, name: str, array: np.ndarray) -> np.ndarray:
+        """Copy ``array`` into a new shared memory block stored as ``name``."""
+        shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        shared = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+        shared[...] = array
+        old = self._shms.get(name)
+        self._shms[name] = shm
+        if old is not None:
+            _free(old)
+        return shared
+
+    def _specs(self) -> Dict[str, ArraySpec]:
+        return {
+            name: (
+                self._shms[name].name,
+                getattr(self, name).shape,
+                getattr(self, name).dtype.str,
+            )
+            for name in _ARRAYS
+        }
+
+    def _broadcast(self, *msg: Any) -> None:
+        """Send ``msg`` to every worker and wait until all have answered."""
+        for conn in self._conns:
+            conn.send(msg)
+        errors = []
+        for conn in self._conns:
+            status, detail = conn.recv()
+            if status == "error":
+                errors.append(detail)
+        if errors:
+            raise RuntimeError(f"atmos worker failed: {errors[0]}")
+
+    def sync_species(self) -> None:
+        if len(self.composition) == len(GAS_SPECIES):
+            return
+        super().sync_species()
+        if self._finalizer.alive:
+            self.composition = self._share("composition", self.composition)
+            self._broadcast("attach", self._specs())
+
+    def _step_region(
+        self,
+        xs: slice,
+        ys: slice,
+        rate: float,
+        skip: Optional[Tuple[slice, slice]] = None,
+    ) -> None:
+        if not self._finalizer.alive:
+            super()._step_region(xs, ys, rate, skip)
+            return
+        if xs.start >= xs.stop or ys.start >= ys.stop:
+            return
+        # every worker reads the old state before any of them writes
+        self._broadcast("step", xs, ys, rate, skip)
+        self._broadcast("commit")
+
+    def close(self) -> None:
+        """Stop the worker processes and release the shared memory."""
+        if not self._finalizer.alive:
+            return
+        # keep the grid usable (single-process) after the workers are gone
+        for name in _ARRAYS:
+            setattr(self, name, np.array(getattr(self, name)))
+        self._finalizer()
+
+    def __enter__(self) -> "TiledAtmosGrid":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -8,49 +8,224 @@ in the future.
 
 from __future__ import annotations
 
+import math
+from collections.abc import Mapping, MutableMapping
 from dataclasses import dataclass, field
-from typing import Dict, Tuple, Optional, Iterable
+from typing import Any, Dict, Iterator, List, Tuple, Optional, Iterable
+
+import numpy as np
+
+# Registry of gas species.  Indices are fixed once assigned, so mixture
+# vectors and grid composition layers always line up by position.
+GAS_SPECIES: List[str] = []
+GAS_INDEX: Dict[str, int] = {}
+
+
+def register_gas(name: str) -> int:
+    """Return the fixed index of gas ``name``, registering it if new."""
+    idx = GAS_INDEX.get(name)
+    if idx is None:
+        idx = len(GAS_SPECIES)
+        GAS_SPECIES.append(name)
+        GAS_INDEX[name] = idx
+    return idx
+
+
+DEFAULT_COMPOSITION: Dict[str, float] = {
+    "oxygen": 21.0,
+    "nitrogen": 78.0,
+    "co2": 0.04,
+    "smoke": 0.0,
+}
+for _gas in DEFAULT_COMPOSITION:
+    register_gas(_gas)
+
+# Largest transfer rate per sub-step for which the explicit four-neighbour
+# exchange stays stable, and the smaller rate used across steep gradients so
+# that no tile can push gas past a neighbour.
+STABLE_RATE = 0.25
+MONOTONE_RATE = 0.125
+# Side of the square blocks used to group active tiles into separate boxes
+ACTIVE_BLOCK = 16
+
+# Reused by GasMixture.mix so blending allocates nothing per call
+_scratch = np.zeros(len(GAS_SPECIES))
+
+
+def _mix_buffer(size: int) -> np.ndarray:
+    global _scratch
+    if len(_scratch) < size:
+        _scratch = np.zeros(max(size, len(GAS_SPECIES)))
+    return _scratch[:size]
+
+
+class _CompositionView(MutableMapping):
+    """Name-keyed access to the species vector behind a :class:`GasMixture`."""
+
+    __slots__ = ("gas",)
+
+    def __init__(self, gas: "GasMixture") -> None:
+        self.gas = gas
+
+    def __getitem__(self, name: str) -> float:
+        idx = GAS_INDEX.get(name)
+        if idx is None or not self.gas._readable(idx):
+            raise KeyError(name)
+        return float(self.gas._vector()[idx])
+
+    def __contains__(self, name: object) -> bool:
+        idx = GAS_INDEX.get(name)  # type: ignore[arg-type]
+        return idx is not None and bool(self.gas._present()[idx])
+
+    def __setitem__(self, name: str, value: float) -> None:
+        idx = register_gas(name)
+        self.gas._vector()[idx] = value
+        self.gas._mark(idx, True)
+        self.gas._changed()
+
+    def __delitem__(self, name: str) -> None:
+        idx = GAS_INDEX.get(name)
+        if idx is None or not self.gas._present()[idx]:
+            raise KeyError(name)
+        self.gas._vector()[idx] = 0.0
+        self.gas._mark(idx, False)
+        self.gas._changed()
+
+    def __iter__(self) -> Iterator[str]:
+        present = self.gas._present()
+        return (GAS_SPECIES[idx] for idx in np.flatnonzero(present).tolist())
+
+    def __len__(self) -> int:
+        return int(self.gas._present().sum())
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
 
 
-@dataclass
 class GasMixture:
-    """Representation of a gas mixture."""
-
-    pressure: float = 101.3
-    temperature: float = 20.0
-    composition: Dict[str, float] = field(
-        default_factory=lambda: {
-            "oxygen": 21.0,
-            "nitrogen": 78.0,
-            "co2": 0.04,
-            "smoke": 0.0,
-        }
-    )
+    """Representation of a gas mixture.
 
-    def copy(self) -> "GasMixture":
-        return GasMixture(
-            pressure=self.pressure,
-            temperature=self.temperature,
-            composition=dict(self.composition),
+    Gas amounts are kept in ``amounts``, a vector indexed by the fixed
+    species indices in :data:`GAS_INDEX`, and ``present`` marks which
+    species the mixture holds; ``composition`` exposes the same values as a
+    mapping keyed by gas name.
+    """
+
+    __slots__ = ("pressure", "temperature", "amounts", "present")
+
+    def __init__(
+        self,
+        pressure: float = 101.3,
+        temperature: float = 20.0,
+        composition: Optional[Dict[str, float]] = None,
+    ) -> None:
+        self.pressure = pressure
+        self.temperature = temperature
+        if composition is None:
+            composition = DEFAULT_COMPOSITION
+        for gas in composition:
+            register_gas(gas)
+        self.amounts = np.zeros(len(GAS_SPECIES))
+        self.present = np.zeros(len(GAS_SPECIES), dtype=bool)
+        for gas, amount in composition.items():
+            self.amounts[GAS_INDEX[gas]] = amount
+            self.present[GAS_INDEX[gas]] = True
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, GasMixture):
+            return NotImplemented
+        mine = self._vector()
+        theirs = other._vector()
+        return (
+            self.pressure == other.pressure
+            and self.temperature == other.temperature
+            and np.array_equal(mine, theirs)
         )
 
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(pressure={self.pressure!r}, "
+            f"temperature={self.temperature!r}, composition={self.composition!r})"
+        )
+
+    def _vector(self) -> np.ndarray:
+        """Return the amounts vector, grown to cover every registered gas."""
+        if len(self.amounts) < len(GAS_SPECIES):
+            grown = np.zeros(len(GAS_SPECIES))
+            grown[: len(self.amounts)] = self.amounts
+            self.amounts = grown
+            present = np.zeros(len(GAS_SPECIES), dtype=bool)
+            present[: len(self.present)] = self.present
+            self.present = present
+        return self.amounts
+
+    def _present(self) -> np.ndarray:
+        """Return the mask of species this mixture holds."""
+        self._vector()
+        return self.present
+
+    def _readable(self, idx: int) -> bool:
+        return bool(self._present()[idx])
+
+    def _mark(self, idx: Any, flag: bool) -> None:
+        self._present()[idx] = flag
+
+    def _changed(self) -> None:
+        """Hook called after the amounts vector was modified in place."""
+
+    @property
+    def composition(self) -> _CompositionView:
+        return _CompositionView(self)
+
+    @composition.setter
+    def composition(self, values: Dict[str, float]) -> None:
+        for gas in values:
+            register_gas(gas)
+        vector = self._vector()
+        vector[:] = 0.0
+        self._mark(slice(None), False)
+        for gas, amount in values.items():
+            vector[GAS_INDEX[gas]] = amount
+            self._mark(GAS_INDEX[gas], True)
+        self._changed()
+
+    def copy(self) -> "GasMixture":
+        mixture = GasMixture.__new__(GasMixture)
+        mixture.pressure = self.pressure
+        mixture.temperature = self.temperature
+        mixture.amounts = self._vector().copy()
+        mixture.present = self._present().copy()
+        return mixture
+
     def add_gas(self, gas: str, amount: float) -> None:
-        self.composition[gas] = self.composition.get(gas, 0.0) + amount
+        idx = register_gas(gas)
+        self._vector()[idx] += amount
+        self._mark(idx, True)
+        self._changed()
 
     def remove_gas(self, gas: str, amount: float) -> float:
-        current = self.composition.get(gas, 0.0)
-        removed = min(current, amount)
+        idx = register_gas(gas)
+        vector = self._vector()
+        removed = min(float(vector[idx]), amount)
         if removed > 0:
-            self.composition[gas] = current - removed
+            vector[idx] -= removed
+            self._changed()
         return removed
 
     def mix(self, other: "GasMixture", ratio: float) -> None:
         """Mix another mixture into this one."""
         ratio = max(0.0, min(1.0, ratio))
-        for gas in set(self.composition) | set(other.composition):
-            a = self.composition.get(gas, 0.0)
-            b = other.composition.get(gas, 0.0)
-            self.composition[gas] = a * (1 - ratio) + b * ratio
+        mine = self._vector()
+        theirs = other._vector()
+        blend = _mix_buffer(len(mine))
+        np.multiply(theirs, ratio, out=blend)
+        mine *= 1 - ratio
+        mine += blend
+        if ratio > 0:
+            self._mark(other._present(), True)
+        self._changed()
         self.pressure = self.pressure * (1 - ratio) + other.pressure * ratio
         self.temperature = self.temperature * (1 - ratio) + other.temperature * ratio
 
@@ -64,19 +239,316 @@ class AtmosTile:
     gas: GasMixture = field(default_factory=GasMixture)
 
 
+class TileGas(GasMixture):
+    """:class:`GasMixture` view onto a single cell of an :class:`AtmosGrid`.
+
+    Reads and writes go straight to the grid arrays, so code written against
+    plain mixtures keeps working on grid tiles.
+    """
+
+    __slots__ = ("_grid", "_x", "_y", "_rx", "_ry")
+
+    def __init__(self, grid: "AtmosGrid", x: Any, y: Any) -> None:
+        self._grid = grid
+        # cells written to, and the cell read back from
+        self._x = x
+        self._y = y
+        self._rx = x
+        self._ry = y
+
+    def _touched(self) -> None:
+        self._grid.wake(self._x, self._y)
+
+    def _vector(self) -> np.ndarray:
+        self._grid.sync_species()
+        return self._grid.composition[:, self._rx, self._ry]
+
+    def _changed(self) -> None:
+        self._touched()
+
+    def _present(self) -> np.ndarray:
+        # grid cells keep no key set, so a species is held while nonzero
+        return self._vector() != 0
+
+    def _readable(self, idx: int) -> bool:
+        # every registered species has a grid layer, so reads never fail
+        return True
+
+    def _mark(self, idx: Any, flag: bool) -> None:
+        pass
+
+    @property
+    def amounts(self) -> np.ndarray:  # type: ignore[override]
+        return self._vector()
+
+    @property
+    def pressure(self) -> float:  # type: ignore[override]
+        return float(self._grid.pressure[self._rx, self._ry])
+
+    @pressure.setter
+    def pressure(self, value: float) -> None:
+        self._grid.pressure[self._x, self._y] = value
+        self._touched()
+
+    @property
+    def temperature(self) -> float:  # type: ignore[override]
+        return float(self._grid.temperature[self._rx, self._ry])
+
+    @temperature.setter
+    def temperature(self, value: float) -> None:
+        self._grid.temperature[self._x, self._y] = value
+        self._touched()
+
+
+class ZoneGas(TileGas):
+    """Single :class:`GasMixture` shared by every tile of an :class:`AtmosZone`.
+
+    Writes apply to the whole zone at once and keep it merged.  Only the
+    zone's edge tiles are woken, since its interior stays uniform.
+    """
+
+    __slots__ = ("_edge",)
+
+    def __init__(
+        self,
+        grid: "AtmosGrid",
+        xs: np.ndarray,
+        ys: np.ndarray,
+        edge: Tuple[np.ndarray, np.ndarray],
+    ) -> None:
+        super().__init__(grid, xs, ys)
+        self._rx = int(xs[0])
+        self._ry = int(ys[0])
+        self._edge = edge
+
+    def _touched(self) -> None:
+        self._grid._activate(*self._edge)
+
+    def _changed(self) -> None:
+        # the vector edited in place belongs to the zone's first tile only
+        vector = self._grid.composition[:, self._rx, self._ry]
+        self._grid.composition[:, self._x, self._y] = vector[:, None]
+        self._touched()
+
+
+@dataclass
+class AtmosZone:
+    """Contiguous equalized tiles simulated as one cell.
+
+    ``edge_xs``/``edge_ys`` are the member tiles next to a passable tile
+    outside the zone, the only places the zone exchanges gas.
+    """
+
+    zone_id: int
+    xs: np.ndarray
+    ys: np.ndarray
+    gas: GasMixture
+    edge_xs: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.intp))
+    edge_ys: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.intp))
+
+    @property
+    def size(self) -> int:
+        return len(self.xs)
+
+
+def _union_find(count: int, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Return a root label for each of ``count`` nodes joined by edges ``a-b``.
+
+    Vectorized union-find: roots are hooked onto the smaller root across
+    every edge, then paths are compressed by pointer jumping, until no edge
+    joins two different roots.
+    """
+    labels = np.arange(count)
+    while True:
+        la = labels[a]
+        lb = labels[b]
+        differ = la != lb
+        if not differ.any():
+            return labels
+        hi = np.maximum(la[differ], lb[differ])
+        lo = np.minimum(la[differ], lb[differ])
+        np.minimum.at(labels, hi, lo)
+        while True:
+            jumped = labels[labels]
+            if (jumped == labels).all():
+                break
+            labels = jumped
+
+
+def exchange(
+    pressure: np.ndarray,
+    temperature: np.ndarray,
+    composition: np.ndarray,
+    blocked: np.ndarray,
+    xs: slice,
+    ys: slice,
+    rate: float,
+    skip: Optional[Tuple[slice, slice]] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return pressure, temperature and composition of ``[xs, ys]`` after
+    one exchange step between neighbouring tiles of that box.
+
+    Edges with both ends inside the ``skip`` box are left alone.  Every
+    operation is elementwise, and a cell's result depends only on cells up
+    to two tiles away, so any sub-box computed with a two tile margin
+    reproduces the whole-box result exactly.
+    """
+    p = pressure[xs, ys]
+
+    # flows along x (east/west) and y (south/north) between neighbours
+    blocked = blocked[xs, ys]
+    if skip is not None:
+        inner = np.zeros(p.shape, dtype=bool)
+        inner[
+            max(skip[0].start - xs.start, 0) : max(skip[0].stop - xs.start, 0),
+            max(skip[1].start - ys.start, 0) : max(skip[1].stop - ys.start, 0),
+        ] = True
+        open_x = ~(blocked[:-1, :] | blocked[1:, :] | (inner[:-1, :] & inner[1:, :]))
+        open_y = ~(blocked[:, :-1] | blocked[:, 1:] | (inner[:, :-1] & inner[:, 1:]))
+    else:
+        open_x = ~(blocked[:-1, :] | blocked[1:, :])
+        open_y = ~(blocked[:, :-1] | blocked[:, 1:])
+    dx = (p[:-1, :] - p[1:, :]) * open_x
+    dy = (p[:, :-1] - p[:, 1:]) * open_y
+    east = np.clip(dx, 0.0, None) * rate
+    west = np.clip(-dx, 0.0, None) * rate
+    south = np.clip(dy, 0.0, None) * rate
+    north = np.clip(-dy, 0.0, None) * rate
+
+    out = np.zeros_like(p)
+    out[:-1, :] += east
+    out[1:, :] += west
+    out[:, :-1] += south
+    out[:, 1:] += north
+
+    # never send more gas than the tile holds
+    over = out > p
+    if over.any():
+        scale = np.ones_like(p)
+        scale[over] = p[over] / out[over]
+        east *= scale[:-1, :]
+        west *= scale[1:, :]
+        south *= scale[:, :-1]
+        north *= scale[:, 1:]
+        out = np.minimum(out, p)
+
+    def inflow(q: np.ndarray) -> np.ndarray:
+        """Sum of incoming flows weighted by the sender's value of ``q``."""
+        acc = np.zeros(q.shape)
+        acc[..., 1:, :] += east * q[..., :-1, :]
+        acc[..., :-1, :] += west * q[..., 1:, :]
+        acc[..., :, 1:] += south * q[..., :, :-1]
+        acc[..., :, :-1] += north * q[..., :, 1:]
+        return acc
+
+    temperature = temperature[xs, ys]
+    composition = composition[:, xs, ys]
+    new_p = p - out + inflow(np.ones_like(p))
+    kept = p - out
+    safe = np.where(new_p > 0, new_p, 1.0)
+    moved = new_p > 0
+    temp = (temperature * kept + inflow(temperature)) / safe
+    comp = (composition * kept + inflow(composition)) / safe
+    return (
+        new_p,
+        np.where(moved, temp, temperature),
+        np.where(moved, comp, composition),
+    )
+
+
+class _TileMap(Mapping):
+    """Read-only mapping of ``(x, y)`` to lazily created tile views."""
+
+    def __init__(self, grid: "AtmosGrid") -> None:
+        self._grid = grid
+
+    def __getitem__(self, key: Tuple[int, int]) -> AtmosTile:
+        tile = self._grid.get_tile(*key)
+        if tile is None:
+            raise KeyError(key)
+        return tile
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        for x in range(self._grid.width):
+            for y in range(self._grid.height):
+                yield (x, y)
+
+    def __len__(self) -> int:
+        return self._grid.width * self._grid.height
+
+
 class AtmosGrid:
-    """Tile-based grid for atmospheric simulation."""
+    """Tile-based grid for atmospheric simulation.
+
+    Pressure, temperature and each gas are stored as NumPy arrays indexed
+    ``[x, y]`` (composition is ``[gas, x, y]``).  Tiles returned by
+    :meth:`get_tile` are views, so edits through ``tile.gas`` update the
+    arrays directly and wake the tile.  Code that writes the arrays itself
+    should call :meth:`wake` or :meth:`wake_all`.
+    """
 
-    def __init__(self, width: int, height: int) -> None:
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        epsilon: float = 1e-3,
+        stability_limit: float = 20.0,
+        merge_interval: int = 50,
+    ) -> None:
         self.width = width
         self.height = height
-        self.tiles: Dict[Tuple[int, int], AtmosTile] = {}
-        for x in range(width):
-            for y in range(height):
-                self.tiles[(x, y)] = AtmosTile(x, y)
+        self.epsilon = epsilon
+        # neighbour pressure differences above this are sub-stepped
+        self.stability_limit = stability_limit
+        default = GasMixture()
+        self.pressure = np.full((width, height), default.pressure)
+        self.temperature = np.full((width, height), default.temperature)
+        self.composition = np.empty((len(default.amounts), width, height))
+        self.composition[:] = default.amounts[:, None, None]
+        self.gas_index: Dict[str, int] = dict(GAS_INDEX)
+        self._views: Dict[Tuple[int, int], AtmosTile] = {}
+        self.tiles = _TileMap(self)
+        # tiles that may exchange gas next step; a uniform grid starts asleep
+        self.active = np.zeros((width, height), dtype=bool)
+        self.active_count = 0
+        # walls and closed doors; gas never flows into or out of them
+        self.blocked = np.zeros((width, height), dtype=bool)
+        # equalized regions sharing one mixture, see merge_zones()
+        self.zone_of = np.full((width, height), -1, dtype=np.int64)
+        self.zones: Dict[int, AtmosZone] = {}
+        self._next_zone = 0
+        # steps between merge_zones() calls once tiles settle; 0 disables
+        self.merge_interval = merge_interval
+        self._since_merge = 0
+        self._settled = False
+        # passable compartments, cached until set_passable() changes a wall
+        self.topology_version = 0
+        self._regions: Optional[Tuple[int, np.ndarray]] = None
+        self._region_tiles: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def ensure_gas(self, gas: str) -> int:
+        """Return the composition index of ``gas``, adding a layer if needed."""
+        idx = register_gas(gas)
+        self.sync_species()
+        return idx
+
+    def sync_species(self) -> None:
+        """Add empty composition layers for gases registered since creation."""
+        layers = len(self.composition)
+        if layers == len(GAS_SPECIES):
+            return
+        extra = np.zeros((len(GAS_SPECIES) - layers, self.width, self.height))
+        self.composition = np.concatenate([self.composition, extra])
+        self.gas_index = dict(GAS_INDEX)
 
     def get_tile(self, x: int, y: int) -> Optional[AtmosTile]:
-        return self.tiles.get((x, y))
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        tile = self._views.get((x, y))
+        if tile is None:
+            tile = AtmosTile(x, y, TileGas(self, x, y))
+            self._views[(x, y)] = tile
+        return tile
 
     def neighbours(self, tile: AtmosTile) -> Iterable[AtmosTile]:
         offsets = [(0, 1), (1, 0), (-1, 0), (0, -1)]
@@ -85,42 +557,418 @@ class AtmosGrid:
             if n:
                 yield n
 
+    def total_pressure(self) -> float:
+        """Return the summed pressure of every tile (the amount of gas)."""
+        return float(self.pressure.sum())
+
+    def total_gas(self, gas: str) -> float:
+        """Return the total amount of ``gas`` weighted by tile pressure."""
+        idx = self.gas_index.get(gas)
+        if idx is None:
+            return 0.0
+        return float((self.composition[idx] * self.pressure).sum())
+
+    def wake(self, x: int, y: int) -> None:
+        """Mark a tile active so it and its neighbours are simulated.
+
+        A tile that belonged to a zone was disturbed on its own, so the zone
+        is split back into individual tiles.
+        """
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return
+        zone_id = int(self.zone_of[x, y])
+        if zone_id >= 0:
+            self.split_zone(zone_id)
+        if not self.active[x, y]:
+            self.active[x, y] = True
+            self.active_count += 1
+
+    def wake_all(self) -> None:
+        """Mark every tile active, e.g. after writing the arrays directly."""
+        for zone_id in list(self.zones):
+            self.split_zone(zone_id)
+        self.active[:, :] = True
+        self.active_count = self.active.size
+
+    def wake_tiles(self, xs: np.ndarray, ys: np.ndarray) -> None:
+        """Vectorized :meth:`wake` for distinct cells ``(xs[i], ys[i])``."""
+        for zone_id in np.unique(self.zone_of[xs, ys]):
+            if zone_id >= 0:
+                self.split_zone(int(zone_id))
+        self._activate(xs, ys)
+
+    def _activate(self, xs: Any, ys: Any) -> None:
+        """Mark cells active without splitting the zones they belong to."""
+        self.active_count += int(np.count_nonzero(~self.active[xs, ys]))
+        self.active[xs, ys] = True
+
+    def set_passable(self, x: int, y: int, passable: bool) -> None:
+        """Open or close a tile to gas flow (walls, doors, breaches)."""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return
+        if self.blocked[x, y] != (not passable):
+            self.blocked[x, y] = not passable
+            self.topology_version += 1
+        self.wake(x, y)
+        # neighbouring zones stay uniform; they now exchange at this tile
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if 0 <= nx < self.width and 0 <= ny < self.height:
+                self._activate(nx, ny)
+
+    def regions(self) -> np.ndarray:
+        """Label each passable tile with its connected compartment.
+
+        Walls are labelled ``-1``.  The labelling is cached until
+        :meth:`set_passable` changes a tile, so code writing ``blocked``
+        directly should bump ``topology_version`` afterwards.
+        """
+        if self._regions is not None and self._regions[0] == self.topology_version:
+            return self._regions[1]
+        open_ = ~self.blocked
+        index = np.arange(self.width * self.height).reshape(self.width, self.height)
+        horiz = open_[:-1, :] & open_[1:, :]
+        vert = open_[:, :-1] & open_[:, 1:]
+        a = np.concatenate([index[:-1, :][horiz], index[:, :-1][vert]])
+        b = np.concatenate([index[1:, :][horiz], index[:, 1:][vert]])
+        labels = _union_find(index.size, a, b).reshape(self.width, self.height)
+        labels[self.blocked] = -1
+        self._regions = (self.topology_version, labels)
+        self._region_tiles = {}
+        return labels
+
+    def region_tiles(self, x: int, y: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the coordinates of every tile in ``(x, y)``'s compartment."""
+        labels = self.regions()
+        label = int(labels[x, y])
+        if label < 0:
+            return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp)
+        tiles = self._region_tiles.get(label)
+        if tiles is None:
+            tiles = np.nonzero(labels == label)
+            self._region_tiles[label] = tiles
+        return tiles
+
+    # ------------------------------------------------------------------
+    def merge_zones(self, min_size: int = 2) -> int:
+        """Merge contiguous equalized tiles into zones sharing one mixture.
+
+        Sleeping, passable tiles whose pressure, temperature and composition
+        match a neighbour within ``epsilon`` are joined with a union-find.
+        Each group of at least ``min_size`` tiles is set to its exact mean
+        mixture (so gas amounts are conserved) and becomes an
+        :class:`AtmosZone`.  Returns the number of zones.
+        """
+        for zone_id in list(self.zones):
+            self.split_zone(zone_id)
+        eligible = ~self.blocked & ~self.active
+        eps = self.epsilon
+
+        def close(a: Tuple[slice, slice], b: Tuple[slice, slice]) -> np.ndarray:
+            same = eligible[a] & eligible[b]
+            same &= np.abs(self.pressure[a] - self.pressure[b]) <= eps
+            same &= np.abs(self.temperature[a] - self.temperature[b]) <= eps
+            diff = np.abs(
+                self.composition[(slice(None),) + a]
+                - self.composition[(slice(None),) + b]
+            )
+            same &= (diff <= eps).all(axis=0)
+            return same
+
+        index = np.arange(self.width * self.height).reshape(self.width, self.height)
+        horiz = close((slice(None, -1), slice(None)), (slice(1, None), slice(None)))
+        vert = close((slice(None), slice(None, -1)), (slice(None), slice(1, None)))
+        a = np.concatenate([index[:-1, :][horiz], index[:, :-1][vert]])
+        b = np.concatenate([index[1:, :][horiz], index[:, 1:][vert]])
+        labels = _union_find(index.size, a, b)
+
+        cells = np.flatnonzero(eligible.ravel())
+        roots, group, counts = np.unique(
+            labels[cells], return_inverse=True, return_counts=True
+        )
+        keep = counts[group] >= max(min_size, 2)
+        cells, group = cells[keep], group[keep]
+        if not len(cells):
+            return 0
+        _, first, group = np.unique(group, return_index=True, return_inverse=True)
+
+        # set every member to the exact pressure-weighted mean of its group,
+        # taken as deviations from one member so uniform groups stay exact
+        xs, ys = np.unravel_index(cells, (self.width, self.height))
+        p = self.pressure[xs, ys]
+        total_p = np.bincount(group, weights=p)
+        sizes = np.bincount(group)
+        safe = np.where(total_p > 0, total_p, 1.0)
+
+        def mean(values: np.ndarray, weighted: bool = True) -> np.ndarray:
+            base = values[first]
+            dev = values - base[group]
+            if not weighted:
+                return base + np.bincount(group, weights=dev) / sizes
+            return base + np.bincount(group, weights=dev * p) / safe
+
+        self.temperature[xs, ys] = mean(self.temperature[xs, ys])[group]
+        for idx in range(len(self.composition)):
+            layer = self.composition[idx]
+            layer[xs, ys] = mean(layer[xs, ys])[group]
+        self.pressure[xs, ys] = mean(p, weighted=False)[group]
+
+        order = np.argsort(group, kind="stable")
+        bounds = np.flatnonzero(np.diff(group[order])) + 1
+        zone_ids = []
+        for members in np.split(order, bounds):
+            zone_id = self._next_zone
+            self._next_zone += 1
+            self.zone_of[xs[members], ys[members]] = zone_id
+            zone_ids.append((zone_id, members))
+
+        # member tiles with a passable neighbour outside their zone
+        edge = np.zeros((self.width, self.height), dtype=bool)
+        zone_of = self.zone_of
+        open_ = ~self.blocked
+        cross = (zone_of[:-1, :] != zone_of[1:, :]) & open_[:-1, :] & open_[1:, :]
+        edge[:-1, :] |= cross
+        edge[1:, :] |= cross
+        cross = (zone_of[:, :-1] != zone_of[:, 1:]) & open_[:, :-1] & open_[:, 1:]
+        edge[:, :-1] |= cross
+        edge[:, 1:] |= cross
+        for zone_id, members in zone_ids:
+            zx, zy = xs[members], ys[members]
+            on_edge = edge[zx, zy]
+            ex, ey = zx[on_edge], zy[on_edge]
+            gas = ZoneGas(self, zx, zy, (ex, ey))
+            self.zones[zone_id] = AtmosZone(zone_id, zx, zy, gas, ex, ey)
+        return len(self.zones)
+
+    def split_zone(self, zone_id: int) -> None:
+        """Dissolve a zone so its tiles are simulated individually again."""
+        zone = self.zones.pop(zone_id, None)
+        if zone is not None:
+            self.zone_of[zone.xs, zone.ys] = -1
+
+    def zone_at(self, x: int, y: int) -> Optional[AtmosZone]:
+        """Return the zone containing ``(x, y)``, if any."""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        return self.zones.get(int(self.zone_of[x, y]))
+
+    def active_tiles(self) -> List[Tuple[int, int]]:
+        """Return the coordinates of all active tiles."""
+        return [(int(x), int(y)) for x, y in zip(*np.nonzero(self.active))]
+
     def step(self, rate: float = 0.25) -> None:
-        """Advance the simulation one tick."""
-        exchanges: Dict[Tuple[int, int], GasMixture] = {}
-        for tile in self.tiles.values():
-            for nbr in self.neighbours(tile):
-                if tile.gas.pressure <= nbr.gas.pressure:
-                    continue
-                diff = tile.gas.pressure - nbr.gas.pressure
-                flow = diff * rate
-                if flow <= 0:
-                    continue
-                ratio = flow / tile.gas.pressure if tile.gas.pressure else 0
-                exchange = tile.gas.copy()
-                exchange.pressure = flow
-                tile.gas.pressure -= flow
-                for gas in exchange.composition:
-                    exchange.composition[gas] *= ratio
-                    tile.gas.composition[gas] -= exchange.composition[gas]
-                key = (nbr.x, nbr.y)
-                if key not in exchanges:
-                    exchanges[key] = exchange
-                else:
-                    # accumulate
-                    ex = exchanges[key]
-                    ex.mix(
-                        exchange, exchange.pressure / (ex.pressure + exchange.pressure)
-                    )
-                    ex.pressure += exchange.pressure
-        for key, mix in exchanges.items():
-            tile = self.tiles[key]
-            total = tile.gas.pressure + mix.pressure
-            if total == 0:
+        """Advance the simulation one tick.
+
+        Gas flows from every tile to each lower-pressure neighbour at
+        ``rate`` times the difference.  All flows are computed at once from
+        the current pressures and a tile never sends more than it holds.
+        Pressure and the pressure-weighted amount of each gas are conserved;
+        composition and temperature of the receiving tile become the
+        amount-weighted mix.
+
+        Active tiles are grouped by :data:`ACTIVE_BLOCK` sized blocks, and
+        only the bounding box of each cluster plus a one tile frontier is
+        simulated, so distant disturbances do not simulate the space
+        between them.  Tiles whose pressure matches every neighbour within
+        ``epsilon`` afterwards go back to sleep, so a settled grid costs
+        nothing to step.  Zones act as single cells: their interior never
+        wakes, and after exchanging gas at their edge they are set back to
+        their mean mixture.  Every ``merge_interval`` ticks after tiles
+        settled, :meth:`merge_zones` collects newly equalized tiles.
+
+        A tick is split into sub-steps no larger than :data:`STABLE_RATE`.
+        Tiles differing from a neighbour by more than ``stability_limit``
+        are sub-stepped further, at :data:`MONOTONE_RATE`, so sharp fronts
+        from breaches or pipe injections cannot overshoot; the rest of the
+        grid keeps the larger steps.
+        """
+        self._since_merge += 1
+        if self.active_count:
+            boxes = self._active_boxes()
+            fine = math.ceil(rate / MONOTONE_RATE - 1e-9)
+            coarse = math.ceil(rate / STABLE_RATE - 1e-9)
+            for box in boxes:
+                stiff = None
+                if fine > 1:
+                    stiff = self._stiff_region(*box)
+                if stiff is not None:
+                    for _ in range(fine):
+                        self._step_region(*stiff, rate / fine)
+                for _ in range(coarse):
+                    self._step_region(*box, rate / coarse, skip=stiff)
+            self._equalize_zones(boxes)
+            before = self.active_count
+            for xs, ys in boxes:
+                self._settle(
+                    slice(max(xs.start - 1, 0), min(xs.stop + 1, self.width)),
+                    slice(max(ys.start - 1, 0), min(ys.stop + 1, self.height)),
+                )
+            self._settled |= self.active_count < before
+        if (
+            self.merge_interval
+            and self._settled
+            and self._since_merge >= self.merge_interval
+        ):
+            self.merge_zones()
+            self._since_merge = 0
+            self._settled = False
+
+    def _active_boxes(self) -> List[Tuple[slice, slice]]:
+        """Return disjoint boxes covering every active tile and its frontier.
+
+        Active blocks touching each other (diagonally included) form one
+        cluster.  Each cluster's box is the bounding box of its active tiles
+        grown by one tile, and boxes that would touch are merged, so no
+        edge between two boxes is skipped.
+        """
+        size = ACTIVE_BLOCK
+        bw = -(-self.width // size)
+        bh = -(-self.height // size)
+        padded = np.zeros((bw * size, bh * size), dtype=bool)
+        padded[: self.width, : self.height] = self.active
+        blocks = padded.reshape(bw, size, bh, size).any(axis=(1, 3))
+
+        index = np.arange(bw * bh).reshape(bw, bh)
+        pairs = []
+        for a, b in (
+            ((slice(None, -1), slice(None)), (slice(1, None), slice(None))),
+            ((slice(None), slice(None, -1)), (slice(None), slice(1, None))),
+            ((slice(None, -1), slice(None, -1)), (slice(1, None), slice(1, None))),
+            ((slice(None, -1), slice(1, None)), (slice(1, None), slice(None, -1))),
+        ):
+            both = blocks[a] & blocks[b]
+            pairs.append((index[a][both], index[b][both]))
+        labels = _union_find(
+            index.size,
+            np.concatenate([p[0] for p in pairs]),
+            np.concatenate([p[1] for p in pairs]),
+        ).reshape(bw, bh)
+
+        xs, ys = np.nonzero(self.active)
+        _, group = np.unique(labels[xs // size, ys // size], return_inverse=True)
+        count = int(group.max()) + 1
+        x0 = np.full(count, self.width)
+        y0 = np.full(count, self.height)
+        x1 = np.zeros(count, dtype=np.intp)
+        y1 = np.zeros(count, dtype=np.intp)
+        np.minimum.at(x0, group, xs)
+        np.minimum.at(y0, group, ys)
+        np.maximum.at(x1, group, xs)
+        np.maximum.at(y1, group, ys)
+        boxes = [
+            [
+                max(a - 1, 0),
+                min(b + 2, self.width),
+                max(c - 1, 0),
+                min(d + 2, self.height),
+            ]
+            for a, b, c, d in zip(x0.tolist(), x1.tolist(), y0.tolist(), y1.tolist())
+        ]
+
+        merged = True
+        while merged and len(boxes) > 1:
+            merged = False
+            for i in range(len(boxes)):
+                for j in range(i + 1, len(boxes)):
+                    a, b = boxes[i], boxes[j]
+                    if a[0] <= b[1] and b[0] <= a[1] and a[2] <= b[3] and b[2] <= a[3]:
+                        boxes[i] = [
+                            min(a[0], b[0]),
+                            max(a[1], b[1]),
+                            min(a[2], b[2]),
+                            max(a[3], b[3]),
+                        ]
+                        del boxes[j]
+                        merged = True
+                        break
+                if merged:
+                    break
+        return [(slice(a, b), slice(c, d)) for a, b, c, d in boxes]
+
+    def _equalize_zones(self, boxes: List[Tuple[slice, slice]]) -> None:
+        """Spread gas a zone exchanged at its edge evenly over the zone."""
+        touched = set()
+        for xs, ys in boxes:
+            touched.update(np.unique(self.zone_of[xs, ys]).tolist())
+        for zone_id in touched:
+            zone = self.zones.get(zone_id)
+            if zone is None:
                 continue
-            ratio = mix.pressure / total
-            tile.gas.mix(mix, ratio)
-            tile.gas.pressure = total
+            zx, zy = zone.xs, zone.ys
+            p = self.pressure[zx, zy]
+            total = float(p.sum())
+            safe = total if total > 0 else 1.0
+            # deviations from the first tile keep untouched zones exact
+            temp = self.temperature[zx, zy]
+            self.temperature[zx, zy] = temp[0] + ((temp - temp[0]) * p).sum() / safe
+            comp = self.composition[:, zx, zy]
+            dev = ((comp - comp[:, :1]) * p).sum(axis=1) / safe
+            self.composition[:, zx, zy] = (comp[:, 0] + dev)[:, None]
+            self.pressure[zx, zy] = p[0] + (p - p[0]).sum() / len(zx)
+
+    def _stiff_region(self, xs: slice, ys: slice) -> Optional[Tuple[slice, slice]]:
+        """Return the box of tiles in ``[xs, ys]`` with steep gradients.
+
+        The box is padded by one tile (within ``[xs, ys]``), so every edge
+        leaving it joins two tiles below ``stability_limit``.
+        """
+        steep = self._differs(xs, ys, self.stability_limit)
+        if not steep.any():
+            return None
+        sx = np.flatnonzero(steep.any(axis=1))
+        sy = np.flatnonzero(steep.any(axis=0))
+        return (
+            slice(xs.start + max(int(sx[0]) - 1, 0), xs.start + int(sx[-1]) + 2),
+            slice(ys.start + max(int(sy[0]) - 1, 0), ys.start + int(sy[-1]) + 2),
+        )
+
+    def _step_region(
+        self,
+        xs: slice,
+        ys: slice,
+        rate: float,
+        skip: Optional[Tuple[slice, slice]] = None,
+    ) -> None:
+        """Exchange gas between neighbouring tiles inside ``[xs, ys]``.
+
+        Edges with both ends inside the ``skip`` box are left alone; they
+        were already integrated by the caller.
+        """
+        if xs.start >= xs.stop or ys.start >= ys.stop:
+            return
+        pressure, temperature, composition = exchange(
+            self.pressure,
+            self.temperature,
+            self.composition,
+            self.blocked,
+            xs,
+            ys,
+            rate,
+            skip,
+        )
+        self.temperature[xs, ys] = temperature
+        self.composition[:, xs, ys] = composition
+        self.pressure[xs, ys] = pressure
+
+    def _differs(self, xs: slice, ys: slice, threshold: float) -> np.ndarray:
+        """Mask of tiles in ``[xs, ys]`` differing from an open neighbour."""
+        p = self.pressure[xs, ys]
+        blocked = self.blocked[xs, ys]
+        dx = np.abs(p[:-1, :] - p[1:, :]) > threshold
+        dy = np.abs(p[:, :-1] - p[:, 1:]) > threshold
+        dx &= ~(blocked[:-1, :] | blocked[1:, :])
+        dy &= ~(blocked[:, :-1] | blocked[:, 1:])
+        busy = np.zeros(p.shape, dtype=bool)
+        busy[:-1, :] |= dx
+        busy[1:, :] |= dx
+        busy[:, :-1] |= dy
+        busy[:, 1:] |= dy
+        return busy
+
+    def _settle(self, xs: slice, ys: slice) -> None:
+        """Recompute which tiles in ``[xs, ys]`` still differ from a neighbour."""
+        busy = self._differs(xs, ys, self.epsilon)
+        self.active_count += int(busy.sum()) - int(self.active[xs, ys].sum())
+        self.active[xs, ys] = busy
 
     def explosive_decompress(self, src: Tuple[int, int], dst: Tuple[int, int]) -> float:
         """Instantly equalize pressure between two tiles and return pressure wave magnitude."""
@@ -143,39 +991,168 @@ class Pipe:
     dst: Tuple[int, int]
     rate: float = 1.0
     active: bool = True
+    manifold: Optional[str] = None
 
 
 class PipeNetwork:
-    """Simple network of pipes for moving gas."""
+    """Network of pumped pipes moving gas between grid tiles.
+
+    Pipes are compiled into an edge list (a sparse incidence matrix) over
+    the tiles they touch plus one node per manifold.  Each step computes
+    every flow at once from the pressures at the start of the tick, so the
+    result does not depend on the order pipes were added.  A pipe moves up
+    to ``rate`` per tick; a tile feeding several pipes shares what it holds
+    between them in proportion to their rates.
+
+    Pipes given the same ``manifold`` name pump into and out of one shared
+    mixture instead of linking their tiles directly, so a large piping
+    layout is a single node.  Call :meth:`set_active` rather than editing
+    ``Pipe.active`` so the network is recompiled.
+    """
 
     def __init__(self, grid: AtmosGrid) -> None:
         self.grid = grid
         self.pipes: Dict[Tuple[int, int, int, int], Pipe] = {}
+        # contents of each manifold, one column per manifold
+        self.manifold_index: Dict[str, int] = {}
+        self.manifold_pressure = np.zeros(0)
+        self.manifold_temperature = np.zeros(0)
+        self.manifold_composition = np.zeros((len(GAS_SPECIES), 0))
+        self._compiled: Optional[Tuple[np.ndarray, ...]] = None
 
     def add_pipe(
-        self, src: Tuple[int, int], dst: Tuple[int, int], rate: float = 1.0
+        self,
+        src: Tuple[int, int],
+        dst: Tuple[int, int],
+        rate: float = 1.0,
+        manifold: Optional[str] = None,
     ) -> None:
-        self.pipes[(src[0], src[1], dst[0], dst[1])] = Pipe(src, dst, rate)
+        self.pipes[(src[0], src[1], dst[0], dst[1])] = Pipe(
+            src, dst, rate, manifold=manifold
+        )
+        if manifold is not None and manifold not in self.manifold_index:
+            self.manifold_index[manifold] = len(self.manifold_index)
+            self.manifold_pressure = np.append(self.manifold_pressure, 0.0)
+            self.manifold_temperature = np.append(self.manifold_temperature, 20.0)
+            self.manifold_composition = np.hstack(
+                [
+                    self.manifold_composition,
+                    np.zeros((len(self.manifold_composition), 1)),
+                ]
+            )
+        self._compiled = None
 
-    def step(self) -> None:
+    def set_active(
+        self, src: Tuple[int, int], dst: Tuple[int, int], active: bool
+    ) -> bool:
+        """Switch the pipe from ``src`` to ``dst`` on or off."""
+        pipe = self.pipes.get((src[0], src[1], dst[0], dst[1]))
+        if pipe is None:
+            return False
+        pipe.active = active
+        self._compiled = None
+        return True
+
+    def manifold(self, name: str) -> GasMixture:
+        """Return a copy of the mixture held by manifold ``name``."""
+        idx = self.manifold_index[name]
+        self._sync_species()
+        mixture = GasMixture.__new__(GasMixture)
+        mixture.pressure = float(self.manifold_pressure[idx])
+        mixture.temperature = float(self.manifold_temperature[idx])
+        mixture.amounts = self.manifold_composition[:, idx].copy()
+        mixture.present = mixture.amounts != 0
+        return mixture
+
+    def _sync_species(self) -> None:
+        missing = len(GAS_SPECIES) - len(self.manifold_composition)
+        if missing:
+            extra = np.zeros((missing, len(self.manifold_index)))
+            self.manifold_composition = np.vstack([self.manifold_composition, extra])
+
+    def _compile(self) -> Tuple[np.ndarray, ...]:
+        """Build the edge list and the set of tiles the pipes touch."""
+        width, height = self.grid.width, self.grid.height
+        ends: List[Tuple[int, Any, float]] = []
         for pipe in self.pipes.values():
             if not pipe.active:
                 continue
-            src_tile = self.grid.get_tile(*pipe.src)
-            dst_tile = self.grid.get_tile(*pipe.dst)
-            if not src_tile or not dst_tile:
+            if not all(
+                0 <= x < width and 0 <= y < height for x, y in (pipe.src, pipe.dst)
+            ):
                 continue
-            flow = min(pipe.rate, src_tile.gas.pressure)
-            if flow <= 0:
-                continue
-            ratio = flow / src_tile.gas.pressure if src_tile.gas.pressure else 0
-            transfer = src_tile.gas.copy()
-            transfer.pressure = flow
-            for gas in transfer.composition:
-                transfer.composition[gas] *= ratio
-                src_tile.gas.composition[gas] -= transfer.composition[gas]
-            src_tile.gas.pressure -= flow
-            total = dst_tile.gas.pressure + flow
-            mix_ratio = flow / total if total else 0
-            dst_tile.gas.mix(transfer, mix_ratio)
-            dst_tile.gas.pressure = total
+            src = pipe.src[0] * height + pipe.src[1]
+            dst = pipe.dst[0] * height + pipe.dst[1]
+            if pipe.manifold is None:
+                ends.append((src, dst, pipe.rate))
+            else:
+                node = ("manifold", self.manifold_index[pipe.manifold])
+                ends.append((src, node, pipe.rate))
+                ends.append((node, dst, pipe.rate))
+
+        cells = np.unique(
+            [end for edge in ends for end in edge[:2] if not isinstance(end, tuple)]
+        ).astype(np.intp)
+        local = {int(cell): i for i, cell in enumerate(cells)}
+
+        def node(end: Any) -> int:
+            if isinstance(end, tuple):
+                return len(cells) + end[1]
+            return local[end]
+
+        src = np.array([node(e[0]) for e in ends], dtype=np.intp)
+        dst = np.array([node(e[1]) for e in ends], dtype=np.intp)
+        rate = np.array([e[2] for e in ends], dtype=float)
+        self._compiled = (cells, src, dst, rate)
+        return self._compiled
+
+    def step(self) -> None:
+        cells, src, dst, rate = self._compiled or self._compile()
+        if not len(rate):
+            return
+        grid = self.grid
+        grid.sync_species()
+        self._sync_species()
+        tiles = len(cells)
+        nodes = tiles + len(self.manifold_index)
+
+        flat_p = grid.pressure.reshape(-1)
+        flat_t = grid.temperature.reshape(-1)
+        flat_c = grid.composition.reshape(len(grid.composition), -1)
+        p = np.concatenate([flat_p[cells], self.manifold_pressure])
+        t = np.concatenate([flat_t[cells], self.manifold_temperature])
+        c = np.concatenate([flat_c[:, cells], self.manifold_composition], axis=1)
+
+        # share each sender's gas between its pipes when it cannot fill all
+        wanted = np.bincount(src, rate, nodes)
+        short = wanted > p
+        scale = np.ones(nodes)
+        scale[short] = p[short] / wanted[short]
+        flow = rate * scale[src]
+
+        out = np.bincount(src, flow, nodes)
+        # a drained sender may round a hair below zero
+        kept = np.maximum(p - out, 0.0)
+        new_p = kept + np.bincount(dst, flow, nodes)
+        moved = new_p > 0
+        safe = np.where(moved, new_p, 1.0)
+        new_t = (t * kept + np.bincount(dst, flow * t[src], nodes)) / safe
+        new_c = np.empty_like(c)
+        for gas in range(len(c)):
+            layer = c[gas]
+            new_c[gas] = (
+                layer * kept + np.bincount(dst, flow * layer[src], nodes)
+            ) / safe
+        new_t = np.where(moved, new_t, t)
+        new_c = np.where(moved, new_c, c)
+
+        flat_p[cells] = new_p[:tiles]
+        flat_t[cells] = new_t[:tiles]
+        flat_c[:, cells] = new_c[:, :tiles]
+        self.manifold_pressure = new_p[tiles:]
+        self.manifold_temperature = new_t[tiles:]
+        self.manifold_composition = new_c[:, tiles:]
+
+        touched = cells[(out[:tiles] > 0) | (new_p[:tiles] != p[:tiles])]
+        if len(touched):
+            grid.wake_tiles(touched // grid.height, touched % grid.height)
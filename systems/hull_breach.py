@@ -1,22 +1,186 @@
-from typing import Tuple
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
+
+import numpy as np
+
 from events import publish
 from .gas_sim import AtmosGrid
 
+# Share of a reached tile's pressure lost to space each tick
+VENT_FRACTION = 0.35
+# Rings of tiles the pressure wave travels per tick
+WAVE_SPEED = 4
+# Venting ends once no reached tile loses more than this in a tick
+VENT_DONE = 0.5
+
+
+def _dilate(mask: np.ndarray) -> np.ndarray:
+    grown = mask.copy()
+    grown[1:, :] |= mask[:-1, :]
+    grown[:-1, :] |= mask[1:, :]
+    grown[:, 1:] |= mask[:, :-1]
+    grown[:, :-1] |= mask[:, 1:]
+    return grown
+
+
+@dataclass
+class Decompression:
+    """A breached compartment venting to space over several ticks.
+
+    ``distance`` holds, inside the compartment's bounding ``box``, how many
+    rings from the breach the pressure wave found each tile (``-1`` while
+    not yet reached).  ``xs``/``ys``, ``throw`` and ``pressure_wave``
+    describe the tiles vented in the latest tick: ``throw`` points toward
+    the breach scaled by the pressure each tile lost, ``pressure_wave``
+    is the initial wave attenuated by distance.
+    """
+
+    interior: Tuple[int, int]
+    exterior: Tuple[int, int]
+    wave: float
+    box: Tuple[slice, slice]
+    region: np.ndarray
+    distance: np.ndarray
+    front: np.ndarray
+    topology_version: int
+    rings: int = 0
+    xs: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.intp))
+    ys: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.intp))
+    throw: np.ndarray = field(default_factory=lambda: np.zeros((0, 2)))
+    pressure_wave: np.ndarray = field(default_factory=lambda: np.zeros(0))
+
 
 class HullBreachSystem:
-    """Handle hull breaches causing rapid decompression."""
+    """Handle hull breaches causing rapid decompression.
+
+    A breach equalizes the two tiles at once, then vents the whole
+    connected compartment to space over the following ticks.  The
+    compartment comes from :meth:`AtmosGrid.regions`, which is cached until
+    a wall or door changes, and the pressure wave spreads ``WAVE_SPEED``
+    rings per tick so a large breach never costs one big tick.
+    """
 
     def __init__(self, grid: AtmosGrid) -> None:
         self.grid = grid
+        self.vents: Dict[Tuple[int, int], Decompression] = {}
 
     def breach(self, interior: Tuple[int, int], exterior: Tuple[int, int]) -> float:
         """Simulate a hull breach between two tiles."""
         diff = self.grid.explosive_decompress(interior, exterior)
-        if diff:
-            publish(
-                "hull_breach",
-                interior=interior,
-                exterior=exterior,
-                pressure_wave=diff,
-            )
+        if not diff:
+            # no pressure difference, so nothing vents
+            return diff
+        publish(
+            "hull_breach",
+            interior=interior,
+            exterior=exterior,
+            pressure_wave=diff,
+        )
+        vent = self._start(interior, exterior, diff)
+        if vent is not None:
+            self.vents[interior] = vent
         return diff
+
+    def seal(self, interior: Tuple[int, int]) -> bool:
+        """Stop the compartment breached at ``interior`` from venting."""
+        return self.vents.pop(interior, None) is not None
+
+    def _start(
+        self, interior: Tuple[int, int], exterior: Tuple[int, int], wave: float
+    ) -> "Decompression | None":
+        x, y = interior
+        xs, ys = self.grid.region_tiles(x, y)
+        if not len(xs):
+            return None
+        box = (
+            slice(int(xs.min()), int(xs.max()) + 1),
+            slice(int(ys.min()), int(ys.max()) + 1),
+        )
+        region = np.zeros(
+            (box[0].stop - box[0].start, box[1].stop - box[1].start), bool
+        )
+        region[xs - box[0].start, ys - box[1].start] = True
+        distance = np.full(region.shape, -1, dtype=np.int64)
+        front = np.zeros(region.shape, dtype=bool)
+        distance[x - box[0].start, y - box[1].start] = 0
+        front[x - box[0].start, y - box[1].start] = True
+        return Decompression(
+            interior,
+            exterior,
+            wave,
+            box,
+            region,
+            distance,
+            front,
+            self.grid.topology_version,
+        )
+
+    def _refresh(self, vent: Decompression) -> "Decompression | None":
+        """Re-fit ``vent`` to its compartment after a wall or door changed."""
+        fresh = self._start(vent.interior, vent.exterior, vent.wave)
+        if fresh is None:
+            return None
+        # carry over how far the wave already got
+        old_x, old_y = np.nonzero(vent.distance >= 0)
+        gx = old_x + vent.box[0].start
+        gy = old_y + vent.box[1].start
+        lx = gx - fresh.box[0].start
+        ly = gy - fresh.box[1].start
+        inside = (
+            (lx >= 0)
+            & (lx < fresh.region.shape[0])
+            & (ly >= 0)
+            & (ly < fresh.region.shape[1])
+        )
+        lx, ly = lx[inside], ly[inside]
+        keep = fresh.region[lx, ly]
+        lx, ly = lx[keep], ly[keep]
+        fresh.distance[lx, ly] = vent.distance[old_x[inside][keep], old_y[inside][keep]]
+        reached = fresh.distance >= 0
+        fresh.front = reached & _dilate(~reached & fresh.region)
+        fresh.rings = vent.rings
+        return fresh
+
+    def update(self) -> None:
+        """Advance every venting compartment by one tick."""
+        for interior, vent in list(self.vents.items()):
+            if vent.topology_version != self.grid.topology_version:
+                vent = self._refresh(vent)
+                if vent is None:
+                    del self.vents[interior]
+                    continue
+                self.vents[interior] = vent
+            if self._vent(vent):
+                del self.vents[interior]
+                publish("decompression_finished", interior=interior)
+
+    def _vent(self, vent: Decompression) -> bool:
+        """Vent one tick; return ``True`` once the compartment is empty."""
+        for _ in range(WAVE_SPEED):
+            if not vent.front.any():
+                break
+            grown = _dilate(vent.front) & vent.region & (vent.distance < 0)
+            vent.rings += 1
+            vent.distance[grown] = vent.rings
+            vent.front = grown
+
+        reached = vent.distance >= 0
+        lx, ly = np.nonzero(reached)
+        xs = lx + vent.box[0].start
+        ys = ly + vent.box[1].start
+        pressure = self.grid.pressure[xs, ys]
+        loss = np.clip(pressure, 0.0, None) * VENT_FRACTION
+        self.grid.pressure[xs, ys] = pressure - loss
+        lost = loss > 0
+        if lost.any():
+            self.grid.wake_tiles(xs[lost], ys[lost])
+
+        dx = (vent.interior[0] - xs).astype(float)
+        dy = (vent.interior[1] - ys).astype(float)
+        norm = np.hypot(dx, dy)
+        norm[norm == 0] = 1.0
+        vent.xs, vent.ys = xs, ys
+        vent.throw = np.stack([dx / norm * loss, dy / norm * loss], axis=1)
+        vent.pressure_wave = vent.wave / (1.0 + vent.distance[lx, ly])
+        publish("decompression", interior=vent.interior, vent=vent)
+        return not vent.front.any() and float(loss.max(initial=0.0)) < VENT_DONE
@@ -3,10 +3,11 @@ from __future__ import annotations
 """Simple NPC AI system."""
 
 import logging
-from typing import List
+from typing import Dict, Iterable, List, Optional
 
 from world import get_world
 from components.npc import NPCComponent
+from pathfinding import FlowField, get_routing_table
 
 logger = logging.getLogger(__name__)
 
@@ -30,9 +31,29 @@ class NPCSystem:
     def stop(self) -> None:
         pass
 
+    # ------------------------------------------------------------------
+    def converge(self, goal: str, npc_ids: Optional[Iterable[str]] = None) -> int:
+        """Send NPCs toward ``goal`` (e.g. the escape shuttle or the brig).
+
+        All NPCs are sent when ``npc_ids`` is omitted.  They share one flow
+        field on the next update.  Returns the number of NPCs redirected.
+        """
+        world = get_world()
+        count = 0
+        for oid in list(npc_ids if npc_ids is not None else self.npc_ids):
+            obj = world.get_object(oid)
+            comp = obj.get_component("npc") if obj else None
+            if not comp:
+                continue
+            comp.set_goal(goal)
+            count += 1
+        return count
+
     # ------------------------------------------------------------------
     def update(self) -> None:
         world = get_world()
+        routing = get_routing_table()
+        fields: Dict[str, FlowField] = {}
         for oid in list(self.npc_ids):
             obj = world.get_object(oid)
             if not obj:
@@ -41,7 +62,13 @@ class NPCSystem:
             comp: NPCComponent = obj.get_component("npc")
             if not comp:
                 continue
-            comp.step()
+            comp.next_routine_goal()
+            flow = None
+            if comp.goal:
+                flow = fields.get(comp.goal)
+                if flow is None or not flow.valid:
+                    flow = fields[comp.goal] = routing.flow_field(comp.goal)
+            comp.step(flow)
 
 
 _NPC_SYSTEM = NPCSystem()
@@ -1,7 +1,12 @@
 """Simplified physics helpers for structural damage and environment effects."""
 
+import time
+from collections import defaultdict, deque
 from dataclasses import dataclass
-from typing import Dict
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
 from events import subscribe
 from world import get_world
 
@@ -21,12 +26,47 @@ MATERIALS: Dict[str, Material] = {
     "glass": Material("glass", yield_strength=50.0, heat_resistance=500.0),
 }
 
+# Damage a destroyed structure deals to structures on each adjacent tile
+CASCADE_DAMAGE = 5
+# Destroyed structures whose cascade is processed per update
+CASCADE_BUDGET = 256
+
+_NEIGHBOURS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
 
 class PhysicsSystem:
-    """Apply environmental effects and propagate damage."""
+    """Apply environmental effects and propagate damage.
+
+    Destroyed structures are queued rather than damaging their neighbours
+    from inside the event handler.  Each :meth:`tick` works through the
+    queue in rounds, at most ``budget`` structures per call: each round sums
+    the damage landing on every tile and then applies it once per
+    structure, and anything that round destroys joins the queue.  A long
+    collapse therefore spreads over several ticks instead of recursing.
+    When ``grid`` is set, every tick also checks all structures against it.
+    """
 
-    def __init__(self) -> None:
+    def __init__(
+        self, budget: int = CASCADE_BUDGET, tick_interval: float = 1.0
+    ) -> None:
+        self.budget = budget
+        self.tick_interval = tick_interval
+        self.last_tick = 0.0
+        self.enabled = False
+        self.grid: Optional[Any] = None
+        self.pending: Deque[str] = deque()
+        self._queued: Set[str] = set()
+        # Positioned structures as parallel arrays for grid checks
+        self._index_dirty = True
+        self._bound_world: Any = None
+        self._comps: List[Any] = []
+        self._xs = np.zeros(0, dtype=np.intp)
+        self._ys = np.zeros(0, dtype=np.intp)
+        self._strength = np.zeros(0)
+        self._resistance = np.zeros(0)
         subscribe("structure_destroyed", self._on_structure_destroyed)
+        for evt in ("object_created", "object_destroyed", "object_moved_xy"):
+            subscribe(evt, self._on_objects_changed)
 
     def apply_environment(
         self, structure_id: str, pressure: float, temperature: float
@@ -40,22 +80,128 @@ class PhysicsSystem:
             return
         comp.apply_environment(pressure, temperature)
 
+    def apply_grid_environment(self, grid: Any) -> int:
+        """Check every positioned structure against an :class:`AtmosGrid`.
+
+        Pressure and temperature are read for all structures at once and
+        only the ones taking damage are touched.  Returns how many
+        structures were damaged.
+        """
+        comps, xs, ys = self._structures()
+        inside = np.flatnonzero(
+            (xs >= 0) & (xs < grid.width) & (ys >= 0) & (ys < grid.height)
+        )
+        pressure = grid.pressure[xs[inside], ys[inside]]
+        temperature = grid.temperature[xs[inside], ys[inside]]
+        strength = self._strength[inside]
+        resistance = self._resistance[inside]
+        # same truncation as StructureComponent.apply_environment
+        damage = np.where(
+            pressure > strength, (pressure - strength).astype(np.int64), 0
+        ) + np.where(
+            temperature > resistance,
+            ((temperature - resistance) / 10).astype(np.int64),
+            0,
+        )
+        hit = damage > 0
+        damaged = 0
+        for i, amount in zip(inside[hit].tolist(), damage[hit].tolist()):
+            comp = comps[i]
+            if comp.integrity > 0:
+                comp.damage(amount)
+                damaged += 1
+        return damaged
+
+    def _on_objects_changed(self, **_: Any) -> None:
+        self._index_dirty = True
+
+    def _structures(self) -> Tuple[List[Any], np.ndarray, np.ndarray]:
+        world = get_world()
+        if self._index_dirty or world is not self._bound_world:
+            self._bound_world = world
+            comps = []
+            xs = []
+            ys = []
+            for obj in world.objects.values():
+                comp = obj.get_component("structure")
+                if comp is None or obj.position is None:
+                    continue
+                comps.append(comp)
+                xs.append(obj.position[0])
+                ys.append(obj.position[1])
+            self._comps = comps
+            self._xs = np.array(xs, dtype=np.intp)
+            self._ys = np.array(ys, dtype=np.intp)
+            self._strength = np.array(
+                [c.material.yield_strength for c in comps], dtype=float
+            )
+            self._resistance = np.array(
+                [c.material.heat_resistance for c in comps], dtype=float
+            )
+            self._index_dirty = False
+        return self._comps, self._xs, self._ys
+
     def _on_structure_destroyed(self, structure_id: str | None, **_: Dict) -> None:
-        if not structure_id:
+        if not structure_id or structure_id in self._queued:
             return
-        world = get_world()
-        obj = world.get_object(structure_id)
-        if not obj or obj.position is None:
+        self._queued.add(structure_id)
+        self.pending.append(structure_id)
+
+    def start(self) -> None:
+        self.enabled = True
+        self.last_tick = time.time()
+
+    def stop(self) -> None:
+        self.enabled = False
+
+    def update(self) -> None:
+        if not self.enabled:
+            return
+        now = time.time()
+        if now - self.last_tick < self.tick_interval:
             return
-        x, y = obj.position
-        for nx, ny in [(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)]:
-            for oid in world.grid.objects_at(nx, ny):
-                neighbor = world.get_object(oid)
-                if not neighbor:
+        self.last_tick = now
+        self.tick()
+
+    def tick(self) -> int:
+        """Check ``grid`` if set, then propagate queued destructions.
+
+        Returns how many queued destructions were processed.
+        """
+        if self.grid is not None:
+            self.apply_grid_environment(self.grid)
+        return self.propagate()
+
+    def propagate(self) -> int:
+        """Propagate queued destructions; return how many were processed."""
+        world = get_world()
+        processed = 0
+        while self.pending and processed < self.budget:
+            batch = []
+            while self.pending and processed + len(batch) < self.budget:
+                structure_id = self.pending.popleft()
+                self._queued.discard(structure_id)
+                batch.append(structure_id)
+            processed += len(batch)
+
+            damage: Dict[Tuple[int, int], int] = defaultdict(int)
+            for structure_id in batch:
+                obj = world.get_object(structure_id)
+                if not obj or obj.position is None:
                     continue
-                comp = neighbor.get_component("structure")
-                if comp:
-                    comp.damage(5)
+                x, y = obj.position
+                for dx, dy in _NEIGHBOURS:
+                    damage[(x + dx, y + dy)] += CASCADE_DAMAGE
+            for (x, y), amount in damage.items():
+                for oid in world.grid.objects_at(x, y):
+                    neighbor = world.get_object(oid)
+                    if not neighbor:
+                        continue
+                    comp = neighbor.get_component("structure")
+                    # already-destroyed structures would only re-announce it
+                    if comp and comp.integrity > 0:
+                        comp.damage(amount)
+        return processed
 
 
 PHYSICS_SYSTEM = PhysicsSystem()
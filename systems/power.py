@@ -3,15 +3,32 @@ Power system for MUDpy SS13.
 Handles power grids, generators, and power failures.
 """
 
+import bisect
 import logging
-from typing import Dict, List, Any, Optional, Set
+from typing import Dict, List, Any, Optional, Set, Tuple
 import random
 import time
+
+import numpy as np
+
 from events import subscribe, publish
 import world
+from .power_telemetry import PowerTelemetry
 
 logger = logging.getLogger(__name__)
 
+# Device tables on PowerSystem that are also indexed by grid_id
+DEVICE_KINDS = ("generators", "solar_panels", "batteries", "smes_units", "consumers")
+# Kinds of link in the electrical network
+LINK_KINDS = ("cable", "apc", "breaker")
+# Grid load (%) boundaries; clients are told when a room changes band
+LOAD_BANDS = (25.0, 50.0, 75.0, 100.0)
+
+
+def load_band(load: float) -> int:
+    """Return the index of the ``LOAD_BANDS`` band ``load`` falls in."""
+    return bisect.bisect_left(LOAD_BANDS, load)
+
 
 class PowerGrid:
     """
@@ -118,19 +135,159 @@ class PowerGrid:
             )
 
 
+class PowerNetwork:
+    """
+    Electrical network of cables, APCs and breakers between power grids.
+
+    Nodes are grid IDs (or any junction ID); links are stored like the
+    device tables, as dicts with ``kind``, ``a``, ``b`` and ``conducting``.
+    Grids joined by conducting links form a component that shares supply.
+    Components live in a union-find: a link that starts conducting is
+    merged in place, while one that stops conducting marks the structure
+    stale so it is rebuilt from the remaining links on the next query.
+    """
+
+    def __init__(self) -> None:
+        self.links: Dict[str, Dict[str, Any]] = {}
+        self.version = 0
+        self._parent: Dict[str, str] = {}
+        self._size: Dict[str, int] = {}
+        self._stale = False
+
+    def add_link(
+        self, link_id: str, kind: str, a: str, b: str, conducting: bool = True
+    ) -> None:
+        """
+        Add a link between two nodes, replacing any link with the same ID.
+
+        Args:
+            link_id (str): Unique identifier for the link.
+            kind (str): One of ``LINK_KINDS``.
+            a (str): First node (usually a grid ID).
+            b (str): Second node.
+            conducting (bool): Whether power flows across the link.
+        """
+        if kind not in LINK_KINDS:
+            raise ValueError(f"Unknown link kind: {kind}")
+        self.remove_link(link_id)
+        self.links[link_id] = {"kind": kind, "a": a, "b": b, "conducting": False}
+        self.set_conducting(link_id, conducting)
+
+    def remove_link(self, link_id: str) -> bool:
+        link = self.links.get(link_id)
+        if link is None:
+            return False
+        self.set_conducting(link_id, False)
+        del self.links[link_id]
+        return True
+
+    def set_conducting(self, link_id: str, conducting: bool) -> bool:
+        """
+        Open or close a link.
+
+        Returns:
+            bool: True if the link existed and its state changed.
+        """
+        link = self.links.get(link_id)
+        if link is None or link["conducting"] == conducting:
+            return False
+        link["conducting"] = conducting
+        if conducting:
+            if not self._stale:
+                self._union(link["a"], link["b"])
+        else:
+            # union-find cannot split; rebuild lazily
+            self._stale = True
+        self.version += 1
+        return True
+
+    def find(self, node: str) -> str:
+        """Return the representative node of ``node``'s component."""
+        if self._stale:
+            self._rebuild()
+        parent = self._parent
+        if node not in parent:
+            return node
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    def connected(self, a: str, b: str) -> bool:
+        return self.find(a) == self.find(b)
+
+    def balance(
+        self, supply: Dict[str, float], demand: Dict[str, float]
+    ) -> Dict[str, float]:
+        """
+        Pool supply and demand over each component in one pass.
+
+        Args:
+            supply (Dict[str, float]): Power generated on each grid.
+            demand (Dict[str, float]): Load drawn by each grid.
+
+        Returns:
+            Dict[str, float]: Power available to each grid in ``supply``:
+            its component's supply minus the other grids' demand, so every
+            grid of an overdrawn component sees itself overdrawn.
+        """
+        nodes = list(supply)
+        if not nodes:
+            return {}
+        roots = [self.find(node) for node in nodes]
+        _, label = np.unique(roots, return_inverse=True)
+        own = np.array([supply[node] for node in nodes], dtype=float)
+        load = np.array([demand.get(node, 0.0) for node in nodes], dtype=float)
+        size = np.bincount(label)
+        pooled = np.bincount(label, own)[label] - np.bincount(label, load)[label]
+        available = np.where(size[label] == 1, own, pooled + load)
+        return dict(zip(nodes, available.tolist()))
+
+    def _union(self, a: str, b: str) -> None:
+        for node in (a, b):
+            if node not in self._parent:
+                self._parent[node] = node
+                self._size[node] = 1
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return
+        if self._size[ra] < self._size[rb]:
+            ra, rb = rb, ra
+        self._parent[rb] = ra
+        self._size[ra] += self._size[rb]
+
+    def _rebuild(self) -> None:
+        self._stale = False
+        self._parent = {}
+        self._size = {}
+        for link in self.links.values():
+            if link["conducting"]:
+                self._union(link["a"], link["b"])
+
+
 class PowerSystem:
     """
     System that manages power throughout the station.
     """
 
-    def __init__(self, tick_interval: float = 30.0):
+    def __init__(
+        self,
+        tick_interval: float = 30.0,
+        debug: bool = False,
+        recount_interval: int = 100,
+    ):
         """
         Initialize the power system.
 
         Args:
             tick_interval (float): Time between power updates in seconds.
+            debug (bool): Periodically recount grid loads to catch drift.
+            recount_interval (int): Ticks between recounts in debug mode.
         """
         self.tick_interval = tick_interval
+        self.debug = debug
+        self.recount_interval = recount_interval
+        self._ticks = 0
         self.last_tick_time = 0
         self.enabled = False
         self.grids: Dict[str, PowerGrid] = {}
@@ -140,16 +297,62 @@ class PowerSystem:
         self.smes_units: Dict[str, Dict[str, Any]] = {}
         self.consumers: Dict[str, Dict[str, Any]] = {}
         self.room_power_status: Dict[str, bool] = {}
-        self.usage_history: Dict[str, List[float]] = {}
+        self.telemetry = PowerTelemetry()
+        # Running load of the active consumers on each grid
+        self.grid_loads: Dict[str, float] = {}
+        self.room_grids: Dict[str, str] = {}
+        self.network = PowerNetwork()
+        # (powered, load band) per grid and room as last published
+        self.room_load_bands: Dict[str, int] = {}
+        self._grid_state: Dict[str, Tuple[bool, int]] = {}
+        self._grid_rooms: Dict[str, Set[str]] = {}
+        # The same device records grouped by grid, so a grid's devices are
+        # found without scanning every device on the station
+        self._by_grid: Dict[str, Dict[str, Dict[str, Dict[str, Any]]]] = {
+            kind: {} for kind in DEVICE_KINDS
+        }
 
         # Register event handlers
         subscribe("generator_toggle", self.on_generator_toggle)
         subscribe("battery_depleted", self.on_battery_depleted)
         subscribe("solar_panel_efficiency_change", self.on_solar_efficiency_change)
         subscribe("grid_breaker_toggle", self.on_grid_breaker_toggle)
+        subscribe("breaker_toggle", self.on_breaker_toggle)
+        subscribe("apc_toggle", self.on_apc_toggle)
+        subscribe("cable_cut", self.on_cable_cut)
+        subscribe("cable_repaired", self.on_cable_repaired)
+        subscribe("round_end", self.on_round_end)
 
         logger.info("Power system initialized")
 
+    def _add_device(self, kind: str, device_id: str, data: Dict[str, Any]) -> None:
+        """Store ``data`` in the ``kind`` table and its grid index."""
+        self._remove_device(kind, device_id)
+        getattr(self, kind)[device_id] = data
+        self._by_grid[kind].setdefault(data["grid_id"], {})[device_id] = data
+
+    def _remove_device(self, kind: str, device_id: str) -> Optional[Dict[str, Any]]:
+        data = getattr(self, kind).pop(device_id, None)
+        if data is not None:
+            on_grid = self._by_grid[kind].get(data["grid_id"], {})
+            on_grid.pop(device_id, None)
+            if not on_grid:
+                self._by_grid[kind].pop(data["grid_id"], None)
+        return data
+
+    def grid_devices(self, kind: str, grid_id: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the devices of one kind attached to a grid.
+
+        Args:
+            kind (str): One of ``DEVICE_KINDS``, e.g. ``"generators"``.
+            grid_id (str): The ID of the grid.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Device records keyed by device ID.
+        """
+        return self._by_grid[kind].get(grid_id, {})
+
     def register_grid(self, grid: PowerGrid) -> None:
         """
         Register a power grid with the system.
@@ -160,6 +363,7 @@ class PowerSystem:
         self.grids[grid.grid_id] = grid
         for room_id in grid.rooms:
             self.room_power_status[room_id] = grid.is_powered
+            self.room_grids[room_id] = grid.grid_id
         logger.debug(f"Registered power grid {grid.grid_id} ({grid.name})")
 
     def register_generator(
@@ -174,12 +378,16 @@ class PowerSystem:
             capacity (float): The power capacity of this generator.
             is_active (bool): Whether the generator is currently active.
         """
-        self.generators[gen_id] = {
-            "grid_id": grid_id,
-            "capacity": capacity,
-            "is_active": is_active,
-            "fuel_level": 100.0,
-        }
+        self._add_device(
+            "generators",
+            gen_id,
+            {
+                "grid_id": grid_id,
+                "capacity": capacity,
+                "is_active": is_active,
+                "fuel_level": 100.0,
+            },
+        )
 
         # Set the generator as the power source for the grid
         if grid_id in self.grids:
@@ -203,12 +411,16 @@ class PowerSystem:
             capacity (float): The power capacity of this battery.
             charge (float): The current charge level (0-100%).
         """
-        self.batteries[battery_id] = {
-            "grid_id": grid_id,
-            "capacity": capacity,
-            "charge": charge,
-            "is_active": False,
-        }
+        self._add_device(
+            "batteries",
+            battery_id,
+            {
+                "grid_id": grid_id,
+                "capacity": capacity,
+                "charge": charge,
+                "is_active": False,
+            },
+        )
         logger.debug(f"Registered battery {battery_id} for grid {grid_id}")
 
     def register_solar_panel(
@@ -227,11 +439,15 @@ class PowerSystem:
             efficiency (float): The efficiency of the panel (0-100%).
             is_active (bool): Whether the panel is currently active.
         """
-        self.solar_panels[panel_id] = {
-            "grid_id": grid_id,
-            "efficiency": efficiency,
-            "is_active": is_active,
-        }
+        self._add_device(
+            "solar_panels",
+            panel_id,
+            {
+                "grid_id": grid_id,
+                "efficiency": efficiency,
+                "is_active": is_active,
+            },
+        )
         logger.debug(f"Registered solar panel {panel_id} for grid {grid_id}")
 
     def register_smes(
@@ -244,35 +460,87 @@ class PowerSystem:
         output_rate: float = 20.0,
     ) -> None:
         """Register an SMES unit for energy storage."""
-        self.smes_units[smes_id] = {
-            "grid_id": grid_id,
-            "capacity": capacity,
-            "charge": charge,
-            "input_rate": input_rate,
-            "output_rate": output_rate,
-        }
+        self._add_device(
+            "smes_units",
+            smes_id,
+            {
+                "grid_id": grid_id,
+                "capacity": capacity,
+                "charge": charge,
+                "input_rate": input_rate,
+                "output_rate": output_rate,
+            },
+        )
         logger.debug(f"Registered SMES {smes_id} for grid {grid_id}")
 
     def register_consumer(
         self, consumer_id: str, grid_id: str, load: float, active: bool = True
     ) -> None:
         """Register a power consumer device."""
-        self.consumers[consumer_id] = {
-            "grid_id": grid_id,
-            "load": load,
-            "active": active,
-        }
+        self.remove_consumer(consumer_id)
+        self._add_device(
+            "consumers",
+            consumer_id,
+            {
+                "grid_id": grid_id,
+                "load": load,
+                "active": active,
+            },
+        )
+        if active:
+            self._adjust_load(grid_id, load)
 
     def update_consumer_status(self, consumer_id: str, active: bool) -> None:
-        if consumer_id in self.consumers:
-            self.consumers[consumer_id]["active"] = active
+        data = self.consumers.get(consumer_id)
+        if data is None or data["active"] == active:
+            return
+        data["active"] = active
+        self._adjust_load(data["grid_id"], data["load"] if active else -data["load"])
 
     def update_consumer_load(self, consumer_id: str, load: float) -> None:
-        if consumer_id in self.consumers:
-            self.consumers[consumer_id]["load"] = load
+        data = self.consumers.get(consumer_id)
+        if data is None:
+            return
+        old = data["load"]
+        data["load"] = load
+        if data["active"]:
+            self._adjust_load(data["grid_id"], load - old)
 
     def remove_consumer(self, consumer_id: str) -> None:
-        self.consumers.pop(consumer_id, None)
+        data = self._remove_device("consumers", consumer_id)
+        if data is not None and data["active"]:
+            self._adjust_load(data["grid_id"], -data["load"])
+
+    def _adjust_load(self, grid_id: str, delta: float) -> None:
+        if not self.grid_devices("consumers", grid_id):
+            # nothing left to draw power; drop any accumulated rounding
+            self.grid_loads.pop(grid_id, None)
+            return
+        self.grid_loads[grid_id] = self.grid_loads.get(grid_id, 0.0) + delta
+
+    def recount_loads(self) -> Dict[str, float]:
+        """
+        Recompute every grid's load from its consumers.
+
+        The running totals are replaced by the recount.
+
+        Returns:
+            Dict[str, float]: Drift (running minus recounted) for grids
+            whose running total was off.
+        """
+        counted: Dict[str, float] = {}
+        for grid_id, consumers in self._by_grid["consumers"].items():
+            counted[grid_id] = sum(
+                data["load"] for data in consumers.values() if data["active"]
+            )
+        drift = {}
+        for grid_id in set(counted) | set(self.grid_loads):
+            diff = self.grid_loads.get(grid_id, 0.0) - counted.get(grid_id, 0.0)
+            if abs(diff) > 1e-6:
+                drift[grid_id] = diff
+                logger.warning(f"Power load on grid {grid_id} drifted by {diff}")
+        self.grid_loads = counted
+        return drift
 
     def start(self) -> None:
         """
@@ -304,52 +572,35 @@ class PowerSystem:
         self.last_tick_time = current_time
         logger.debug("Processing power update cycle")
 
-        # Update each grid
-        for grid_id, grid in self.grids.items():
+        self._ticks += 1
+        if self.debug and self._ticks % self.recount_interval == 0:
+            self.recount_loads()
+
+        # Generation on each grid, then pooled over the electrical network
+        supply: Dict[str, float] = {}
+        loads: Dict[str, float] = {}
+        for grid_id in self.grids:
             load = self.get_grid_load(grid_id)
+            loads[grid_id] = load
+            supply[grid_id] = self._grid_generation(grid_id, load)
+        available = self.network.balance(supply, loads)
 
-            total_power = 0.0
-
-            for gen_id, gen_data in self.generators.items():
-                if gen_data["grid_id"] == grid_id and gen_data["is_active"]:
-                    if gen_data["fuel_level"] > 0:
-                        gen_data["fuel_level"] -= random.uniform(0.5, 1.5)
-                        gen_data["fuel_level"] = max(0, gen_data["fuel_level"])
-                        if gen_data["fuel_level"] <= 0:
-                            gen_data["is_active"] = False
-                            logger.info(f"Generator {gen_id} ran out of fuel")
-                            publish("generator_out_of_fuel", generator_id=gen_id)
-                        else:
-                            total_power += gen_data["capacity"]
-
-            for panel_id, panel_data in self.solar_panels.items():
-                if panel_data["grid_id"] == grid_id and panel_data["is_active"]:
-                    total_power += panel_data["efficiency"] * 0.5
-
-            # SMES discharge if needed
-            for smes_id, smes in self.smes_units.items():
-                if smes["grid_id"] == grid_id:
-                    if total_power < load and smes["charge"] > 0:
-                        needed = min(
-                            load - total_power, smes["output_rate"], smes["charge"]
-                        )
-                        smes["charge"] -= needed
-                        total_power += needed
-                    elif total_power > load and smes["charge"] < smes["capacity"]:
-                        surplus = min(
-                            total_power - load,
-                            smes["input_rate"],
-                            smes["capacity"] - smes["charge"],
-                        )
-                        smes["charge"] += surplus
-                        total_power -= surplus
+        # Update each grid
+        grid_delta: Dict[str, List[Any]] = {}
+        room_delta: Dict[str, List[Any]] = {}
+        for grid_id, grid in self.grids.items():
+            load = loads[grid_id]
+            total_power = available[grid_id]
 
             grid.capacity = total_power
             grid.update_load(load)
-            hist = self.usage_history.setdefault(grid_id, [])
-            hist.append(grid.current_load)
-            if len(hist) > 20:
-                del hist[0]
+            smes_charge = sum(
+                smes["charge"]
+                for smes in self.grid_devices("smes_units", grid_id).values()
+            )
+            self.telemetry.record(
+                grid_id, current_time, grid.current_load, grid.capacity, smes_charge
+            )
 
             if total_power <= 0:
                 # No power available, check for batteries
@@ -377,16 +628,62 @@ class PowerSystem:
                 # Power is available and grid is not overloaded, restore power
                 grid.power_on()
 
-            # Update room power status for this grid
-            self._update_rooms_for_grid(grid)
-
-            publish(
-                "power_status_update",
-                grid_id=grid_id,
-                is_powered=grid.is_powered,
-                load=grid.current_load,
-                capacity=grid.capacity,
-            )
+            # Only grids whose powered flag or load band moved are sent on
+            band = load_band(grid.current_load)
+            state = (grid.is_powered, band)
+            if self._grid_state.get(grid_id) != state:
+                self._grid_state[grid_id] = state
+                grid_delta[grid_id] = [grid.is_powered, band]
+                publish(
+                    "power_status_update",
+                    grid_id=grid_id,
+                    is_powered=grid.is_powered,
+                    load=grid.current_load,
+                    capacity=grid.capacity,
+                    load_band=band,
+                )
+                room_delta.update(self._update_rooms_for_grid(grid, band))
+            elif self._grid_rooms.get(grid_id) != grid.rooms:
+                room_delta.update(self._update_rooms_for_grid(grid, band))
+
+        if grid_delta or room_delta:
+            publish("power_delta", grids=grid_delta, rooms=room_delta)
+
+    def _grid_generation(self, grid_id: str, load: float) -> float:
+        """Run a grid's generators, solar panels and SMES units for one tick."""
+        total_power = 0.0
+
+        for gen_id, gen_data in self.grid_devices("generators", grid_id).items():
+            if gen_data["is_active"]:
+                if gen_data["fuel_level"] > 0:
+                    gen_data["fuel_level"] -= random.uniform(0.5, 1.5)
+                    gen_data["fuel_level"] = max(0, gen_data["fuel_level"])
+                    if gen_data["fuel_level"] <= 0:
+                        gen_data["is_active"] = False
+                        logger.info(f"Generator {gen_id} ran out of fuel")
+                        publish("generator_out_of_fuel", generator_id=gen_id)
+                    else:
+                        total_power += gen_data["capacity"]
+
+        for panel_data in self.grid_devices("solar_panels", grid_id).values():
+            if panel_data["is_active"]:
+                total_power += panel_data["efficiency"] * 0.5
+
+        # SMES discharge if needed
+        for smes in self.grid_devices("smes_units", grid_id).values():
+            if total_power < load and smes["charge"] > 0:
+                needed = min(load - total_power, smes["output_rate"], smes["charge"])
+                smes["charge"] -= needed
+                total_power += needed
+            elif total_power > load and smes["charge"] < smes["capacity"]:
+                surplus = min(
+                    total_power - load,
+                    smes["input_rate"],
+                    smes["capacity"] - smes["charge"],
+                )
+                smes["charge"] += surplus
+                total_power -= surplus
+        return total_power
 
     def _activate_backup_batteries(self, grid_id: str) -> float:
         """
@@ -400,8 +697,8 @@ class PowerSystem:
         """
         total_battery_power = 0.0
 
-        for battery_id, battery_data in self.batteries.items():
-            if battery_data["grid_id"] == grid_id and battery_data["charge"] > 0:
+        for battery_id, battery_data in self.grid_devices("batteries", grid_id).items():
+            if battery_data["charge"] > 0:
                 if not battery_data["is_active"]:
                     battery_data["is_active"] = True
                     logger.info(f"Battery {battery_id} activated for grid {grid_id}")
@@ -439,9 +736,8 @@ class PowerSystem:
             self.cause_electrical_hazard(grid_id)
 
             # Deactivate power sources
-            for gen_id, gen_data in self.generators.items():
-                if gen_data["grid_id"] == grid_id:
-                    gen_data["is_active"] = False
+            for gen_data in self.grid_devices("generators", grid_id).values():
+                gen_data["is_active"] = False
 
             logger.info(f"Caused power failure in grid {grid_id}")
             publish("manual_power_failure", grid_id=grid_id, duration=duration)
@@ -481,29 +777,20 @@ class PowerSystem:
 
             # Check if there are any other power sources
             has_power = False
-            for gen_id, gen_data in self.generators.items():
-                if (
-                    gen_data["grid_id"] == grid_id
-                    and gen_data["is_active"]
-                    and gen_data["fuel_level"] > 0
-                ):
+            for gen_data in self.grid_devices("generators", grid_id).values():
+                if gen_data["is_active"] and gen_data["fuel_level"] > 0:
                     has_power = True
                     break
 
-            for panel_id, panel_data in self.solar_panels.items():
-                if panel_data["grid_id"] == grid_id and panel_data["is_active"]:
+            for panel_data in self.grid_devices("solar_panels", grid_id).values():
+                if panel_data["is_active"]:
                     has_power = True
                     break
 
             # Check if there are other batteries
             other_batteries = False
-            for b_id, b_data in self.batteries.items():
-                if (
-                    b_id != battery_id
-                    and b_data["grid_id"] == grid_id
-                    and b_data["is_active"]
-                    and b_data["charge"] > 0
-                ):
+            for b_id, b_data in self.grid_devices("batteries", grid_id).items():
+                if b_id != battery_id and b_data["is_active"] and b_data["charge"] > 0:
                     other_batteries = True
                     break
 
@@ -541,23 +828,73 @@ class PowerSystem:
                     grid.power_off()
                 logger.info(f"Grid breaker opened for {grid_id}, power cut")
 
-    def get_grid_load(self, grid_id: str) -> float:
-        return sum(
-            data["load"]
-            for data in self.consumers.values()
-            if data["grid_id"] == grid_id and data["active"]
-        )
+    def add_cable(self, cable_id: str, a: str, b: str) -> None:
+        """Lay a cable between two grids or junctions."""
+        self.network.add_link(cable_id, "cable", a, b)
+
+    def add_apc(
+        self, apc_id: str, grid_id: str, node: str, active: bool = True
+    ) -> None:
+        """Connect a room grid to the network through an APC."""
+        self.network.add_link(apc_id, "apc", grid_id, node, active)
 
-    def _update_rooms_for_grid(self, grid: PowerGrid) -> None:
+    def add_breaker(self, breaker_id: str, a: str, b: str, closed: bool = True) -> None:
+        """Put a breaker between two grids or junctions."""
+        self.network.add_link(breaker_id, "breaker", a, b, closed)
+
+    def _set_link(self, link_id: str, kind: str, conducting: bool) -> None:
+        link = self.network.links.get(link_id)
+        if link is None or link["kind"] != kind:
+            return
+        if self.network.set_conducting(link_id, conducting):
+            state = "connected" if conducting else "disconnected"
+            logger.info(f"Power link {link_id} ({kind}) {state}")
+            publish(
+                "power_network_changed",
+                link_id=link_id,
+                conducting=conducting,
+                version=self.network.version,
+            )
+
+    def on_breaker_toggle(self, breaker_id: str, closed: bool) -> None:
+        """Handle a network breaker being opened or closed."""
+        self._set_link(breaker_id, "breaker", closed)
+
+    def on_apc_toggle(self, apc_id: str, active: bool) -> None:
+        """Handle an APC being switched on or off."""
+        self._set_link(apc_id, "apc", active)
+
+    def on_cable_cut(self, cable_id: str) -> None:
+        self._set_link(cable_id, "cable", False)
+
+    def on_cable_repaired(self, cable_id: str) -> None:
+        self._set_link(cable_id, "cable", True)
+
+    def get_grid_load(self, grid_id: str) -> float:
+        return self.grid_loads.get(grid_id, 0.0)
+
+    def _update_rooms_for_grid(
+        self, grid: PowerGrid, band: int
+    ) -> Dict[str, List[Any]]:
+        """Publish rooms whose power state changed; return their new state."""
+        changes: Dict[str, List[Any]] = {}
+        powered = grid.is_powered
         for room_id in grid.rooms:
+            self.room_grids[room_id] = grid.grid_id
             prev = self.room_power_status.get(room_id)
-            if prev is None or prev != grid.is_powered:
-                self.room_power_status[room_id] = grid.is_powered
+            if prev != powered or self.room_load_bands.get(room_id) != band:
+                self.room_power_status[room_id] = powered
+                self.room_load_bands[room_id] = band
+                changes[room_id] = [powered, band]
                 publish(
                     "room_power_changed",
                     room_id=room_id,
-                    powered=grid.is_powered,
+                    powered=powered,
+                    load_band=band,
+                    was_powered=prev,
                 )
+        self._grid_rooms[grid.grid_id] = set(grid.rooms)
+        return changes
 
     def get_room_power_status(self, room_id: str) -> bool:
         return self.room_power_status.get(room_id, True)
@@ -565,20 +902,29 @@ class PowerSystem:
     def describe_room_power(self, room_id: str) -> str:
         """Return a short text description of power in ``room_id``."""
         powered = self.get_room_power_status(room_id)
-        return (
+        text = (
             f"Power is flowing normally in {room_id}."
             if powered
             else f"{room_id} is without power."
         )
-
-    def get_usage_graph(self, grid_id: str, width: int = 10) -> str:
+        grid_id = self.room_grids.get(room_id)
+        if grid_id is not None:
+            text += f" Grid {grid_id} load: {self.get_grid_load(grid_id):.0f}."
+        return text
+
+    def get_usage_graph(
+        self, grid_id: str, width: int = 10, resolution: str = "tick"
+    ) -> str:
         """Return a simple ASCII graph of recent power usage for a grid."""
-        history = self.usage_history.get(grid_id, [])
-        if not history:
+        points = self.telemetry.history(grid_id, resolution, width, "load")
+        if not len(points):
             return "No data"
-        points = history[-width:]
         return " ".join(f"{int(v):3d}" for v in points)
 
+    def on_round_end(self, **_: Any) -> None:
+        """Close the round's telemetry averages."""
+        self.telemetry.close_round()
+
     def cause_electrical_hazard(self, grid_id: str) -> None:
         if grid_id in self.grids:
             rooms = list(self.grids[grid_id].rooms)
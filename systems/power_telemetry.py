@@ -0,0 +1,151 @@
+"""Power telemetry history for :class:`systems.power.PowerSystem`.
+
+Each grid records load, capacity and SMES charge into fixed-size NumPy ring
+buffers at three resolutions: every tick, averaged per minute and averaged
+per round.  Queries return read-only views of the newest samples, copying at
+most the requested rows when they wrap around the end of the buffer.
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+
+CHANNELS = ("load", "capacity", "smes_charge")
+# Samples kept at each resolution
+RESOLUTIONS = {"tick": 600, "minute": 240, "round": 50}
+MINUTE = 60.0
+
+
+class RingBuffer:
+    """Fixed number of rows of ``channels`` floats, overwriting the oldest."""
+
+    __slots__ = ("data", "head", "count")
+
+    def __init__(self, size: int, channels: int = len(CHANNELS)) -> None:
+        self.data = np.zeros((size, channels))
+        self.head = 0  # next row to write
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, row) -> None:
+        self.data[self.head] = row
+        self.head = (self.head + 1) % len(self.data)
+        self.count = min(self.count + 1, len(self.data))
+
+    def latest(self, n: Optional[int] = None) -> np.ndarray:
+        """Return the newest ``n`` rows (all by default), oldest first."""
+        n = self.count if n is None else max(0, min(n, self.count))
+        first = self.head - n
+        if first >= 0:
+            rows = self.data[first : self.head]
+        elif self.head == 0:
+            rows = self.data[first:]
+        else:
+            rows = np.concatenate([self.data[first:], self.data[: self.head]])
+        rows = rows.view()
+        rows.flags.writeable = False
+        return rows
+
+
+class _Bucket:
+    """Running sum of samples waiting to be averaged into a coarser buffer."""
+
+    __slots__ = ("total", "count", "key")
+
+    def __init__(self) -> None:
+        self.total = np.zeros(len(CHANNELS))
+        self.count = 0
+        self.key: Optional[int] = None
+
+    def flush(self, into: RingBuffer) -> None:
+        if self.count:
+            into.append(self.total / self.count)
+        self.total[:] = 0.0
+        self.count = 0
+
+
+class PowerTelemetry:
+    """Multi-resolution load, capacity and SMES charge history per grid."""
+
+    def __init__(self, sizes: Optional[Dict[str, int]] = None) -> None:
+        self.sizes = dict(RESOLUTIONS, **(sizes or {}))
+        self.buffers: Dict[str, Dict[str, RingBuffer]] = {}
+        self._minute: Dict[str, _Bucket] = {}
+        self._round: Dict[str, _Bucket] = {}
+
+    def _grid(self, grid_id: str) -> Dict[str, RingBuffer]:
+        buffers = self.buffers.get(grid_id)
+        if buffers is None:
+            buffers = {res: RingBuffer(size) for res, size in self.sizes.items()}
+            self.buffers[grid_id] = buffers
+            self._minute[grid_id] = _Bucket()
+            self._round[grid_id] = _Bucket()
+        return buffers
+
+    def record(
+        self,
+        grid_id: str,
+        timestamp: float,
+        load: float,
+        capacity: float,
+        smes_charge: float = 0.0,
+    ) -> None:
+        """Add one tick's sample for ``grid_id``."""
+        buffers = self._grid(grid_id)
+        row = (load, capacity, smes_charge)
+        buffers["tick"].append(row)
+
+        minute = self._minute[grid_id]
+        key = int(timestamp // MINUTE)
+        if minute.key is not None and key != minute.key:
+            minute.flush(buffers["minute"])
+        minute.key = key
+        minute.total += row
+        minute.count += 1
+
+        bucket = self._round[grid_id]
+        bucket.total += row
+        bucket.count += 1
+
+    def close_round(self) -> None:
+        """Average every grid's samples since the last call into one row."""
+        for grid_id, bucket in self._round.items():
+            bucket.flush(self.buffers[grid_id]["round"])
+
+    def history(
+        self,
+        grid_id: str,
+        resolution: str = "tick",
+        count: Optional[int] = None,
+        channel: Optional[str] = None,
+    ) -> np.ndarray:
+        """
+        Return recent samples for a grid, oldest first.
+
+        Args:
+            grid_id (str): The ID of the grid.
+            resolution (str): ``"tick"``, ``"minute"`` or ``"round"``.
+            count (int, optional): Newest samples to return; all if None.
+            channel (str, optional): One of ``CHANNELS`` for a 1-D series;
+                all channels as columns if None.
+
+        Returns:
+            np.ndarray: Read-only samples, empty if the grid has none.
+        """
+        if resolution not in self.sizes:
+            raise ValueError(f"Unknown resolution: {resolution}")
+        buffers = self.buffers.get(grid_id)
+        if buffers is None:
+            rows = np.zeros((0, len(CHANNELS)))
+        else:
+            rows = buffers[resolution].latest(count)
+        if channel is not None:
+            return rows[:, CHANNELS.index(channel)]
+        return rows
+
+    def clear(self) -> None:
+        self.buffers.clear()
+        self._minute.clear()
+        self._round.clear()
@@ -0,0 +1,115 @@
+"""Deterministic regression scenarios for the tile atmosphere integrator."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+import numpy as np
+
+import systems.gas_sim as gs
+
+
+def _spike(size=16, peak=2000.0):
+    # the tile integrator alone; zone merging is covered in test_atmos_sim
+    grid = gs.AtmosGrid(size, size, epsilon=0.01, merge_interval=0)
+    grid.pressure[size // 2, size // 2] = peak
+    grid.wake_all()
+    return grid
+
+
+def _breach():
+    grid = gs.AtmosGrid(12, 4, epsilon=0.01, merge_interval=0)
+    grid.pressure[:6] = 200.0
+    grid.pressure[6:] = 0.0
+    grid.wake_all()
+    return grid
+
+
+def _settle(grid, rate, limit=2000):
+    """Step ``grid`` until it sleeps, checking invariants every tick."""
+    total = grid.total_pressure()
+    oxygen = grid.total_gas("oxygen")
+    low, high = grid.pressure.min(), grid.pressure.max()
+    for ticks in range(limit):
+        if not grid.active_count:
+            return ticks
+        grid.step(rate)
+        assert abs(grid.total_pressure() - total) < 1e-9 * total
+        assert abs(grid.total_gas("oxygen") - oxygen) < 1e-9 * oxygen
+        assert grid.pressure.min() >= low - 1e-9
+        assert grid.pressure.max() <= high + 1e-9
+    raise AssertionError(f"grid still active after {limit} ticks")
+
+
+def test_spike_settles_within_budget():
+    assert _settle(_spike(), 0.25) <= 360
+
+
+def test_large_rate_settles_instead_of_oscillating():
+    assert _settle(_spike(), 0.5) <= 190
+
+
+def test_breach_front_settles_within_budget():
+    assert _settle(_breach(), 0.25) <= 470
+
+
+def test_settling_is_deterministic():
+    a, b = _spike(), _spike()
+    assert _settle(a, 0.5) == _settle(b, 0.5)
+    assert np.array_equal(a.pressure, b.pressure)
+    assert np.array_equal(a.composition, b.composition)
+
+
+def test_steep_gradient_does_not_overshoot():
+    grid = gs.AtmosGrid(2, 1)
+    grid.get_tile(0, 0).gas.pressure = 200.0
+    grid.get_tile(1, 0).gas.pressure = 0.0
+    grid.step(rate=0.9)
+    high, low = grid.pressure[0, 0], grid.pressure[1, 0]
+    assert 100.0 <= high < 200.0
+    assert 0.0 < low <= 100.0
+
+
+def test_decompression_and_pipe_injection_conserve_gas():
+    grid = gs.AtmosGrid(8, 8, epsilon=0.01)
+    grid.get_tile(0, 0).gas.pressure = 900.0
+    grid.explosive_decompress((0, 0), (1, 0))
+    pipes = gs.PipeNetwork(grid)
+    pipes.add_pipe((7, 7), (4, 4), rate=50.0)
+    total = grid.total_pressure()
+    for _ in range(30):
+        pipes.step()
+        grid.step()
+        assert abs(grid.total_pressure() - total) < 1e-9 * total
+        assert (grid.pressure >= 0).all()
+
+
+def _seeded(grid, seed=7):
+    rng = np.random.default_rng(seed)
+    grid.pressure[:] = rng.uniform(0.0, 300.0, grid.pressure.shape)
+    grid.temperature[:] = rng.uniform(-20.0, 80.0, grid.pressure.shape)
+    grid.blocked[:] = rng.random(grid.pressure.shape) < 0.1
+    grid.wake_all()
+    return grid
+
+
+def test_tiled_backend_matches_single_process_bit_for_bit():
+    from systems.gas_parallel import TiledAtmosGrid
+
+    single = _seeded(gs.AtmosGrid(37, 23))
+    with TiledAtmosGrid(37, 23, tiles=(3, 2)) as tiled:
+        _seeded(tiled)
+        for rate in (0.25, 0.6) * 5:
+            single.step(rate)
+            tiled.step(rate)
+        single.get_tile(4, 5).gas.add_gas("plasma", 12.0)
+        tiled.get_tile(4, 5).gas.add_gas("plasma", 12.0)
+        for _ in range(5):
+            single.step()
+            tiled.step()
+
+        assert np.array_equal(single.pressure, tiled.pressure)
+        assert np.array_equal(single.temperature, tiled.temperature)
+        assert np.array_equal(single.composition, tiled.composition)
+        assert np.array_equal(single.active, tiled.active)
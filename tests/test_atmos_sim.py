@@ -4,6 +4,9 @@ import sys
 
 sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
 
+import numpy as np
+import pytest
+
 import systems.gas_sim as gs
 from components.player import PlayerComponent
 from world import GameObject
@@ -29,3 +32,263 @@ def test_player_breathe_affects_room():
     comp.breathe(room_tile)
     assert room_tile.gas.composition["oxygen"] < 21.0
     assert room_tile.gas.composition["co2"] > 0.04
+
+
+def test_step_conserves_gas_amounts():
+    grid = gs.AtmosGrid(6, 5)
+    grid.get_tile(0, 0).gas.pressure = 400.0
+    grid.get_tile(5, 4).gas.pressure = 0.0
+    grid.get_tile(3, 2).gas.composition["plasma"] = 30.0
+    before = grid.total_pressure()
+    oxygen = grid.total_gas("oxygen")
+    plasma = grid.total_gas("plasma")
+    for _ in range(20):
+        grid.step(rate=0.5)
+    assert abs(grid.total_pressure() - before) < 1e-9 * before
+    assert abs(grid.total_gas("oxygen") - oxygen) < 1e-9 * oxygen
+    assert abs(grid.total_gas("plasma") - plasma) < 1e-9 * plasma
+    assert (grid.pressure >= 0).all()
+    assert grid.get_tile(5, 4).gas.composition["plasma"] > 0.0
+
+
+def test_tile_views_write_through_to_arrays():
+    grid = gs.AtmosGrid(3, 3)
+    tile = grid.get_tile(1, 2)
+    assert grid.get_tile(1, 2) is tile
+    assert grid.get_tile(3, 0) is None
+    tile.gas.pressure = 55.0
+    tile.gas.temperature = 300.0
+    tile.gas.add_gas("plasma", 4.0)
+    assert grid.pressure[1, 2] == 55.0
+    assert grid.temperature[1, 2] == 300.0
+    assert grid.composition[grid.gas_index["plasma"], 1, 2] == 4.0
+    copy = tile.gas.copy()
+    assert copy.pressure == 55.0 and copy.composition["plasma"] == 4.0
+    assert len(grid.tiles) == 9 and grid.tiles[(0, 0)].gas.pressure == 101.3
+
+
+def test_pipe_network_moves_gas_between_tiles():
+    grid = gs.AtmosGrid(3, 1)
+    pipes = gs.PipeNetwork(grid)
+    pipes.add_pipe((0, 0), (2, 0), rate=10.0)
+    pipes.step()
+    assert grid.get_tile(0, 0).gas.pressure < 101.3
+    assert grid.get_tile(2, 0).gas.pressure > 101.3
+
+
+def test_quiet_grid_sleeps_and_wakes_locally():
+    grid = gs.AtmosGrid(64, 64)
+    assert grid.active_count == 0
+    grid.step()
+    assert (grid.pressure == 101.3).all()
+
+    grid.get_tile(10, 10).gas.pressure = 200.0
+    assert grid.active_tiles() == [(10, 10)]
+    grid.step()
+    active = grid.active_tiles()
+    assert (10, 10) in active and (11, 10) in active
+    assert all(abs(x - 10) <= 3 and abs(y - 10) <= 3 for x, y in active)
+    assert grid.get_tile(40, 40).gas.pressure == 101.3
+
+    grid = gs.AtmosGrid(8, 8, epsilon=0.01)
+    grid.get_tile(0, 0).gas.pressure = 200.0
+    for _ in range(2000):
+        grid.step(rate=0.2)
+        if not grid.active_count:
+            break
+    assert grid.active_count == 0
+    assert abs(grid.pressure[1:, :] - grid.pressure[:-1, :]).max() <= grid.epsilon
+    assert abs(grid.pressure[:, 1:] - grid.pressure[:, :-1]).max() <= grid.epsilon
+
+
+def _two_rooms():
+    # two 4x4 rooms separated by a wall column at x=4 with a door at (4, 1)
+    grid = gs.AtmosGrid(9, 4)
+    for y in range(4):
+        grid.set_passable(4, y, False)
+    grid.step()
+    return grid
+
+
+def test_walls_block_flow():
+    grid = _two_rooms()
+    grid.get_tile(0, 0).gas.pressure = 300.0
+    for _ in range(50):
+        grid.step()
+    assert grid.get_tile(8, 3).gas.pressure == 101.3
+    assert grid.get_tile(3, 3).gas.pressure > 101.3
+
+
+def test_equalized_rooms_merge_into_zones():
+    grid = _two_rooms()
+    grid.get_tile(6, 2).gas.composition["oxygen"] = 21.0005
+    grid.step()
+    total = grid.total_gas("oxygen")
+    assert grid.merge_zones() == 2
+    left, right = grid.zone_at(0, 0), grid.zone_at(8, 3)
+    assert left is not right and left.size == 16 and right.size == 16
+    assert grid.zone_at(4, 0) is None
+    assert abs(grid.total_gas("oxygen") - total) < 1e-9 * total
+    assert (
+        grid.get_tile(5, 0).gas.composition["oxygen"] == right.gas.composition["oxygen"]
+    )
+
+    # zone-wide edits apply to every tile and keep the enclosed zone merged
+    left.gas.add_gas("plasma", 2.0)
+    grid.step()
+    assert grid.get_tile(3, 3).gas.composition["plasma"] == 2.0
+    assert grid.zone_at(0, 0) is left
+
+
+def test_disturbances_split_zones():
+    grid = _two_rooms()
+    grid.merge_zones()
+    # a gas source in one tile splits only its zone
+    grid.get_tile(1, 1).gas.pressure = 150.0
+    assert grid.zone_at(1, 1) is None
+    right = grid.zone_at(6, 1)
+    assert right is not None
+
+    # opening the door keeps the other zone whole: it takes gas in at its
+    # edge and spreads it evenly, as one cell
+    total = grid.total_pressure()
+    grid.set_passable(4, 1, True)
+    for _ in range(5):
+        grid.step()
+    assert grid.zone_at(6, 1) is right
+    assert right.gas.pressure > 101.3
+    assert (grid.pressure[right.xs, right.ys] == right.gas.pressure).all()
+    assert abs(grid.total_pressure() - total) < 1e-9 * total
+
+
+def test_zone_interiors_are_not_simulated():
+    grid = gs.AtmosGrid(41, 40, merge_interval=0)
+    for y in range(40):
+        grid.set_passable(20, y, False)
+    grid.step()
+    assert grid.merge_zones() == 2
+    left, right = grid.zone_at(0, 0), grid.zone_at(40, 39)
+    right.gas.pressure = 150.0
+    assert grid.active_count == 0
+
+    total = grid.total_pressure()
+    grid.set_passable(20, 5, True)
+    for _ in range(20):
+        grid.step()
+        # only the doorway is ever simulated
+        assert all(abs(x - 20) <= 1 and abs(y - 5) <= 1 for x, y in grid.active_tiles())
+    assert grid.zone_at(0, 0) is left and grid.zone_at(40, 39) is right
+    assert 101.3 < left.gas.pressure < right.gas.pressure < 150.0
+    assert abs(grid.total_pressure() - total) < 1e-9 * total
+
+
+def test_settled_tiles_merge_into_zones_while_stepping():
+    grid = gs.AtmosGrid(8, 8, epsilon=0.01, merge_interval=10)
+    grid.get_tile(0, 0).gas.pressure = 200.0
+    total = grid.total_pressure()
+    for _ in range(400):
+        grid.step()
+    assert grid.zones
+    assert abs(grid.total_pressure() - total) < 1e-9 * total
+
+
+def test_distant_disturbances_are_stepped_in_separate_boxes():
+    grid = gs.AtmosGrid(128, 128, merge_interval=0)
+    grid.get_tile(2, 2).gas.pressure = 200.0
+    grid.get_tile(120, 120).gas.pressure = 200.0
+    boxes = grid._active_boxes()
+    assert sorted((b[0].start, b[0].stop, b[1].start, b[1].stop) for b in boxes) == [
+        (1, 4, 1, 4),
+        (119, 122, 119, 122),
+    ]
+    grid.step()
+    assert grid.pressure[60, 60] == 101.3
+
+    # boxes that would touch are merged, so no edge between them is skipped
+    grid = gs.AtmosGrid(64, 64, merge_interval=0)
+    grid.get_tile(15, 5).gas.pressure = 200.0
+    grid.get_tile(18, 5).gas.pressure = 200.0
+    (box,) = grid._active_boxes()
+    assert (box[0].start, box[0].stop) == (14, 20)
+
+
+def test_composition_behaves_like_a_dict():
+    gs.register_gas("plasma")
+    mixture = gs.GasMixture()
+    assert "plasma" not in mixture.composition
+    assert set(mixture.composition) == {"oxygen", "nitrogen", "co2", "smoke"}
+
+    del mixture.composition["smoke"]
+    assert "smoke" not in mixture.composition
+    with pytest.raises(KeyError):
+        mixture.composition["smoke"]
+    with pytest.raises(KeyError):
+        del mixture.composition["smoke"]
+
+    mixture.composition.clear()
+    assert dict(mixture.composition) == {}
+    mixture.add_gas("plasma", 1.0)
+    assert dict(mixture.composition) == {"plasma": 1.0}
+
+    grid = gs.AtmosGrid(1, 1)
+    tile = grid.get_tile(0, 0).gas
+    tile.composition.clear()
+    assert len(tile.composition) == 0
+    assert tile.composition["oxygen"] == 0.0
+
+
+def test_gas_mixtures_compare_by_value():
+    assert gs.GasMixture() == gs.GasMixture()
+    assert gs.GasMixture() != gs.GasMixture(pressure=50.0)
+    other = gs.GasMixture()
+    other.add_gas("co2", 1.0)
+    assert gs.GasMixture() != other
+    assert gs.GasMixture().copy() == gs.GasMixture()
+
+
+def test_pipe_flows_are_order_independent():
+    def run(order):
+        grid = gs.AtmosGrid(4, 1)
+        grid.get_tile(0, 0).gas.pressure = 6.0
+        grid.get_tile(0, 0).gas.add_gas("plasma", 50.0)
+        pipes = gs.PipeNetwork(grid)
+        for dst, rate in order:
+            pipes.add_pipe((0, 0), dst, rate=rate)
+        pipes.add_pipe((3, 0), (0, 0), rate=4.0)
+        pipes.step()
+        return grid
+
+    a = run([((1, 0), 10.0), ((2, 0), 5.0)])
+    b = run([((2, 0), 5.0), ((1, 0), 10.0)])
+    assert np.array_equal(a.pressure, b.pressure)
+    assert np.array_equal(a.composition, b.composition)
+    # the source is shared 2:1 between its pipes, before the refill arrives
+    assert a.pressure[1, 0] - 101.3 == pytest.approx(4.0)
+    assert a.pressure[2, 0] - 101.3 == pytest.approx(2.0)
+    assert a.pressure[0, 0] == pytest.approx(4.0)
+
+
+def test_manifold_pipes_share_one_mixture():
+    grid = gs.AtmosGrid(6, 1)
+    pipes = gs.PipeNetwork(grid)
+    for inlet in [(0, 0), (1, 0)]:
+        for outlet in [(4, 0), (5, 0)]:
+            pipes.add_pipe(inlet, outlet, rate=5.0, manifold="distro")
+    grid.get_tile(0, 0).gas.add_gas("plasma", 10.0)
+    before = grid.total_pressure()
+    plasma = grid.total_gas("plasma")
+
+    pipes.step()
+    held = pipes.manifold("distro")
+    assert held.pressure == pytest.approx(20.0)
+    assert held.composition["plasma"] > 0.0
+    assert grid.pressure[4, 0] == 101.3
+
+    pipes.step()
+    assert grid.pressure[4, 0] > 101.3
+    assert grid.pressure[4, 0] == grid.pressure[5, 0]
+    held = pipes.manifold("distro")
+    total = grid.total_pressure() + held.pressure
+    assert total == pytest.approx(before)
+    held_plasma = held.composition["plasma"] * held.pressure
+    assert grid.total_gas("plasma") + held_plasma == pytest.approx(plasma)
@@ -0,0 +1,199 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+import world
+from world import GameObject
+from components.room import RoomComponent
+from components.door import DoorComponent
+from events import subscribe, unsubscribe
+from systems.atmos import AtmosphericSystem
+
+
+def _setup_rooms(*room_ids):
+    w = world.get_world()
+    w.objects.clear()
+    w.rooms.clear()
+    for room_id in room_ids:
+        room = GameObject(id=room_id, name=room_id, description="")
+        room.add_component("room", RoomComponent())
+        w.register(room)
+    return w
+
+
+def _collect(event_name):
+    seen = []
+
+    def handler(room_id, **kwargs):
+        seen.append(room_id)
+
+    subscribe(event_name, handler)
+    return seen, handler
+
+
+def test_atmos_updated_only_published_on_change():
+    w = _setup_rooms("a1", "a2")
+    atmos = AtmosphericSystem(tick_interval=0)
+    atmos.start()
+    seen, handler = _collect("atmos_updated")
+    try:
+        atmos.update()
+        assert sorted(seen) == ["a1", "a2"]
+        seen.clear()
+
+        atmos.update()
+        assert seen == []
+
+        atmos.create_leak("a2", rate=1.0)
+        atmos.update()
+        assert seen == ["a2"]
+    finally:
+        unsubscribe("atmos_updated", handler)
+
+
+def test_leaks_indexed_by_room():
+    w = _setup_rooms("b1", "b2")
+    atmos = AtmosphericSystem(tick_interval=0)
+    atmos.create_leak("b1", rate=2.0)
+    atmos.create_leak("b1", rate=1.0)
+    assert len(atmos.leaks) == 2
+    assert list(atmos.leaks_by_room) == ["b1"]
+
+    atmos.start()
+    atmos.update()
+    room = w.rooms["b1"].get_component("room")
+    assert room.atmosphere["pressure"] == 101.3 - 6.0
+    assert w.rooms["b2"].get_component("room").atmosphere["pressure"] == 101.3
+
+    assert atmos.fix_leak("b1")
+    assert not atmos.leaks
+    assert not atmos.fix_leak("b1")
+
+
+def test_hazard_rules_add_and_clear_hazards():
+    w = _setup_rooms("c1")
+    atmos = AtmosphericSystem(tick_interval=0)
+    room = w.rooms["c1"].get_component("room")
+    room.atmosphere.update({"oxygen": 5.0, "pressure": 130.0, "temperature": 90.0})
+    atmos.start()
+    atmos.update()
+    assert set(atmos.get_room_hazards("c1")) == {
+        "low_oxygen",
+        "high_pressure",
+        "extreme_heat",
+    }
+
+    room.atmosphere.update({"oxygen": 21.0, "pressure": 101.3, "temperature": 20.0})
+    atmos.update()
+    assert atmos.get_room_hazards("c1") == []
+
+
+def test_room_atmosphere_reads_through_matrix():
+    w = _setup_rooms("d1", "d2")
+    atmos = AtmosphericSystem(tick_interval=0)
+    atmos.register_vent("d1", output_rate=1.0)
+    room = w.rooms["d1"].get_component("room")
+    room.atmosphere["oxygen"] = 11.0
+    atmos.start()
+    atmos.update()
+
+    row = atmos._row_of["d1"]
+    assert room.atmosphere["oxygen"] == atmos.values[row, atmos.gas_index["oxygen"]]
+    assert room.atmosphere["oxygen"] == 11.0 + (21.0 - 11.0) * 0.1
+
+    room.atmosphere["plasma"] = 3.0
+    assert atmos.values[row, atmos.gas_index["plasma"]] == 3.0
+    assert "plasma" not in w.rooms["d2"].get_component("room").atmosphere
+    assert room.to_dict()["atmosphere"]["plasma"] == 3.0
+
+
+def test_external_hazard_reconciled_next_tick():
+    w = _setup_rooms("e1")
+    atmos = AtmosphericSystem(tick_interval=0)
+    atmos.start()
+    atmos.update()
+
+    room = w.rooms["e1"].get_component("room")
+    room.add_hazard("smoke")
+    room.add_hazard("radiation")
+    atmos.update()
+    assert atmos.get_room_hazards("e1") == ["radiation"]
+
+
+def _corridor():
+    """Rooms f1 - f2 - f3 in a line with a locked door from f2 to f3."""
+    w = world.get_world()
+    w.objects.clear()
+    w.rooms.clear()
+    exits = {
+        "f1": {"east": "f2"},
+        "f2": {"west": "f1", "east": "f3"},
+        "f3": {"west": "f2"},
+    }
+    for room_id, room_exits in exits.items():
+        room = GameObject(id=room_id, name=room_id, description="")
+        room.add_component("room", RoomComponent(exits=room_exits))
+        w.register(room)
+    door = DoorComponent(is_open=False, is_locked=True, destination="f3")
+    w.rooms["f2"].add_component("door", door)
+    return w, door
+
+
+def test_gas_diffuses_through_open_exits_only():
+    w, door = _corridor()
+
+    def pressure(room_id):
+        return w.rooms[room_id].get_component("room").atmosphere["pressure"]
+
+    w.rooms["f1"].get_component("room").atmosphere["pressure"] = 0.0
+    atmos = AtmosphericSystem(tick_interval=0)
+    atmos.start()
+    for _ in range(5):
+        atmos.update()
+
+    assert pressure("f1") > 0.0
+    assert pressure("f2") < 101.3
+    assert pressure("f3") == 101.3
+    assert abs(pressure("f1") + pressure("f2") - 101.3) < 1e-9
+
+    door.open("tester", access_code=10)
+    atmos.update()
+    assert pressure("f3") < 101.3
+
+
+def test_links_rebuilt_only_for_room_or_door_objects():
+    w = _setup_rooms("g1", "g2")
+    atmos = AtmosphericSystem(tick_interval=0)
+    atmos.start()
+    atmos.update()
+    assert not atmos._links_dirty
+
+    w.register(GameObject(id="g_crate", name="crate", description=""))
+    assert not atmos._links_dirty
+
+    hatch = GameObject(id="g_hatch", name="hatch", description="")
+    hatch.add_component("door", DoorComponent(is_open=True, destination="g2"))
+    w.register(hatch)
+    assert atmos._links_dirty
+
+
+def test_atmos_updated_sends_a_snapshot():
+    w = _setup_rooms("h1")
+    atmos = AtmosphericSystem(tick_interval=0)
+    atmos.start()
+    sent = []
+
+    def handler(room_id, atmosphere, **kwargs):
+        sent.append(atmosphere)
+
+    subscribe("atmos_updated", handler)
+    try:
+        atmos.update()
+    finally:
+        unsubscribe("atmos_updated", handler)
+
+    assert type(sent[0]) is dict
+    oxygen = sent[0]["oxygen"]
+    w.rooms["h1"].get_component("room").atmosphere["oxygen"] = oxygen + 5.0
+    assert sent[0]["oxygen"] == oxygen
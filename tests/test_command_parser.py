@@ -0,0 +1,145 @@
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from command_grammar import CommandGrammar
+from command_spec import CommandSpec
+from command_suggestions import SuggestionIndex
+from parser import CommandParser
+
+COMMANDS = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "data", "commands.yaml"
+)
+
+
+def _loaded():
+    parser = CommandParser(COMMANDS)
+    parser.load_commands()
+    return parser
+
+
+def _first_match(specs, text):
+    """Reference dispatch: try every spec in order."""
+    for spec in specs:
+        params = spec.match(text)
+        if params is not None:
+            return spec.name, params
+    return None
+
+
+def _dispatched(parser, text):
+    """Name of the spec ``dispatch`` resolves ``text`` to, if any."""
+    result = parser.dispatch(text, {})
+    prefix, _, rest = result.partition("Command '")
+    if prefix or not rest.endswith("' is not implemented yet."):
+        return None
+    return rest[: -len("' is not implemented yet.")]
+
+
+def test_dispatch_agrees_with_linear_scan_on_every_pattern():
+    parser = _loaded()
+    inputs = ["", "xyzzy", "LOOK", "Go North", "look at the red box"]
+    for spec in parser.command_specs:
+        for pattern in spec.patterns:
+            inputs.append(re.sub(r"\{\w+\}", "red box", pattern))
+            inputs.append(re.sub(r"\{\w+\}", "x", pattern).upper())
+    for text in inputs:
+        expected = _first_match(parser.command_specs, text)
+        compiled = parser.grammar.match(text)
+        if compiled is not None:
+            compiled = (compiled[0].name, compiled[1])
+        assert compiled == expected, text
+        if expected is not None and not text.lower().startswith("help"):
+            assert _dispatched(parser, text) == expected[0], text
+
+
+def test_dispatch_only_compiles_the_first_word_group():
+    parser = _loaded()
+    assert _dispatched(parser, "n") == "move"
+    assert "n" in parser.grammar._matchers
+    branches = parser.grammar._matchers["n"].pattern.count("(?P<_b")
+    total = sum(len(spec.patterns) for spec in parser.command_specs)
+    assert branches < total // 10
+
+
+def test_dispatch_tries_patterns_opening_with_a_parameter(tmp_path):
+    commands = tmp_path / "commands.yaml"
+    commands.write_text(
+        "- name: shout\n"
+        "  patterns: ['shout {msg}']\n"
+        "- name: emote\n"
+        "  patterns: ['{msg}!']\n"
+        "- name: say\n"
+        "  patterns: ['say {msg}', \"'{msg}\"]\n"
+    )
+    parser = CommandParser(str(commands))
+    parser.load_commands()
+    assert _dispatched(parser, "shout hi") == "shout"
+    assert _dispatched(parser, "shout hi!") == "shout"
+    assert _dispatched(parser, "wave!") == "emote"
+    assert _dispatched(parser, "'hello") == "say"
+    assert parser.grammar.match("wave!")[1] == {"msg": "wave"}
+    assert parser.grammar.match("'hello")[1] == {"msg": "hello"}
+
+
+def test_grammar_reports_shadowed_and_ambiguous_patterns():
+    specs = [
+        CommandSpec("get", ["take {item}"], ""),
+        CommandSpec("remove", ["take off {item}"], ""),
+        CommandSpec("look", ["look {target}"], ""),
+        CommandSpec("read", ["look at sign", "read {target}"], ""),
+        CommandSpec("search", ["look in {container}"], ""),
+        CommandSpec("emote", ["{action} loudly"], ""),
+    ]
+    found = {
+        (c.kind, c.pattern, c.earlier_pattern) for c in CommandGrammar(specs).conflicts
+    }
+    assert found == {
+        ("shadowed", "take off {item}", "take {item}"),
+        ("shadowed", "look at sign", "look {target}"),
+        ("shadowed", "look in {container}", "look {target}"),
+        ("ambiguous", "{action} loudly", "take {item}"),
+        ("ambiguous", "{action} loudly", "take off {item}"),
+        ("ambiguous", "{action} loudly", "look {target}"),
+        ("ambiguous", "{action} loudly", "look in {container}"),
+        ("ambiguous", "{action} loudly", "read {target}"),
+    }
+
+
+def test_grammar_matches_in_one_call_with_lazy_parameters():
+    grammar = CommandGrammar(
+        [
+            CommandSpec("put", ["put {item} in {container}"], ""),
+            CommandSpec("say", ["say {message}"], ""),
+        ]
+    )
+    spec, params = grammar.match("PUT red box in crate in hold")
+    assert spec.name == "put"
+    assert params == {"item": "red box", "container": "crate in hold"}
+    assert grammar.match("say") is None
+    assert grammar.match("dance") is None
+
+
+def test_suggestion_index_ranks_typos_and_completes_prefixes():
+    index = SuggestionIndex(["look", "Take", "talk", "inventory", "lock", "take"])
+    assert index.words == ["inventory", "lock", "look", "take", "talk"]
+    assert index.suggest("tkae") == ["take"]
+    assert index.suggest("lok") == ["look", "lock"]
+    assert index.suggest("inventroy") == ["inventory"]
+    assert index.suggest("lok", n=1) == ["look"]
+    assert index.suggest("xyzzy") == []
+    assert index.complete("T") == ["take", "talk"]
+    assert index.complete("lo", n=1) == ["lock"]
+    assert index.complete("z") == []
+
+
+def test_parser_suggests_command_words_and_names():
+    parser = _loaded()
+    assert parser.dispatch("exmaine crate", {}) == (
+        "Unknown command 'exmaine'. Did you mean: examine?"
+    )
+    assert "Did you mean: inventory" in parser.get_help("inventroy")
+    assert "examine" in parser.complete("exa")
+    assert parser.complete("ex", 1) == parser.complete("ex")[:1]
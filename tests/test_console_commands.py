@@ -35,8 +35,9 @@ def test_secconsole_alerts():
 
 def test_engconsole_usage():
     ps = get_power_system()
-    ps.usage_history.clear()
-    ps.usage_history["g1"] = [10, 20, 30]
+    ps.telemetry.clear()
+    for t, load in enumerate([10, 20, 30]):
+        ps.telemetry.record("g1", t, load, 100.0)
     ps.grids["g1"] = PowerGrid("g1", "Alpha")
     result = engconsole_handler("test", action="usage", target="g1")
     assert "10" in result and "30" in result
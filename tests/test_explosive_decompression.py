@@ -23,3 +23,62 @@ def test_hull_breach_system_decompresses_between_tiles():
     diff = hb.breach((0, 0), (1, 0))
     assert diff == 60.0
     assert abs(t1.gas.pressure - t2.gas.pressure) < 0.01
+
+
+def _compartments():
+    """10x5 grid split by a wall at x=5, with a door tile at (5, 2)."""
+    grid = gs.AtmosGrid(10, 5)
+    for y in range(5):
+        grid.set_passable(5, y, False)
+    return grid
+
+
+def _breach_left(hb):
+    """Breach (0, 0) into the wall tile at (5, 0), emptied to act as space."""
+    hb.grid.pressure[5, 0] = 0.0
+    assert hb.breach((0, 0), (5, 0)) > 0
+
+
+def test_breach_without_pressure_difference_does_not_vent():
+    grid = _compartments()
+    hb = HullBreachSystem(grid)
+    assert hb.breach((0, 0), (1, 0)) == 0.0
+    assert not hb.vents
+    hb.update()
+    assert (grid.pressure[:5] == 101.3).all()
+
+
+def test_breach_vents_connected_compartment_over_ticks():
+    grid = _compartments()
+    hb = HullBreachSystem(grid)
+    _breach_left(hb)
+    vent = hb.vents[(0, 0)]
+    assert vent.region.sum() == 25
+
+    hb.update()
+    # the wave needs several ticks to reach the far corner
+    assert grid.pressure[4, 4] == 101.3
+    assert grid.pressure[0, 0] < 101.3
+    assert (vent.throw <= 0).all() and vent.throw.any()
+
+    for _ in range(40):
+        hb.update()
+    assert not hb.vents
+    assert grid.pressure[:5].max() < 2.0
+    assert (grid.pressure[6:] == 101.3).all()
+
+
+def test_breach_reuses_connectivity_until_door_opens():
+    grid = _compartments()
+    labels = grid.regions()
+    assert grid.regions() is labels
+    assert labels[0, 0] != labels[9, 0]
+
+    hb = HullBreachSystem(grid)
+    _breach_left(hb)
+    hb.update()
+    grid.set_passable(5, 2, True)
+    assert grid.regions() is not labels
+    for _ in range(60):
+        hb.update()
+    assert grid.pressure[9, 4] < 101.3
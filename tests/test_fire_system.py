@@ -1,4 +1,5 @@
 import systems.gas_sim as gs
+from events import subscribe, unsubscribe
 from systems.fire import FireSystem
 
 
@@ -22,4 +23,34 @@ def test_fire_propagates_to_adjacent_tiles():
     tile1.gas.composition["oxygen"] = 10.0
     fire.ignite(0, 0, fuel=4, temperature=200.0)
     fire.step()
-    assert any(src.tile is tile1 for src in fire.fires)
+    assert fire.fires[(1, 0)].tile is tile1
+    assert fire.is_burning(1, 0)
+
+
+def test_fire_events_are_coalesced_per_tick():
+    grid = gs.AtmosGrid(5, 5)
+    fire = FireSystem(grid)
+    seen = []
+
+    def on_spread(tiles, **_):
+        seen.append(sorted(tiles))
+
+    subscribe("fire_spread", on_spread)
+    try:
+        fire.ignite(2, 2, fuel=8, temperature=200.0)
+        fire.step()
+    finally:
+        unsubscribe("fire_spread", on_spread)
+    assert seen == [[(1, 2), (2, 1), (2, 3), (3, 2)]]
+    # the centre used up its oxygen and went out in the same tick
+    assert len(fire) == 4 and not fire.is_burning(2, 2)
+
+
+def test_fire_burns_out_without_oxygen():
+    grid = gs.AtmosGrid(3, 1)
+    fire = FireSystem(grid)
+    grid.get_tile(1, 0).gas.composition["oxygen"] = 0.5
+    fire.ignite(1, 0, fuel=1)
+    fire.step()
+    assert not fire.is_burning(1, 0)
+    assert fire.fires == {}
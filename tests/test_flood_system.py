@@ -1,5 +1,16 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+import world
 from systems.flood import FloodSystem
+from systems.plumbing import get_plumbing_system
+from components.door import DoorComponent
+from components.fluid import FluidContainerComponent
 from components.player import PlayerComponent
+from components.room import RoomComponent
+from events import subscribe, unsubscribe
 from world import GameObject
 
 
@@ -16,3 +27,71 @@ def test_flood_affects_player_movement_speed():
     flood.remove_water("room1", 1.0)
     flood.affect_player(comp, "room1")
     assert comp.move_speed == 1.0
+
+
+def _station():
+    """Rooms m1 - m2 - m3 - m4 in a line with a closed door from m3 to m4."""
+    w = world.get_world()
+    w.objects.clear()
+    w.rooms.clear()
+    ids = ["m1", "m2", "m3", "m4"]
+    for i, room_id in enumerate(ids):
+        exits = {}
+        if i:
+            exits["west"] = ids[i - 1]
+        if i < len(ids) - 1:
+            exits["east"] = ids[i + 1]
+        room = GameObject(id=room_id, name=room_id, description="")
+        room.add_component("room", RoomComponent(exits=exits))
+        w.register(room)
+    door = DoorComponent(is_open=False, destination="m4")
+    w.rooms["m3"].add_component("door", door)
+    return w, door
+
+
+def test_burst_pipe_floods_neighbours_through_open_exits():
+    w, door = _station()
+    flood = FloodSystem(w)
+    spread = []
+
+    def on_spread(rooms, **kw):
+        spread.extend(rooms)
+
+    subscribe("flood_spread", on_spread)
+    try:
+        flood.burst_pipe("m1", 0.2)
+        for _ in range(20):
+            flood.step()
+    finally:
+        unsubscribe("flood_spread", on_spread)
+
+    assert flood.get_level("m1") > flood.get_level("m2") > flood.get_level("m3") > 0
+    assert flood.get_level("m4") == 0.0
+    assert spread[:2] == ["m2", "m3"]
+
+    door.is_open = True
+    flood.on_connectivity_changed()
+    flood.step()
+    assert flood.get_level("m4") > 0
+
+
+def test_flow_conserves_water_and_drain_fills_plumbing():
+    w, _door = _station()
+    flood = FloodSystem(w)
+    flood.add_water("m1", 1.0)
+    for _ in range(30):
+        flood.step()
+    assert abs(sum(flood.levels.values()) - 1.0) < 1e-9
+    assert abs(flood.get_level("m1") - flood.get_level("m3")) < 0.05
+
+    tank = FluidContainerComponent(capacity=1000.0)
+    get_plumbing_system().register_device("tank", tank)
+    try:
+        flood.add_drain("m2", rate=0.1, device_id="tank")
+        for _ in range(200):
+            flood.step()
+    finally:
+        get_plumbing_system().unregister_device("tank")
+    assert not flood.levels
+    # the last traces below DRY_LEVEL evaporate rather than drain
+    assert 99.0 < tank.contents["water"] <= 100.0
@@ -7,7 +7,12 @@ from world import World, GameObject, get_world
 from components.room import RoomComponent
 from components.door import DoorComponent
 from components.npc import NPCComponent
-from pathfinding import find_path
+from pathfinding import (
+    HierarchicalPathfinder,
+    RoutingTable,
+    find_path,
+    get_routing_table,
+)
 
 
 def build_world():
@@ -65,3 +70,135 @@ def test_npc_movement_along_path():
     assert npc.location == "d"
     npc_comp.step()
     assert npc.location == "c"
+
+
+def test_routing_table_matches_bfs_and_reacts_to_doors():
+    w, door = build_world()
+    table = RoutingTable()
+    assert table.path("a", "c") == ["a", "d", "c"]
+    assert table.next_hop("a", "c") == "d"
+    assert table.distance("a", "c") == 2
+
+    assert table.path("a", "b") == []
+
+    # unlocking and opening the door publishes events that refresh the tree
+    door.open("tester", access_code=10)
+    assert table.path("a", "b") == ["a", "b"]
+    assert table.path("a", "c") == ["a", "d", "c"]
+
+    # closing it again is noticed even without an event
+    door.is_open = False
+    assert table.next_hop("a", "b") is None
+
+
+def test_routing_table_only_drops_affected_trees():
+    w, door = build_world()
+    table = RoutingTable()
+    table.next_hop("a", "c")
+    table.next_hop("a", "d")
+    table.next_hop("a", "b")
+    version = table.version
+
+    # opening a->b only creates a shorter route to b
+    door.is_locked = False
+    door.is_open = True
+    assert table.invalidate_edge("a", "b") == 1
+    assert table.version == version + 1
+    assert table.distance("a", "b") == 1
+    assert table.distance("a", "c") == 2
+
+    w.get_object("d").get_component("room").remove_exit("east")
+    door.is_open = False
+    assert table.path("a", "c") == []
+
+
+def test_npc_routine_uses_routing_table():
+    w, door = build_world()
+    npc = GameObject(id="r", name="NPC", description="", location="a")
+    npc_comp = NPCComponent(routine=["c", "a"])
+    npc.add_component("npc", npc_comp)
+    w.register(npc)
+
+    npc_comp.step()
+    npc_comp.step()
+    assert npc.location == "c"
+    assert npc_comp.goal is None
+
+
+def test_npc_system_shares_flow_field():
+    from systems.npc_ai import NPCSystem
+
+    w, door = build_world()
+    table = get_routing_table()
+    system = NPCSystem()
+    for idx in range(5):
+        npc = GameObject(id=f"crowd{idx}", name="NPC", description="", location="a")
+        npc.add_component("npc", NPCComponent())
+        w.register(npc)
+        system.register(npc.id)
+
+    assert system.converge("c") == 5
+    flow = table.flow_field("c")
+    system.update()
+    assert table.flow_field("c") is flow
+    assert all(w.get_object(f"crowd{i}").location == "d" for i in range(5))
+    system.update()
+    assert all(w.get_object(f"crowd{i}").location == "c" for i in range(5))
+
+
+def build_zoned_grid(size=8, zone_size=4):
+    w = get_world()
+    w.objects.clear()
+    w.rooms.clear()
+    for x in range(size):
+        for y in range(size):
+            exits = {}
+            if x + 1 < size:
+                exits["east"] = f"r{x + 1}_{y}"
+            if x > 0:
+                exits["west"] = f"r{x - 1}_{y}"
+            if y + 1 < size:
+                exits["south"] = f"r{x}_{y + 1}"
+            if y > 0:
+                exits["north"] = f"r{x}_{y - 1}"
+            room = GameObject(id=f"r{x}_{y}", name=f"Room {x},{y}", description="")
+            zone = f"z{x // zone_size}{y // zone_size}"
+            room.add_component("room", RoomComponent(exits=exits, zone=zone))
+            w.register(room)
+    return w
+
+
+def test_hierarchical_path_matches_flat_bfs():
+    w = build_zoned_grid()
+    finder = HierarchicalPathfinder()
+    rooms = sorted(w.rooms)
+    for start in rooms[::5]:
+        for goal in rooms[::3]:
+            route = finder.find_path(start, goal)
+            assert route[0] == start and route[-1] == goal
+            assert len(route) == len(find_path(w, start, goal))
+            for a, b in zip(route, route[1:]):
+                assert b in w.rooms[a].get_component("room").exits.values()
+    assert len(finder.zones) == 4
+
+
+def test_hierarchical_door_rebuilds_only_its_zone():
+    w = build_zoned_grid()
+    door = DoorComponent(is_open=True, destination="r4_0")
+    w.get_object("r3_0").add_component("door", door)
+    finder = HierarchicalPathfinder()
+    assert len(finder.find_path("r0_0", "r7_0")) == 8
+    rebuilds = finder.rebuilds
+
+    door.close("tester")
+    route = finder.find_path("r0_0", "r7_0")
+    assert finder.rebuilds == rebuilds + 1
+    assert "r4_0" not in route[:5]
+    assert len(route) == len(find_path(w, "r0_0", "r7_0"))
+
+
+def test_rooms_without_zone_are_clustered():
+    w, door = build_world()
+    finder = HierarchicalPathfinder(cluster_size=2)
+    assert finder.find_path("a", "c") == ["a", "d", "c"]
+    assert len(finder.zones) == 2
@@ -1,6 +1,8 @@
 import os
 import sys
 
+import pytest
+
 sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
 
 from engine import MudEngine
@@ -19,3 +21,184 @@ def test_command_performance(benchmark, tmp_path):
         engine.process_command("1", "look")
 
     benchmark(run)
+
+
+def _breached_grid(size):
+    from systems.gas_sim import AtmosGrid
+
+    grid = AtmosGrid(size, size)
+    grid.pressure[size // 2, size // 2] = 5000.0
+    grid.pressure[0, :] = 0.0
+    grid.wake_all()
+    return grid
+
+
+def test_atmos_grid_step_256(benchmark):
+    grid = _breached_grid(256)
+    total = grid.total_pressure()
+    benchmark(grid.step)
+    assert abs(grid.total_pressure() - total) < 1e-9 * total
+
+
+def test_atmos_grid_step_1024(benchmark):
+    grid = _breached_grid(1024)
+    total = grid.total_pressure()
+    benchmark.pedantic(grid.step, rounds=3, iterations=1)
+    assert abs(grid.total_pressure() - total) < 1e-9 * total
+
+
+def test_atmos_system_tick_5000_rooms(benchmark):
+    import world
+    from world import GameObject
+    from components.room import RoomComponent
+    from systems.atmos import AtmosphericSystem
+
+    w = world.get_world()
+    w.objects.clear()
+    w.rooms.clear()
+    for i in range(5000):
+        room = GameObject(id=f"bench_{i}", name="Room", description="")
+        exits = {"east": f"bench_{i + 1}"} if i < 4999 else {}
+        room.add_component("room", RoomComponent(exits=exits))
+        w.register(room)
+    atmos = AtmosphericSystem(tick_interval=0)
+    for i in range(0, 5000, 2):
+        atmos.register_vent(f"bench_{i}")
+    for i in range(0, 5000, 50):
+        atmos.create_leak(f"bench_{i}", rate=0.5)
+    atmos.start()
+    atmos.update()
+    benchmark(atmos.update)
+
+
+@pytest.mark.parametrize("workers", [1, 2, 4])
+def test_atmos_tiled_step_512(benchmark, workers):
+    from systems.gas_parallel import TiledAtmosGrid
+
+    with TiledAtmosGrid(512, 512, workers=workers) as grid:
+        grid.pressure[256, 256] = 5000.0
+        grid.pressure[0, :] = 0.0
+        grid.wake_all()
+        total = grid.total_pressure()
+        benchmark.pedantic(grid.step, rounds=3, iterations=1)
+        assert abs(grid.total_pressure() - total) < 1e-9 * total
+
+
+def test_pipe_network_step_10000_pipes(benchmark):
+    from systems.gas_sim import AtmosGrid, PipeNetwork
+
+    grid = AtmosGrid(128, 128)
+    pipes = PipeNetwork(grid)
+    for i in range(10000):
+        x, y = divmod(i, 128)
+        manifold = f"m{i // 100}" if i % 2 else None
+        pipes.add_pipe((x % 128, y), ((x + 7) % 128, (y * 3) % 128), 1.0, manifold)
+    total = grid.total_pressure()
+    benchmark(pipes.step)
+    held = pipes.manifold_pressure.sum()
+    assert abs(grid.total_pressure() + held - total) < 1e-9 * total
+
+
+def test_fire_step_large_fire(benchmark):
+    from systems.gas_sim import AtmosGrid
+    from systems.fire import FireSystem
+
+    fires = []
+
+    def setup():
+        grid = AtmosGrid(256, 256)
+        grid.composition[grid.gas_index["oxygen"]] = 60.0
+        fire = FireSystem(grid)
+        for x in range(0, 256, 2):
+            for y in range(0, 256, 4):
+                fire.ignite(x, y, fuel=50.0, temperature=400.0)
+        fires.append(fire)
+        return (), {}
+
+    benchmark.pedantic(lambda: fires[-1].step(), setup=setup, rounds=3)
+    assert len(fires[-1]) > 8192
+
+
+def test_flood_step_5000_rooms(benchmark):
+    import world
+    from world import GameObject
+    from components.room import RoomComponent
+    from systems.flood import FloodSystem
+
+    w = world.get_world()
+    w.objects.clear()
+    w.rooms.clear()
+    for i in range(5000):
+        exits = {}
+        if i:
+            exits["west"] = f"flood_{i - 1}"
+        if i < 4999:
+            exits["east"] = f"flood_{i + 1}"
+        room = GameObject(id=f"flood_{i}", name="Room", description="")
+        room.add_component("room", RoomComponent(exits=exits))
+        w.register(room)
+    flood = FloodSystem(w)
+    flood.burst_pipe("flood_2500", 0.5)
+    flood.step()
+    benchmark(flood.step)
+    # only the flooded stretch of the station is ever touched
+    assert 1 < len(flood.levels) < 5000
+
+
+def test_power_update_100_grids_5000_consumers(benchmark):
+    from systems.power import PowerGrid, PowerSystem
+
+    ps = PowerSystem(tick_interval=0)
+    for g in range(100):
+        grid = PowerGrid(f"grid_{g}", "Grid")
+        grid.add_room(f"room_{g}")
+        ps.register_grid(grid)
+        ps.register_generator(f"gen_{g}", f"grid_{g}", capacity=1e6)
+        ps.register_solar_panel(f"solar_{g}", f"grid_{g}")
+        ps.register_smes(f"smes_{g}", f"grid_{g}")
+    for c in range(5000):
+        ps.register_consumer(f"consumer_{c}", f"grid_{c % 100}", 1.0)
+    ps.start()
+    benchmark(ps.update)
+    assert ps.get_grid_load("grid_0") == 50.0
+
+
+def test_parser_dispatch_full_command_set(benchmark):
+    from parser import CommandParser
+
+    parser = CommandParser(
+        os.path.join(
+            os.path.dirname(os.path.dirname(__file__)), "data", "commands.yaml"
+        )
+    )
+    parser.load_commands()
+    # the first pattern of every command, early and late listed alike
+    inputs = [
+        spec.patterns[0].replace("{", "").replace("}", "")
+        for spec in parser.command_specs
+        if spec.patterns
+    ]
+
+    def run():
+        return [parser.dispatch(text, {}) for text in inputs]
+
+    results = benchmark(run)
+    assert not any(r.startswith("Unknown command") for r in results)
+
+
+def test_parser_suggestions_for_typos(benchmark):
+    from parser import CommandParser
+
+    parser = CommandParser(
+        os.path.join(
+            os.path.dirname(os.path.dirname(__file__)), "data", "commands.yaml"
+        )
+    )
+    parser.load_commands()
+    typos = ["lok", "tkae", "inventroy", "exmaine", "engconsoel", "xyzzy"]
+
+    def run():
+        return [parser.word_index.suggest(word) for word in typos]
+
+    results = benchmark(run)
+    assert results[2] == ["inventory"]
@@ -1,6 +1,6 @@
 from components.structure import StructureComponent
 from world import GameObject, get_world
-from systems.physics import get_physics_system
+from systems.physics import CASCADE_BUDGET, get_physics_system
 
 
 def test_environment_damage():
@@ -12,3 +12,89 @@ def test_environment_damage():
 
     get_physics_system().apply_environment("w1", pressure=80.0, temperature=600.0)
     assert comp.integrity < 100
+
+
+def _wall_row(prefix, count, integrity=5, y=40):
+    world = get_world()
+    comps = []
+    for x in range(count):
+        wall = GameObject(
+            id=f"{prefix}{x}", name="Wall", description="", position=(x, y)
+        )
+        comp = StructureComponent(kind="wall", integrity=integrity)
+        wall.add_component("structure", comp)
+        world.register(wall)
+        comps.append(comp)
+    return comps
+
+
+def test_cascade_is_queued_and_budgeted():
+    physics = get_physics_system()
+    physics.budget = 4
+    try:
+        comps = _wall_row("cascade", 30)
+        comps[0].damage(100)
+        # nothing happens inside the event handler itself
+        assert comps[1].integrity == 5
+
+        ticks = 0
+        while physics.pending:
+            assert physics.propagate() <= 4
+            ticks += 1
+        assert all(c.integrity == 0 for c in comps)
+        assert ticks >= 30 // 4
+    finally:
+        physics.budget = CASCADE_BUDGET
+
+
+def test_cascade_damage_is_summed_per_tile():
+    physics = get_physics_system()
+    left, middle, right = _wall_row("sum", 3, integrity=10, y=41)
+    hits = []
+    middle.damage = lambda amount: hits.append(amount) or False
+    left.integrity = right.integrity = 1
+    left.damage(1)
+    right.damage(1)
+    physics.propagate()
+    assert hits == [10]
+
+
+def test_grid_environment_is_checked_in_one_batch():
+    from systems.gas_sim import AtmosGrid
+
+    comps = _wall_row("env", 4, integrity=100, y=42)
+    grid = AtmosGrid(8, 48)
+    grid.pressure[1, 42] = 300.0
+    grid.temperature[2, 42] = 1100.0
+    assert get_physics_system().apply_grid_environment(grid) == 2
+    assert [c.integrity for c in comps] == [100, 50, 90, 100]
+
+
+def test_server_update_loop_drives_collapse():
+    import asyncio
+
+    from system_loops import run_update_loop
+
+    physics = get_physics_system()
+    physics.tick_interval = 0.0
+    comps = _wall_row("loop", 3, y=43)
+
+    async def run():
+        task = asyncio.create_task(run_update_loop(get_physics_system, interval=0.001))
+        comps[0].damage(100)
+        for _ in range(200):
+            await asyncio.sleep(0.001)
+            if all(c.integrity == 0 for c in comps):
+                break
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    try:
+        asyncio.run(run())
+        assert all(c.integrity == 0 for c in comps)
+        assert not physics.enabled
+    finally:
+        physics.tick_interval = 1.0
@@ -49,3 +49,194 @@ def test_smes_discharges_when_needed(monkeypatch):
 
     assert grid.is_powered is True
     assert ps.smes_units["s1"]["charge"] < 50
+
+
+def test_devices_are_indexed_by_grid():
+    ps = PowerSystem(tick_interval=0)
+    for grid_id in ("a", "b"):
+        ps.register_grid(PowerGrid(grid_id, grid_id))
+    ps.register_generator("gen_a", "a", capacity=100)
+    ps.register_consumer("lamp", "a", 10)
+    ps.register_consumer("fridge", "a", 30)
+    ps.register_consumer("pump", "b", 20)
+    assert set(ps.grid_devices("consumers", "a")) == {"lamp", "fridge"}
+    assert ps.get_grid_load("a") == 40
+
+    # re-registering moves the consumer to its new grid
+    ps.register_consumer("fridge", "b", 30)
+    assert ps.get_grid_load("a") == 10
+    assert ps.get_grid_load("b") == 50
+
+    ps.remove_consumer("pump")
+    ps.update_consumer_status("fridge", False)
+    assert ps.get_grid_load("b") == 0
+    assert ps.grid_devices("consumers", "b") == {"fridge": ps.consumers["fridge"]}
+
+    ps.start()
+    ps.update()
+    assert ps.grids["a"].is_powered and not ps.grids["b"].is_powered
+
+
+def test_grid_load_is_kept_incrementally():
+    ps = PowerSystem(tick_interval=0, debug=True, recount_interval=2)
+    grid = PowerGrid("g", "Grid")
+    grid.add_room("bridge")
+    ps.register_grid(grid)
+    ps.register_generator("gen", "g", capacity=1000)
+    ps.register_consumer("a", "g", 10)
+    ps.register_consumer("b", "g", 5, active=False)
+    assert ps.grid_loads == {"g": 10}
+
+    ps.update_consumer_status("b", True)
+    ps.update_consumer_status("b", True)
+    ps.update_consumer_load("a", 25)
+    assert ps.get_grid_load("g") == 30
+    assert "load: 30" in ps.describe_room_power("bridge")
+
+    ps.remove_consumer("a")
+    ps.remove_consumer("b")
+    assert ps.get_grid_load("g") == 0.0
+    assert ps.recount_loads() == {}
+
+    # edits that bypass the API are caught by the debug recount
+    ps.register_consumer("c", "g", 7)
+    ps.consumers["c"]["load"] = 9
+    ps.start()
+    ps.update()
+    assert ps.get_grid_load("g") == 7
+    ps.update()
+    assert ps.get_grid_load("g") == 9
+
+
+def test_network_components_share_supply():
+    from events import publish
+
+    ps = PowerSystem(tick_interval=0)
+    for grid_id in ("engine", "main", "medbay"):
+        grid = PowerGrid(grid_id, grid_id)
+        grid.add_room(f"{grid_id}_room")
+        ps.register_grid(grid)
+    ps.register_generator("gen", "engine", capacity=100)
+    ps.register_consumer("scanner", "medbay", 30)
+    ps.add_cable("c1", "engine", "main")
+    ps.add_breaker("b1", "main", "medbay")
+    assert ps.network.connected("engine", "medbay")
+
+    ps.start()
+    ps.update()
+    assert ps.grids["medbay"].is_powered
+    assert ps.grids["medbay"].capacity == 100
+
+    publish("breaker_toggle", breaker_id="b1", closed=False)
+    assert not ps.network.connected("engine", "medbay")
+    ps.update()
+    assert not ps.grids["medbay"].is_powered
+    assert ps.grids["main"].is_powered
+
+    publish("breaker_toggle", breaker_id="b1", closed=True)
+    publish("cable_cut", cable_id="c1")
+    assert ps.network.connected("main", "medbay")
+    assert not ps.network.connected("engine", "main")
+    publish("cable_repaired", cable_id="c1")
+    ps.update()
+    assert ps.grids["medbay"].is_powered
+
+
+def test_network_balance_marks_overdrawn_component():
+    from systems.power import PowerNetwork
+
+    net = PowerNetwork()
+    net.add_link("c", "cable", "a", "b")
+    available = net.balance({"a": 50.0, "b": 0.0, "c": 5.0}, {"a": 20.0, "b": 40.0})
+    # a and b share 50 for a demand of 60
+    assert available == {"a": 10.0, "b": 30.0, "c": 5.0}
+
+
+def test_only_changed_rooms_are_published():
+    from events import subscribe, unsubscribe
+
+    ps = PowerSystem(tick_interval=0)
+    grid = PowerGrid("d", "Grid")
+    grid.add_room("lab")
+    grid.add_room("hall")
+    ps.register_grid(grid)
+    ps.register_generator("gen", "d", capacity=1000)
+    ps.register_consumer("centrifuge", "d", 10)
+
+    deltas, rooms, statuses = [], [], []
+
+    def on_delta(grids, rooms, **_):
+        deltas.append((grids, rooms))
+
+    def on_room(room_id, **kw):
+        rooms.append(room_id)
+
+    def on_status(grid_id, **kw):
+        statuses.append(grid_id)
+
+    subscribe("power_delta", on_delta)
+    subscribe("room_power_changed", on_room)
+    subscribe("power_status_update", on_status)
+    try:
+        ps.start()
+        ps.update()
+        assert deltas == [({"d": [True, 0]}, {"lab": [True, 0], "hall": [True, 0]})]
+        ps.update()
+        ps.update()
+        assert len(deltas) == 1 and statuses == ["d"]
+
+        # crossing a load band is sent, for every room on the grid
+        ps.update_consumer_load("centrifuge", 60)
+        ps.update()
+        assert deltas[-1] == ({"d": [True, 2]}, {"lab": [True, 2], "hall": [True, 2]})
+
+        # a newly wired room is sent without the grid changing
+        grid.add_room("dock")
+        ps.update()
+        assert deltas[-1] == ({}, {"dock": [True, 2]})
+        assert rooms.count("lab") == 2
+    finally:
+        unsubscribe("power_delta", on_delta)
+        unsubscribe("room_power_changed", on_room)
+        unsubscribe("power_status_update", on_status)
+
+
+def test_telemetry_ring_buffers_downsample():
+    from systems.power_telemetry import PowerTelemetry
+
+    tel = PowerTelemetry(sizes={"tick": 5, "minute": 3, "round": 2})
+    for t in range(150):
+        tel.record("g", float(t), load=t % 60, capacity=100.0, smes_charge=1.0)
+
+    ticks = tel.history("g", "tick", channel="load")
+    assert ticks.tolist() == [25, 26, 27, 28, 29]
+    assert not ticks.flags.writeable
+    assert tel.history("g", "tick", 2).shape == (2, 3)
+
+    # two full minutes averaged; the third is still open
+    minutes = tel.history("g", "minute")
+    assert minutes[:, 0].tolist() == [29.5, 29.5]
+    assert minutes[:, 2].tolist() == [1.0, 1.0]
+
+    tel.close_round()
+    tel.record("g", 200.0, load=10, capacity=50.0)
+    tel.close_round()
+    rounds = tel.history("g", "round", channel="capacity")
+    assert rounds.tolist() == [100.0, 50.0]
+    assert len(tel.history("missing", "round")) == 0
+
+
+def test_power_update_records_telemetry():
+    ps = PowerSystem(tick_interval=0)
+    ps.register_grid(PowerGrid("t", "Grid"))
+    ps.register_generator("gen", "t", capacity=80)
+    ps.register_smes("smes", "t", capacity=100, charge=10)
+    ps.register_consumer("lamp", "t", 20)
+    ps.start()
+    for _ in range(3):
+        ps.update()
+    history = ps.telemetry.history("t")
+    assert history.shape == (3, 3)
+    assert (history[:, 0] == 20).all()
+    assert history[-1, 2] > 10
+    assert ps.get_usage_graph("t") == " 20  20  20"
@@ -0,0 +1,100 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from world import GameObject, get_world
+from components.room import RoomComponent
+from components.door import DoorComponent
+from commands.movement import sprint_handler
+
+
+class FakeInterface:
+    def __init__(self, location):
+        self.location = location
+        self.world = {"rooms": {}}
+        self.player_inventories = {}
+        self.energy = []
+
+    def get_player_stats(self, cid):
+        return {"energy": 100}
+
+    def get_player_location(self, cid):
+        return self.location
+
+    def set_player_location(self, cid, room_id):
+        self.location = room_id
+
+    def get_exits_from_room(self, room_id):
+        return dict(get_world().rooms[room_id].get_component("room").exits)
+
+    def modify_player_stat(self, cid, stat, amount):
+        self.energy.append(amount)
+
+    def _look(self, cid):
+        return f"You are in {self.location}."
+
+
+def build_corridor():
+    w = get_world()
+    w.objects.clear()
+    w.rooms.clear()
+    w.items.clear()
+    w.npcs.clear()
+
+    rooms = []
+    for room_id, exits in (
+        ("sa", {"east": "sb"}),
+        ("sb", {"east": "sc", "west": "sa"}),
+        ("sc", {"east": "sd", "west": "sb"}),
+        ("sd", {"west": "sc"}),
+    ):
+        room = GameObject(id=room_id, name=room_id.upper(), description="")
+        room.add_component("room", RoomComponent(exits=exits))
+        rooms.append(room)
+    door = DoorComponent(is_open=True, is_locked=False, destination="sb")
+    rooms[0].add_component("door", door)
+    for room in rooms:
+        w.register(room)
+    return door
+
+
+def test_sprint_toward_room_moves_two_rooms():
+    build_corridor()
+    interface = FakeInterface("sa")
+    result = sprint_handler("1", "SD", interface=interface)
+    assert result == "You sprint toward SD!\n\nYou are in sc."
+    assert interface.location == "sc"
+    assert interface.energy == [-1, -1, -5]
+
+
+def test_sprint_toward_room_behind_closed_door():
+    door = build_corridor()
+    door.is_open = False
+    interface = FakeInterface("sa")
+    result = sprint_handler("1", "sd", interface=interface)
+    assert result == "You can't find a way there from here."
+    assert interface.location == "sa"
+    assert interface.energy == []
+
+
+def test_sprint_toward_room_stops_on_failed_step():
+    build_corridor()
+    interface = FakeInterface("sa")
+    interface.world["rooms"]["sb"] = {"requires": {"keycard": "You need a keycard."}}
+    assert sprint_handler("1", "sd", interface=interface) == "You need a keycard."
+    assert interface.location == "sa"
+    assert interface.energy == []
+
+    interface.world["rooms"] = {"sc": {"requires": {"keycard": "You need a keycard."}}}
+    result = sprint_handler("1", "sd", interface=interface)
+    assert result == "You sprint toward SD but come to a stop.\n\nYou are in sb."
+    assert interface.energy == [-1]
+
+
+def test_sprint_toward_unknown_target():
+    build_corridor()
+    interface = FakeInterface("sa")
+    result = sprint_handler("1", "bridge", interface=interface)
+    assert result == "'bridge' is not a valid direction."
+    assert interface.location == "sa"
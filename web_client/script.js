@@ -34,6 +34,7 @@ document.addEventListener('DOMContentLoaded', function() {
     let doorStates = {};
     let hazardStates = {};
     let powerStates = {};
+    let powerUsage = {};
     let inventoryData = null;
     let selectedItemId = null;
     let selectedRoomId = null;
@@ -106,6 +107,7 @@ document.addEventListener('DOMContentLoaded', function() {
                         doorStates = data.doors || {};
                         hazardStates = data.hazards || {};
                         powerStates = data.power || {};
+                        powerUsage = data.power_usage || {};
                         data.rooms.forEach(r => {
                             roomPositions[r.id] = { x: r.x, y: r.y, name: r.name };
                         });
@@ -124,6 +126,13 @@ document.addEventListener('DOMContentLoaded', function() {
                     } else if (data.type === 'power_status') {
                         powerStates[data.grid_id] = data.is_powered;
                         renderMap();
+                    } else if (data.type === 'power_delta') {
+                        Object.entries(data.rooms || {}).forEach(([roomId, state]) => {
+                            powerStates[roomId] = state[0];
+                        });
+                        renderMap();
+                    } else if (data.type === 'completions') {
+                        applyCompletions(data.prefix, data.matches || []);
                     } else {
                         appendToTerminal(data.message || 'Unknown message type: ' + data.type);
                     }
@@ -261,9 +270,32 @@ document.addEventListener('DOMContentLoaded', function() {
             }
         }
         mapContainer.appendChild(grid);
+        renderPowerUsage();
         feather.replace();
     }
 
+    function renderPowerUsage() {
+        // One sparkline per grid of its per-minute load history
+        const width = 120, height = 24;
+        Object.entries(powerUsage).forEach(([gridId, samples]) => {
+            if (!samples || samples.length === 0) return;
+            const row = document.createElement('div');
+            row.className = 'power-usage';
+            const peak = Math.max(...samples, 1);
+            const step = samples.length > 1 ? width / (samples.length - 1) : 0;
+            const points = samples.map((load, i) =>
+                `${(i * step).toFixed(1)},${(height - (load / peak) * height).toFixed(1)}`
+            ).join(' ');
+            const latest = samples[samples.length - 1];
+            row.innerHTML =
+                `<span class="power-usage-label">${gridId}</span>` +
+                `<svg width="${width}" height="${height}"><polyline points="${points}"/></svg>` +
+                `<span class="power-usage-value">${latest.toFixed(1)}</span>`;
+            row.title = `${gridId}: load over the last ${samples.length} minutes`;
+            mapContainer.appendChild(row);
+        });
+    }
+
     function handleMapClick(roomId) {
         selectedRoomId = roomId;
         let msg = roomPositions[roomId].name;
@@ -286,6 +318,39 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     }
 
+    function requestCompletions() {
+        const prefix = commandInput.value;
+        // Only the command word is completed
+        if (prefix === '' || /\s/.test(prefix)) {
+            return;
+        }
+        if (webSocket && webSocket.readyState === WebSocket.OPEN) {
+            webSocket.send(JSON.stringify({ type: 'complete_request', prefix: prefix }));
+        }
+    }
+
+    function applyCompletions(prefix, matches) {
+        // Ignore stale replies if the player kept typing
+        if (commandInput.value !== prefix || matches.length === 0) {
+            return;
+        }
+        if (matches.length === 1) {
+            commandInput.value = matches[0] + ' ';
+            return;
+        }
+        let common = matches[0];
+        matches.forEach(m => {
+            while (!m.startsWith(common)) {
+                common = common.slice(0, -1);
+            }
+        });
+        if (common.length > prefix.length) {
+            commandInput.value = common;
+        } else {
+            appendToTerminal(matches.join('  '), 'system-message');
+        }
+    }
+
     function requestInventory() {
         if (webSocket && webSocket.readyState === WebSocket.OPEN) {
             webSocket.send(JSON.stringify({ type: 'inventory_request' }));
@@ -381,6 +446,9 @@ document.addEventListener('DOMContentLoaded', function() {
     commandInput.addEventListener('keydown', function(event) {
         if (event.key === 'Enter') {
             sendCommand();
+        } else if (event.key === 'Tab') {
+            requestCompletions();
+            event.preventDefault();
         } else if (event.key === 'ArrowUp') {
             // Navigate up through history
             if (commandHistory.length > 0) {